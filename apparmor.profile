@@ -24,6 +24,10 @@ profile archey4 /usr/{,local/}bin/archey{,4} {
 	owner @{HOME}/.config/archey4/*.json r,
 	/etc/archey4/*.json r,
 
+	# cache files
+	owner @{HOME}/.cache/archey4/ rw,
+	owner @{HOME}/.cache/archey4/** rw,
+
 	# required in order to kill sub-processes in timeout
 	capability kill,
 	signal (send),
@@ -65,6 +69,10 @@ profile archey4 /usr/{,local/}bin/archey{,4} {
 	# [Hostname] entry
 	/etc/hostname r,
 
+	# [LAN IP] entry
+	network netlink raw,  # rtnetlink (RTM_GETADDR)
+	@{PROC}/@{pid}/net/{route,ipv6_route} r,
+
 	# [Load Average] entry
 	@{PROC}/loadavg r,
 
@@ -97,6 +105,8 @@ profile archey4 /usr/{,local/}bin/archey{,4} {
 	/{,usr/}bin/free rix,
 
 	# [Temperature] entry
+	@{sys}/class/hwmon/ r,
+	@{sys}/devices/**/hwmon/hwmon[0-9]*/{name,temp[0-9]*_{input,label}} r,
 	@{sys}/devices/thermal/thermal_zone[0-9]*/temp r,
 	/{,usr/}bin/sensors PUx,
 	/{,opt/vc/,usr/}bin/vcgencmd PUx,
@@ -109,7 +119,8 @@ profile archey4 /usr/{,local/}bin/archey{,4} {
 	/{,usr/}bin/getent rix,
 
 	# [WAN IP] entry (and potentially [Kernel])
-	/{,usr/}bin/dig PUx,
+	network inet dgram,  # DNS (UDP/IP)
+	network inet6 dgram,  # DNS (UDP/IPv6)
 	network inet stream,  # urllib (HTTP/IP)
 	network inet6 stream,  # urllib (HTTP/IPv6)
 
@@ -8,75 +8,27 @@ Logos are stored under the `logos` module.
 
 import argparse
 import logging
+import multiprocessing
 import os
 import sys
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import ExitStack
-from enum import Enum
-from typing import Callable, Optional
+from typing import Callable, List, Optional
 
 from archey._version import __version__
+from archey.api import API
 from archey.configuration import Configuration
 from archey.distributions import Distributions
-from archey.entries.cpu import CPU as e_CPU
-from archey.entries.custom import Custom as e_Custom
-from archey.entries.desktop_environment import DesktopEnvironment as e_DesktopEnvironment
-from archey.entries.disk import Disk as e_Disk
-from archey.entries.distro import Distro as e_Distro
-from archey.entries.gpu import GPU as e_GPU
-from archey.entries.hostname import Hostname as e_Hostname
-from archey.entries.kernel import Kernel as e_Kernel
-from archey.entries.lan_ip import LanIP as e_LanIP
-from archey.entries.load_average import LoadAverage as e_LoadAverage
-from archey.entries.model import Model as e_Model
-from archey.entries.packages import Packages as e_Packages
-from archey.entries.processes import Processes as e_Processes
-from archey.entries.ram import RAM as e_RAM
-from archey.entries.shell import Shell as e_Shell
-from archey.entries.temperature import Temperature as e_Temperature
-from archey.entries.terminal import Terminal as e_Terminal
-from archey.entries.uptime import Uptime as e_Uptime
-from archey.entries.user import User as e_User
-from archey.entries.wan_ip import WanIP as e_WanIP
-from archey.entries.window_manager import WindowManager as e_WindowManager
 from archey.entry import Entry
 from archey.environment import Environment
+from archey.logos import load_logo, render_logo
+from archey.memory_profiler import MemoryProfiler
 from archey.output import Output
-from archey.processes import Processes
+from archey.render import Renderer, iter_documents
+from archey.scheduler import Entries, plan_entries, run_entries
 from archey.screenshot import take_screenshot
 
 
-class Entries(Enum):
-    """
-    An enumeration to store and declare each one of our entries.
-    The string representation of keys will act as entries names.
-    Values will be set under the `value` attribute of each obtained objects.
-    """
-
-    # pylint: disable=invalid-name
-    User = e_User
-    Hostname = e_Hostname
-    Model = e_Model
-    Distro = e_Distro
-    Kernel = e_Kernel
-    Uptime = e_Uptime
-    LoadAverage = e_LoadAverage
-    Processes = e_Processes
-    WindowManager = e_WindowManager
-    DesktopEnvironment = e_DesktopEnvironment
-    Shell = e_Shell
-    Terminal = e_Terminal
-    Packages = e_Packages
-    Temperature = e_Temperature
-    CPU = e_CPU
-    GPU = e_GPU
-    RAM = e_RAM
-    Disk = e_Disk
-    LAN_IP = e_LanIP
-    WAN_IP = e_WanIP
-    Custom = e_Custom
-
-
 def args_parsing() -> argparse.Namespace:
     """Simple wrapper to `argparse`"""
     parser = argparse.ArgumentParser(prog="archey")
@@ -93,6 +45,14 @@ def args_parsing() -> argparse.Namespace:
         choices=Distributions.get_identifiers(),
         help="supported distribution identifier to show the logo of, pass `unknown` to list them",
     )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=("text", "json", "ndjson", "msgpack", "prometheus"),
+        help="output format, `ndjson` streams each entry as its own JSON line as soon as it "
+        "completes, followed by a final meta-data line, `msgpack` is the binary equivalent of "
+        "`json`, `prometheus` exposes numeric entries values as gauges",
+    )
     parser.add_argument(
         "-j",
         "--json",
@@ -108,6 +68,19 @@ def args_parsing() -> argparse.Namespace:
         "'none' to completely hide distribution logo. "
         "Full list of styles : https://github.com/HorlogeSkynet/archey4/wiki/List-of-logos",
     )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="report peak memory usage and top allocators of each entry on standard error "
+        "(entries are then loaded sequentially)",
+    )
+    parser.add_argument(
+        "--render-from",
+        metavar="PATH",
+        nargs="+",
+        help="render previously captured JSON outputs instead of the local system, pass `-` to "
+        "read them (e.g. NDJSON) from standard input",
+    )
     parser.add_argument(
         "-s",
         "--screenshot",
@@ -122,7 +95,82 @@ def args_parsing() -> argparse.Namespace:
         action="version",
         version=__version__,
     )
-    return parser.parse_args()
+    args = parser.parse_args()
+
+    if args.json and args.format not in (None, "json"):
+        parser.error(f"argument -j/--json: not allowed with format {args.format}")
+    if args.format == "json":
+        # `--format json` is an alias of `-j`.
+        args.json = args.json or 1
+
+    if args.render_from and (args.json or args.format not in (None, "text")):
+        parser.error("argument --render-from: only allowed with text format")
+    if args.render_from and args.profile_memory:
+        parser.error("argument --profile-memory: not allowed with argument --render-from")
+
+    return args
+
+
+def print_ndjson_entry(index: int, entry: Entry, elapsed: float) -> None:
+    """Print (and flush) `entry` NDJSON line"""
+    print(API.ndjson_entry_serialization(entry, elapsed, index), flush=True)
+
+
+def render_documents(args: argparse.Namespace) -> None:
+    """Render each JSON document found in `args.render_from` files, in order"""
+    renderer = Renderer(
+        preferred_logo_style=args.logo_style,
+        preferred_distribution=args.distribution,
+    )
+
+    for path in args.render_from:
+        try:
+            with ExitStack() as exit_stack:
+                # Standard input is not ours to close.
+                f_documents = (
+                    sys.stdin
+                    if path == "-"
+                    else exit_stack.enter_context(open(path, encoding="utf-8"))
+                )
+                for document in iter_documents(f_documents):
+                    renderer.render(document)
+                    # Documents may be streamed, render them as they come.
+                    sys.stdout.flush()
+        except OSError as error:
+            logging.error("Could not read %s (%s).", path, error)
+        except ValueError as error:
+            logging.error("Could not parse %s as JSON (%s).", path, error)
+
+
+def output_entries(args: argparse.Namespace, entries: List[Entry]) -> None:
+    """Output loaded `entries`, in `args` format"""
+    if args.format == "ndjson":
+        print(API(entries).ndjson_meta_serialization(), flush=True)
+    elif args.format == "msgpack":
+        # Encoded chunks are written as they come.
+        sys.stdout.buffer.writelines(API(entries).msgpack_serialization())
+        sys.stdout.buffer.flush()
+    elif args.format == "prometheus":
+        sys.stdout.writelines(API(entries).prometheus_serialization())
+    else:
+        # Output is set up afterwards, so it benefits from (possibly) warmed up distribution
+        #   detection.
+        output = Output(
+            preferred_logo_style=args.logo_style,
+            preferred_distribution=args.distribution,
+            format_to_json=args.json,
+            logo_cache=True,
+        )
+
+        for entry in entries:
+            output.add_entry(entry)
+
+        output.output()
+
+        # Logo data is not needed anymore (e.g. while a screenshot is being taken), memoized one
+        #  is dropped too.
+        load_logo.cache_clear()
+        render_logo.cache_clear()
 
 
 def main():
@@ -133,9 +181,12 @@ def main():
     logging.basicConfig(format="%(levelname)s: [%(name)s] %(message)s")
 
     # Populate our internal singletons once and for all.
-    Processes()
     Environment()
-    configuration = Configuration(config_path=args.config_path)
+    configuration = Configuration(config_path=args.config_path, compiled_cache=True)
+
+    if args.render_from:
+        render_documents(args)
+        return
 
     # From configuration, gather the entries user-configured.
     available_entries = configuration.get("entries")
@@ -147,47 +198,71 @@ def main():
             if entry_name != Entries.Custom.name
         ]
 
-    output = Output(
-        preferred_logo_style=args.logo_style,
-        preferred_distribution=args.distribution,
-        format_to_json=args.json,
+    # Only the work actually required by enabled entries is run.
+    planned_entries, prerequisites = plan_entries(available_entries)
+
+    # With NDJSON format, each entry line is streamed as soon as it completes, so consumers
+    #   don't wait on slow ones.
+    on_entry_completed: Optional[Callable[[int, Entry, float], None]] = (
+        print_ndjson_entry if args.format == "ndjson" else None
     )
 
-    # We will map this function onto our enabled entries to instantiate them.
-    def _entry_instantiator(entry: dict) -> Optional[Entry]:
-        # Based on **required** `type` field, instantiate the corresponding `Entry` object.
-        try:
-            return Entries[entry.pop("type")].value(
-                name=entry.pop("name", None),  # `name` is fully-optional.
-                options=entry,  # Remaining fields should be propagated as options.
-            )
-        except KeyError as key_error:
-            logging.warning("One entry (misses or) uses an invalid `type` field (%s).", key_error)
-            return None
+    # Allocations can only be attributed to entries when they are loaded one after the other.
+    memory_profiler = None
+    if args.profile_memory:
+        memory_profiler = MemoryProfiler()
+        on_entry_completed = memory_profiler.track(on_entry_completed)
 
     # Let's use a context manager stack to manage conditional use of `TheadPoolExecutor`.
     with ExitStack() as cm_stack:
-        mapper: Callable
-
-        if not configuration.get("parallel_loading"):
-            mapper = map
-        else:
+        executor = None
+        if configuration.get("parallel_loading") and memory_profiler is None:
             # Instantiate a threads pool to load our enabled entries in parallel.
             # We use threads (and not processes) since most work done by our entries is IO-bound.
             # `max_workers` is manually computed to mimic Python 3.8+ behaviour, but for our needs.
             #   See <https://github.com/python/cpython/pull/13618>.
             executor = cm_stack.enter_context(
                 ThreadPoolExecutor(  # pylint: disable=consider-using-with
-                    max_workers=min(len(available_entries) or 1, (os.cpu_count() or 1) + 4)
+                    max_workers=min(
+                        (len(planned_entries) + len(prerequisites)) or 1, (os.cpu_count() or 1) + 4
+                    )
+                )
+            )
+
+        process_executor = None
+        processes_count = sum(entry.get("executor") == "process" for _, entry in planned_entries)
+        if executor is not None and processes_count and sys.version_info < (3, 7):
+            # `ProcessPoolExecutor` can't be given a context nor an initializer before Python 3.7.
+            logging.warning(
+                "Worker processes require Python 3.7+, loading entries in threads instead."
+            )
+        elif executor is not None and processes_count:
+            # Entries may be hinted to run in worker processes, when their work is CPU-bound.
+            # Workers are forked from a clean server process (when available), and load the same
+            #   configuration.
+            process_executor = cm_stack.enter_context(
+                ProcessPoolExecutor(  # pylint: disable=consider-using-with
+                    max_workers=min(processes_count, os.cpu_count() or 1),
+                    mp_context=multiprocessing.get_context(
+                        "forkserver"
+                        if "forkserver" in multiprocessing.get_all_start_methods()
+                        else None
+                    ),
+                    initializer=Configuration,
+                    initargs=(args.config_path,),
                 )
             )
-            mapper = executor.map
 
-        for entry_instance in mapper(_entry_instantiator, available_entries):
-            if entry_instance is not None:
-                output.add_entry(entry_instance)
+        entries_instances = run_entries(
+            planned_entries, prerequisites, executor, process_executor, on_entry_completed
+        )
+
+    entries = [entry_instance for entry_instance in entries_instances if entry_instance is not None]
+
+    output_entries(args, entries)
 
-    output.output()
+    if memory_profiler is not None:
+        memory_profiler.report()
 
     # Has the screenshot flag been specified ?
     if args.screenshot is not None:
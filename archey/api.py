@@ -1,19 +1,184 @@
 """Archey API module"""
 
 import json
+import struct
+from contextlib import suppress
 from datetime import datetime
-from typing import Sequence
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Sequence, Tuple
 
 from archey._version import __version__
 from archey.distributions import Distributions
 from archey.entry import Entry
+from archey.record import Record
 from archey.utility import Utility
 
+if TYPE_CHECKING:
+    # Entries modules are only imported when they are enabled (see `archey.scheduler`).
+    from archey.entries.ram import RAMValue
+    from archey.entries.uptime import UptimeValue
+
+# (Prometheus) samples, as labels and value pairs.
+Samples = Iterator[Tuple[Dict[str, str], float]]
+
+# Factors of units used by entries values, to express them in bytes.
+BYTES_UNITS_FACTORS = {"B": 1, "KiB": 1024, "MiB": 1024**2, "GiB": 1024**3, "TiB": 1024**4}
+
+
+def _ram_samples(field: str) -> Callable[["RAMValue"], Samples]:
+    def _samples(value: "RAMValue") -> Samples:
+        yield {}, getattr(value, field) * BYTES_UNITS_FACTORS[value.unit]
+
+    return _samples
+
+
+def _disk_samples(field: str) -> Callable[[dict], Samples]:
+    def _samples(value: dict) -> Samples:
+        for mount_point, filesystem in value.items():
+            # `df` blocks are 1024-byte long.
+            yield (
+                {"mountpoint": mount_point, "device": filesystem["device_path"]},
+                filesystem[field] * 1024,
+            )
+
+    return _samples
+
+
+def _load_average_samples(index: int) -> Callable[[Sequence[float]], Samples]:
+    def _samples(value: Sequence[float]) -> Samples:
+        yield {}, value[index]
+
+    return _samples
+
+
+def _temperature_samples(field: str) -> Callable[[dict], Samples]:
+    def _samples(value: dict) -> Samples:
+        temperature = value[field]
+        if value["unit"] == "F":
+            temperature = (temperature - 32) * 5 / 9
+        yield {}, round(temperature, 2)
+
+    return _samples
+
+
+def _uptime_samples(value: "UptimeValue") -> Samples:
+    yield {}, ((value.days * 24 + value.hours) * 60 + value.minutes) * 60 + value.seconds
+
+
+def _packages_samples(value: dict) -> Samples:
+    for pkg_tool_name, count in value.items():
+        yield {"tool": pkg_tool_name}, count
+
+
+def _processes_samples(value: int) -> Samples:
+    yield {}, value
+
+
+# Prometheus gauges, as (metric name, help text, entry class name, samples getter) tuples.
+PROMETHEUS_GAUGES: Tuple[Tuple[str, str, str, Callable[..., Samples]], ...] = (
+    ("archey_ram_used_bytes", "Used RAM.", "RAM", _ram_samples("used")),
+    ("archey_ram_total_bytes", "Total RAM.", "RAM", _ram_samples("total")),
+    ("archey_disk_used_bytes", "Used filesystem space.", "Disk", _disk_samples("used_blocks")),
+    ("archey_disk_total_bytes", "Filesystem size.", "Disk", _disk_samples("total_blocks")),
+    ("archey_load1", "1-minute load average.", "LoadAverage", _load_average_samples(0)),
+    ("archey_load5", "5-minutes load average.", "LoadAverage", _load_average_samples(1)),
+    ("archey_load15", "15-minutes load average.", "LoadAverage", _load_average_samples(2)),
+    (
+        "archey_temperature_celsius",
+        "Average temperature.",
+        "Temperature",
+        _temperature_samples("temperature"),
+    ),
+    (
+        "archey_temperature_max_celsius",
+        "Maximum temperature.",
+        "Temperature",
+        _temperature_samples("max_temperature"),
+    ),
+    ("archey_uptime_seconds", "System uptime.", "Uptime", _uptime_samples),
+    ("archey_packages", "Installed packages.", "Packages", _packages_samples),
+    ("archey_processes", "Running processes.", "Processes", _processes_samples),
+)
+
+
+def _json_default(value):
+    """Serialize entries values records (other types are not serializable)"""
+    if isinstance(value, Record):
+        return value.as_dict()
+
+    raise TypeError(f"Object of type {value.__class__.__name__} is not JSON serializable")
+
+
+def _escape_label_value(label_value: str) -> str:
+    return label_value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _msgpack_header(size: int, fix_prefix: int, fix_limit: int, prefixes: bytes) -> bytes:
+    """Return a MessagePack length header, `prefixes` being its 8, 16 and 32-bit variants"""
+    if size < fix_limit:
+        return bytes((fix_prefix | size,))
+    if size <= 0xFF and prefixes[0]:
+        return bytes((prefixes[0], size))
+    if size <= 0xFFFF:
+        return struct.pack(">BH", prefixes[1], size)
+    return struct.pack(">BI", prefixes[2], size)
+
+
+def _msgpack_int(value: int) -> bytes:
+    if -32 <= value < 128:
+        # Positive and negative "fixint" formats.
+        return struct.pack(">b", value)
+
+    if value >= 0:
+        formats = ((0xCC, ">B"), (0xCD, ">H"), (0xCE, ">I"), (0xCF, ">Q"))
+    else:
+        formats = ((0xD0, ">b"), (0xD1, ">h"), (0xD2, ">i"), (0xD3, ">q"))
+
+    # Pick the smallest format `value` fits in.
+    for prefix, struct_format in formats:
+        with suppress(struct.error):
+            return bytes((prefix,)) + struct.pack(struct_format, value)
+
+    raise TypeError(f"Integer {value} is too large to be serialized")
+
+
+def _iter_msgpack(value) -> Iterator[bytes]:
+    """Yield MessagePack encoded chunks of `value` (JSON-serializable types only)"""
+    if value is None:
+        yield b"\xc0"
+    elif isinstance(value, bool):
+        yield b"\xc3" if value else b"\xc2"
+    elif isinstance(value, int):
+        yield _msgpack_int(value)
+    elif isinstance(value, float):
+        yield b"\xcb" + struct.pack(">d", value)
+    elif isinstance(value, str):
+        encoded_value = value.encode("utf-8")
+        yield _msgpack_header(len(encoded_value), 0xA0, 32, b"\xd9\xda\xdb")
+        yield encoded_value
+    elif isinstance(value, (list, tuple)):
+        yield _msgpack_header(len(value), 0x90, 16, b"\x00\xdc\xdd")
+        for item in value:
+            yield from _iter_msgpack(item)
+    elif isinstance(value, dict):
+        yield _msgpack_header(len(value), 0x80, 16, b"\x00\xde\xdf")
+        for key, item in value.items():
+            yield from _iter_msgpack(key)
+            yield from _iter_msgpack(item)
+    elif isinstance(value, Record):
+        # Records are encoded as maps, as in JSON, without intermediate dictionaries.
+        yield _msgpack_header(len(value.__slots__), 0x80, 16, b"\x00\xde\xdf")
+        for field, item in zip(value.__slots__, value):
+            yield from _iter_msgpack(field)
+            yield from _iter_msgpack(item)
+    else:
+        raise TypeError(f"Object of type {value.__class__.__name__} is not serializable")
+
 
 class API:
     """
     This class provides results serialization for external usages.
-    At the moment, only JSON has been implemented.
+    At the moment, JSON, NDJSON (one line per entry, then a meta-data line), MessagePack and
+      Prometheus text exposition format are implemented.
     Feel free to contribute to add other formats as needed.
     """
 
@@ -27,12 +192,84 @@ class API:
         """
         document = {
             "data": {entry.name: entry.value for entry in self.entries},
-            "meta": {
-                "version": Utility.version_to_semver_segments(__version__),
-                "date": datetime.now().isoformat(),
-                "count": len(self.entries),
-                "distro": Distributions.get_local().value,
-            },
+            "meta": self._get_meta(),
         }
 
-        return json.dumps(document, indent=((indent * 2) or None))
+        return json.dumps(document, indent=((indent * 2) or None), default=_json_default)
+
+    @staticmethod
+    def ndjson_entry_serialization(entry: Entry, elapsed: float, index: int) -> str:
+        """
+        NDJSON serialization of a single entry (as a line), along with its loading duration (in
+          seconds), so entries may be streamed as soon as they complete.
+        Entry configured `index` is carried too, so lines may be put back in order.
+        """
+        return json.dumps(
+            {
+                "entry": entry.name,
+                "value": entry.value,
+                "elapsed_ms": round(elapsed * 1000, 3),
+                "index": index,
+            },
+            default=_json_default,
+        )
+
+    def ndjson_meta_serialization(self) -> str:
+        """NDJSON serialization of the meta-data line, closing an entries stream"""
+        return json.dumps({"meta": self._get_meta()})
+
+    def msgpack_serialization(self) -> Iterator[bytes]:
+        """
+        MessagePack serialization of entries, with the same document structure as JSON's one.
+        Encoded chunks are yielded as they come, so they may be written without building the whole
+          document first.
+        """
+        # Map of two items : "data" and "meta".
+        yield b"\x82"
+
+        yield from _iter_msgpack("data")
+        yield _msgpack_header(len(self.entries), 0x80, 16, b"\x00\xde\xdf")
+        for entry in self.entries:
+            yield from _iter_msgpack(entry.name)
+            yield from _iter_msgpack(entry.value)
+
+        yield from _iter_msgpack("meta")
+        yield from _iter_msgpack(self._get_meta())
+
+    def prometheus_serialization(self) -> Iterator[str]:
+        """
+        Prometheus text exposition format serialization (e.g. for node exporter's textfile
+          collector), where numeric entries values are exposed as gauges.
+        Lines are yielded as they come. Entries are identified by an `entry` label (their name).
+        """
+        for metric_name, help_text, entry_class_name, get_samples in PROMETHEUS_GAUGES:
+            header_yielded = False
+            for entry in self.entries:
+                if entry.__class__.__name__ != entry_class_name or not entry.value:
+                    continue
+
+                try:
+                    samples = list(get_samples(entry.value))
+                except (AttributeError, IndexError, KeyError, TypeError):
+                    # Unexpected value (e.g. rebuilt from a foreign document), skip it.
+                    continue
+
+                for labels, sample_value in samples:
+                    if not header_yielded:
+                        yield f"# HELP {metric_name} {help_text}\n"
+                        yield f"# TYPE {metric_name} gauge\n"
+                        header_yielded = True
+
+                    labels_text = ",".join(
+                        f'{label_name}="{_escape_label_value(str(label_value))}"'
+                        for label_name, label_value in {"entry": entry.name, **labels}.items()
+                    )
+                    yield f"{metric_name}{{{labels_text}}} {sample_value}\n"
+
+    def _get_meta(self) -> dict:
+        return {
+            "version": Utility.version_to_semver_segments(__version__),
+            "date": datetime.now().isoformat(),
+            "count": len(self.entries),
+            "distro": Distributions.get_local().value,
+        }
@@ -0,0 +1,91 @@
+"""
+Simple persistent cache module.
+Values are stored as JSON documents under user cache directory, so they survive across runs.
+"""
+
+import hashlib
+import json
+import os
+import time
+from contextlib import suppress
+from tempfile import NamedTemporaryFile
+from typing import Any, Optional
+
+
+class Cache:
+    """
+    Small persistent key-value store, backed by a JSON file named after `name`.
+    Each value is bound to its storage timestamp and (optionally) to a "fingerprint" of the inputs
+      it has been computed from, so it may be invalidated by age or by context changes.
+    Any I/O or decoding error is considered as a cache miss.
+    """
+
+    def __init__(self, name: str):
+        self._path = os.path.join(self.get_cache_dir(), f"{name}.json")
+
+    @staticmethod
+    def get_cache_dir() -> str:
+        """Return Archey cache directory path (honoring `XDG_CACHE_HOME`)"""
+        return os.path.join(
+            os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "archey4"
+        )
+
+    @staticmethod
+    def _digest(fingerprint: Any) -> str:
+        return hashlib.sha256(
+            json.dumps(fingerprint, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def _load(self) -> dict:
+        try:
+            with open(self._path, encoding="UTF-8") as f_cache:
+                content = json.load(f_cache)
+        except (OSError, ValueError):
+            return {}
+
+        return content if isinstance(content, dict) else {}
+
+    def get(self, key: str, ttl: Optional[float] = None, fingerprint: Any = None) -> Any:
+        """
+        Return value stored under `key`, or `None` when it is missing, older than `ttl` seconds or
+          has been stored with another `fingerprint`.
+        """
+        item = self._load().get(key)
+        if not isinstance(item, dict):
+            return None
+
+        if ttl is not None and not 0 <= time.time() - item.get("timestamp", 0) < ttl:
+            return None
+
+        if item.get("fingerprint") != self._digest(fingerprint):
+            return None
+
+        return item.get("value")
+
+    def set(self, key: str, value: Any, fingerprint: Any = None) -> None:
+        """Store (JSON-serializable) `value` under `key`, bound to `fingerprint`"""
+        content = self._load()
+        content[key] = {
+            "value": value,
+            "timestamp": time.time(),
+            "fingerprint": self._digest(fingerprint),
+        }
+
+        self.write_file(self._path, json.dumps(content).encode("UTF-8"))
+
+    @staticmethod
+    def write_file(path: str, content: bytes) -> None:
+        """
+        Atomically (over)write `path` with `content`, creating its parent directory if needed.
+        A temporary file is written first, so concurrent runs never read a partial document.
+        Any I/O error is ignored (nothing is left behind).
+        """
+        with suppress(OSError):
+            os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+            with NamedTemporaryFile(dir=os.path.dirname(path), delete=False) as f_temp:
+                f_temp.write(content)
+
+            try:
+                os.replace(f_temp.name, path)
+            except OSError:
+                os.remove(f_temp.name)
@@ -0,0 +1,257 @@
+"""
+Shared sub-processes runner.
+Commands may run within a (prebuilt) C locale environment, are always bounded by a timeout, and
+  have their captured outputs capped. Each call is accounted (duration, exit status and outputs
+  sizes).
+"""
+
+import errno
+import locale
+import logging
+import os
+import selectors
+import shutil
+import time
+from functools import lru_cache
+from subprocess import DEVNULL, PIPE, CompletedProcess, Popen, TimeoutExpired
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from archey.record import Record
+
+# Default commands timeout (in seconds), so a hung command never blocks Archey.
+DEFAULT_TIMEOUT = 10.0
+
+# Default maximum size (in bytes) of each captured output stream, exceeding data is discarded.
+DEFAULT_MAX_OUTPUT_SIZE = 8 * 1024 * 1024
+
+_READ_CHUNK_SIZE = 64 * 1024
+
+
+class CommandMetrics(Record):
+    """Accounting of a single command run"""
+
+    __slots__ = ("command", "elapsed", "returncode", "stdout_size", "stderr_size")
+
+    command: str
+    elapsed: float
+    returncode: int
+    stdout_size: int
+    stderr_size: int
+
+
+_COMMANDS_METRICS: List[CommandMetrics] = []
+
+
+def get_commands_metrics() -> List[CommandMetrics]:
+    """Return metrics of commands run so far (by this process)"""
+    return _COMMANDS_METRICS.copy()
+
+
+@lru_cache(maxsize=None)
+def get_c_locale_env() -> Dict[str, str]:
+    """
+    Return (once and for all) current process environment, with `LANG` set to C locale.
+    Environment is honored as some programs (e.g. package managers) require an extended `PATH`.
+    """
+    return {**os.environ, "LANG": "C"}
+
+
+@lru_cache(maxsize=None)
+def _which(program: str, path: Optional[str]) -> Optional[str]:
+    return shutil.which(program, path=path)
+
+
+class _PatternsCounter:
+    """Count occurrences of `patterns` across streamed chunks, without keeping them"""
+
+    def __init__(self, patterns: Sequence[bytes]):
+        self.patterns = patterns
+        self.counts = [0] * len(patterns)
+        # Last bytes of previous chunk, so occurrences spanning two chunks are counted too.
+        self._tails = [b""] * len(patterns)
+
+    def __call__(self, chunk: bytes) -> None:
+        for index, pattern in enumerate(self.patterns):
+            data = self._tails[index] + chunk
+            self.counts[index] += data.count(pattern)
+            self._tails[index] = data[-(len(pattern) - 1) :] if len(pattern) > 1 else b""
+
+
+def _read_outputs(
+    process: Popen,
+    deadline: float,
+    max_output_size: int,
+    sizes: Dict[str, int],
+    consumers: Dict[str, Callable[[bytes], None]],
+) -> Dict[str, bytes]:
+    """
+    Read `process` piped outputs (by stream name) until they're closed, or `deadline` is passed.
+    Return captured data (capped to `max_output_size`) and update `sizes` with actual ones.
+    Streams with a consumer are passed to it chunk by chunk, instead of being captured.
+    """
+    chunks: Dict[str, List[bytes]] = {}
+    with selectors.DefaultSelector() as selector:
+        for stream_name, stream in (("stdout", process.stdout), ("stderr", process.stderr)):
+            if stream is not None:
+                selector.register(stream, selectors.EVENT_READ, stream_name)
+                sizes[stream_name] = 0
+                if stream_name not in consumers:
+                    chunks[stream_name] = []
+
+        while selector.get_map():  # pylint: disable=while-used
+            remaining_time = deadline - time.monotonic()
+            if remaining_time <= 0:
+                raise TimeoutExpired(process.args, 0)
+
+            for key, _ in selector.select(remaining_time):
+                data = os.read(key.fd, _READ_CHUNK_SIZE)
+                if not data:
+                    selector.unregister(key.fileobj)
+                    continue
+
+                if key.data in consumers:
+                    consumers[key.data](data)
+                else:
+                    # Outputs are drained (so the command never blocks), but only the beginning is
+                    #  kept.
+                    room = max_output_size - sizes[key.data]
+                    if room > 0:
+                        chunks[key.data].append(data[:room])
+                sizes[key.data] += len(data)
+
+    return {stream_name: b"".join(stream_chunks) for stream_name, stream_chunks in chunks.items()}
+
+
+def _decode(
+    data: Optional[bytes], text: bool, encoding: Optional[str], errors: Optional[str]
+) -> Union[None, bytes, str]:
+    if data is None or not text:
+        return data
+
+    # Mimic `universal_newlines` behavior.
+    return (
+        data.decode(encoding or locale.getpreferredencoding(False), errors or "strict")
+        .replace("\r\n", "\n")
+        .replace("\r", "\n")
+    )
+
+
+def run(  # pylint: disable=too-many-arguments,too-many-locals
+    args: Union[str, Sequence[str]],
+    *,
+    stdout=None,
+    stderr=None,
+    shell: bool = False,
+    check: bool = False,
+    timeout: Optional[float] = None,
+    env: Optional[Dict[str, str]] = None,
+    c_locale: bool = False,
+    max_output_size: int = DEFAULT_MAX_OUTPUT_SIZE,
+    stdout_consumer: Optional[Callable[[bytes], None]] = None,
+    universal_newlines: bool = False,
+    encoding: Optional[str] = None,
+    errors: Optional[str] = None,
+) -> CompletedProcess:
+    """
+    Drop-in replacement of `subprocess.run`, for our needs.
+    When `c_locale` is enabled (and no explicit `env` is passed), command runs within the C
+      locale environment. `timeout` defaults to `DEFAULT_TIMEOUT` (`TimeoutExpired` is raised once
+      command has been killed). Standard input is never inherited.
+    Programs are resolved against `PATH` upfront (and lookups are cached), so missing ones are
+      reported without even forking, and CPython may spawn commands through `posix_spawn` (or
+      `vfork`) instead of `fork`.
+    When set, `stdout_consumer` is passed piped standard output chunks (as bytes) as they come, so
+      large outputs don't have to be kept in memory (`stdout` attribute is then `None`).
+    """
+    if env is None and c_locale:
+        env = get_c_locale_env()
+    if timeout is None:
+        timeout = DEFAULT_TIMEOUT
+
+    executable = None
+    if not shell:
+        if isinstance(args, str):
+            args = [args]
+
+        executable = args[0]
+        if os.sep not in executable:
+            executable = _which(executable, (env if env is not None else os.environ).get("PATH"))
+            if executable is None:
+                raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), args[0])
+
+    sizes: Dict[str, int] = {}
+    outputs: Dict[str, bytes] = {}
+    start_time = time.monotonic()
+    # File descriptors are not inheritable by default (see PEP 446), `close_fds` is not required.
+    with Popen(
+        args,
+        executable=executable,
+        stdin=DEVNULL,
+        stdout=stdout,
+        stderr=stderr,
+        shell=shell,
+        env=env,
+        close_fds=False,
+    ) as process:
+        try:
+            outputs = _read_outputs(
+                process,
+                start_time + timeout,
+                max_output_size,
+                sizes,
+                ({"stdout": stdout_consumer} if stdout_consumer is not None else {}),
+            )
+            process.wait(max(start_time + timeout - time.monotonic(), 0))
+        except TimeoutExpired:
+            process.kill()
+            raise TimeoutExpired(args, timeout) from None
+        except BaseException:
+            process.kill()
+            raise
+        finally:
+            process.wait()
+            _COMMANDS_METRICS.append(
+                CommandMetrics(
+                    command=args if isinstance(args, str) else " ".join(args),
+                    elapsed=time.monotonic() - start_time,
+                    returncode=process.returncode,
+                    stdout_size=sizes.get("stdout", 0),
+                    stderr_size=sizes.get("stderr", 0),
+                )
+            )
+            logging.getLogger(__name__).debug("%r", _COMMANDS_METRICS[-1])
+
+    if any(sizes[stream_name] > max_output_size for stream_name in outputs):
+        logging.getLogger(__name__).warning(
+            "%s output has been truncated to %d bytes.", args, max_output_size
+        )
+
+    text = universal_newlines or encoding is not None or errors is not None
+    completed_process = CompletedProcess(
+        args,
+        process.returncode,
+        _decode(outputs.get("stdout"), text, encoding, errors),
+        _decode(outputs.get("stderr"), text, encoding, errors),
+    )
+    if check:
+        completed_process.check_returncode()
+
+    return completed_process
+
+
+def check_output(args: Union[str, Sequence[str]], **kwargs) -> Any:
+    """Drop-in replacement of `subprocess.check_output`, see `run`"""
+    return run(args, stdout=PIPE, check=True, **kwargs).stdout
+
+
+def count_output(
+    args: Union[str, Sequence[str]], patterns: Sequence[bytes] = (b"\n",), **kwargs
+) -> List[int]:
+    """
+    Run `args` (see `check_output`) and return the number of occurrences of each one of `patterns`
+      (defaults to lines count) in its standard output.
+    Output is consumed as a stream : it is neither decoded, kept in memory nor capped.
+    """
+    patterns_counter = _PatternsCounter(patterns)
+    run(args, stdout=PIPE, check=True, stdout_consumer=patterns_counter, **kwargs)
+    return patterns_counter.counts
@@ -2,10 +2,13 @@
 
 import json
 import logging
+import marshal
 import os
 from copy import deepcopy
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
+from archey._version import __version__
+from archey.cache import Cache
 from archey.colors import ANSI_TEXT_CODES_REGEXP
 from archey.singleton import Singleton
 from archey.utility import Utility
@@ -27,6 +30,9 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     },
 }
 
+# Compiled (merged and validated) configuration snapshot file name, under cache directory.
+COMPILED_CONFIG_FILE_NAME = "config.marshal"
+
 
 class Configuration(metaclass=Singleton):
     """
@@ -36,25 +42,43 @@ class Configuration(metaclass=Singleton):
     If a `config_path` is passed during instantiation, it will be loaded.
     """
 
-    def __init__(self, config_path=None):
+    def __init__(self, config_path=None, compiled_cache=False):
         # Deep-copy `DEFAULT_CONFIG` so we have a local copy to safely mutate.
         self._config = deepcopy(DEFAULT_CONFIG)
 
         # We will track successfully loaded configuration files stat info.
         self._config_files_info = {}
 
+        # Configuration may only be snapshotted when loading did not fail (nor warn).
+        self._is_cacheable = True
+
         # If a `config_path` has been specified, (try to) load it directly.
-        if config_path:
-            self._load_configuration(config_path)
         # If not, load each (optional) configuration file in a "regular" order.
+        if config_path:
+            config_paths = [self._get_config_file_path(config_path)]
         else:
-            self._load_configuration("/etc/archey4/")
-            self._load_configuration(os.path.expanduser("~/.config/archey4/"))
-            self._load_configuration(os.getcwd())
+            config_paths = [
+                self._get_config_file_path("/etc/archey4/"),
+                self._get_config_file_path(os.path.expanduser("~/.config/archey4/")),
+                self._get_config_file_path(os.getcwd()),
+            ]
+
+        # When enabled, a merged and validated snapshot of configuration is reused as long as
+        #  none of its source files changed.
+        if compiled_cache:
+            sources_info = self._get_sources_info(config_paths)
+            if self._load_compiled_cache(sources_info):
+                return
+
+        for path in config_paths:
+            self._load_configuration(path)
 
         # Perform various validations
         self._validate_configuration()
 
+        if compiled_cache and self._is_cacheable:
+            self._dump_compiled_cache(sources_info)
+
     def get(self, key: str, default=None) -> Any:
         """
         A binding method to imitate the `dict.get()` behavior.
@@ -65,6 +89,92 @@ class Configuration(metaclass=Singleton):
         """Return a copy of loaded files stat info data"""
         return self._config_files_info.copy()
 
+    @staticmethod
+    def _get_config_file_path(path: str) -> str:
+        # If the specified `path` is a directory, append the file name we are looking for.
+        if os.path.isdir(path):
+            return os.path.join(path, "config.json")
+
+        return path
+
+    @staticmethod
+    def _get_sources_info(config_paths: List[str]) -> Dict[str, Optional[os.stat_result]]:
+        """Return stat info of each configuration file (`None` when it could not be stat-ed)"""
+        sources_info: Dict[str, Optional[os.stat_result]] = {}
+        for config_path in config_paths:
+            try:
+                sources_info[config_path] = os.stat(config_path)
+            except OSError:
+                sources_info[config_path] = None
+
+        return sources_info
+
+    @staticmethod
+    def _get_compiled_cache_key(sources_info: Dict[str, Optional[os.stat_result]]) -> tuple:
+        return (__version__,) + tuple(
+            (
+                config_path,
+                (
+                    (stat_info.st_mtime_ns, stat_info.st_size, stat_info.st_ino)
+                    if stat_info is not None
+                    else None
+                ),
+            )
+            for config_path, stat_info in sources_info.items()
+        )
+
+    def _load_compiled_cache(self, sources_info: Dict[str, Optional[os.stat_result]]) -> bool:
+        """Restore configuration from its compiled snapshot, if it's still up to date"""
+        try:
+            with open(
+                os.path.join(Cache.get_cache_dir(), COMPILED_CONFIG_FILE_NAME), "rb"
+            ) as f_compiled_config:
+                compiled_config = marshal.load(f_compiled_config)
+
+            if compiled_config["key"] != self._get_compiled_cache_key(sources_info):
+                return False
+
+            config = compiled_config["config"]
+            config_files_info = {
+                config_path: sources_info[config_path]
+                for config_path in compiled_config["loaded_paths"]
+            }
+        except (OSError, EOFError, ValueError, TypeError, KeyError):
+            return False
+
+        self._config = config
+        self._config_files_info = config_files_info
+
+        # Mimic `_load_configuration` side-effect.
+        if self._config_files_info:
+            self._set_logging_level()
+
+        return True
+
+    def _dump_compiled_cache(self, sources_info: Dict[str, Optional[os.stat_result]]) -> None:
+        """Store a compiled snapshot of (merged and validated) configuration"""
+        try:
+            compiled_config = marshal.dumps(
+                {
+                    "key": self._get_compiled_cache_key(sources_info),
+                    "config": self._config,
+                    "loaded_paths": list(self._config_files_info),
+                }
+            )
+        except ValueError:
+            # Configuration contains unmarshallable objects.
+            return
+
+        Cache.write_file(
+            os.path.join(Cache.get_cache_dir(), COMPILED_CONFIG_FILE_NAME), compiled_config
+        )
+
+    def _set_logging_level(self) -> None:
+        # When `suppress_warnings` is set, higher the log level to silence warning messages.
+        logging.getLogger().setLevel(
+            logging.ERROR if self.get("suppress_warnings") else logging.WARN
+        )
+
     def _load_configuration(self, path: str) -> None:
         """
         A method handling configuration loading from a JSON file.
@@ -75,9 +185,7 @@ class Configuration(metaclass=Singleton):
             #  ... don't load this one.
             return
 
-        # If the specified `path` is a directory, append the file name we are looking for.
-        if os.path.isdir(path):
-            path = os.path.join(path, "config.json")
+        path = self._get_config_file_path(path)
 
         try:
             with open(path, mode="rb") as f_config:
@@ -87,12 +195,10 @@ class Configuration(metaclass=Singleton):
             return
         except (PermissionError, json.JSONDecodeError) as error:
             logging.error("%s (%s)", error, path)
+            self._is_cacheable = False
             return
 
-        # When `suppress_warnings` is set, higher the log level to silence warning messages.
-        logging.getLogger().setLevel(
-            logging.ERROR if self.get("suppress_warnings") else logging.WARN
-        )
+        self._set_logging_level()
 
     def _validate_configuration(self) -> None:
         # entries_color
@@ -105,6 +211,7 @@ class Configuration(metaclass=Singleton):
                 logging.warning(
                     "Couldn't validate 'entries_color' configuration option value, ignoring..."
                 )
+                self._is_cacheable = False
                 self._config["entries_color"] = DEFAULT_CONFIG["entries_color"]
 
     def __iter__(self):
@@ -3,11 +3,13 @@
 import json
 import platform
 import re
-from subprocess import DEVNULL, CalledProcessError, check_output
+from subprocess import DEVNULL, SubprocessError, TimeoutExpired
 from typing import Dict, List
 
+from archey.command import check_output
 from archey.distributions import Distributions
 from archey.entry import Entry
+from archey.pseudo_files import PseudoFiles
 
 
 class CPU(Entry):
@@ -71,8 +73,7 @@ class CPU(Entry):
     def _parse_proc_cpuinfo(cls) -> List[Dict[str, int]]:
         """Read `/proc/cpuinfo` and search for CPU model names occurrences"""
         try:
-            with open("/proc/cpuinfo", encoding="ASCII") as f_cpu_info:
-                cpu_info = f_cpu_info.read()
+            cpu_info = PseudoFiles().read("/proc/cpuinfo")
         except OSError:
             return []
 
@@ -100,8 +101,8 @@ class CPU(Entry):
     def _parse_lscpu_output(cls) -> List[Dict[str, int]]:
         """Same operation but from `lscpu` output"""
         try:
-            cpu_info = check_output("lscpu", env={"LANG": "C"}, universal_newlines=True)
-        except OSError:
+            cpu_info = check_output("lscpu", c_locale=True, universal_newlines=True)
+        except (OSError, TimeoutExpired):
             return []
 
         nb_threads = cls._THREADS_PER_CORE_REGEXP.findall(cpu_info)
@@ -129,7 +130,7 @@ class CPU(Entry):
                 stderr=DEVNULL,
                 universal_newlines=True,
             )
-        except (OSError, CalledProcessError):
+        except (OSError, SubprocessError):
             # `-json` is not available before Catalina.
             return []
 
@@ -165,7 +166,7 @@ class CPU(Entry):
                 stderr=DEVNULL,
                 universal_newlines=True,
             )
-        except (OSError, CalledProcessError):
+        except (OSError, SubprocessError):
             return []
 
         # `sysctl_output` should exactly contains two lines.
@@ -179,7 +180,7 @@ class CPU(Entry):
             sysctl_output = check_output(
                 ["sysctl", "-n", "hw.model", "hw.ncpu"], stderr=DEVNULL, universal_newlines=True
             )
-        except (OSError, CalledProcessError):
+        except (OSError, SubprocessError):
             return []
 
         # `sysctl_output` should exactly contains two lines.
@@ -1,12 +1,14 @@
 """Custom entry class"""
 
+import json
 import logging
 import os
 import stat
-from contextlib import suppress
-from subprocess import DEVNULL, PIPE, CalledProcessError, run
-from typing import List, Union
+from subprocess import DEVNULL, PIPE, CalledProcessError, TimeoutExpired
+from typing import Dict, List, Optional, Union
 
+from archey.cache import Cache
+from archey.command import run
 from archey.configuration import Configuration
 from archey.entry import Entry
 
@@ -46,22 +48,59 @@ class Custom(Entry):
         else:
             command = self.options["command"]
 
+        # Command output may be cached, until `cache_ttl` expires or any of `cache_key_files` is
+        #  modified.
+        cache_ttl = self.options.get("cache_ttl")
+        if cache_ttl:
+            cache = Cache("custom")
+            cache_key = json.dumps([command, shell])
+            fingerprint = self._get_files_fingerprint(self.options.get("cache_key_files", []))
+
+            self.value = cache.get(cache_key, cache_ttl, fingerprint)
+            if self.value is not None:
+                return
+
         log_stderr = self.options.get("log_stderr", True)
 
-        with suppress(CalledProcessError):
+        try:
             proc = run(
                 command,
                 stdout=PIPE,
                 stderr=PIPE if log_stderr else DEVNULL,
                 shell=shell,
                 check=self.options.get("check", True),
+                timeout=self.options.get("timeout"),
                 universal_newlines=True,
             )
-            if proc.stdout:
-                self.value = proc.stdout.rstrip().splitlines()
+        except CalledProcessError:
+            return
+        except TimeoutExpired:
+            self._logger.warning("%s command timed out.", self.name)
+            return
+
+        if proc.stdout:
+            self.value = proc.stdout.rstrip().splitlines()
+
+        if log_stderr and proc.stderr:
+            self._logger.warning("%s", proc.stderr.rstrip())
+
+        # Only successful runs outputs are cached.
+        if cache_ttl and self.value is not None:
+            cache.set(cache_key, self.value, fingerprint)
+
+    @staticmethod
+    def _get_files_fingerprint(file_paths: List[str]) -> Dict[str, Optional[List[int]]]:
+        """Return modification time and size of each file (`None` when missing)"""
+        fingerprint: Dict[str, Optional[List[int]]] = {}
+        for file_path in file_paths:
+            try:
+                stat_info = os.stat(os.path.expanduser(file_path))
+            except OSError:
+                fingerprint[file_path] = None
+            else:
+                fingerprint[file_path] = [stat_info.st_mtime_ns, stat_info.st_size]
 
-            if log_stderr and proc.stderr:
-                self._logger.warning("%s", proc.stderr.rstrip())
+        return fingerprint
 
     def output(self, output) -> None:
         if not self.value:
@@ -3,10 +3,11 @@
 import platform
 import plistlib
 import re
-from subprocess import DEVNULL, PIPE, check_output, run
+from subprocess import DEVNULL, PIPE, TimeoutExpired
 from typing import Dict, Iterable, List
 
 from archey.colors import Colors
+from archey.command import check_output, run
 from archey.entry import Entry
 
 
@@ -76,6 +77,9 @@ class Disk(Entry):
                 "APFS volumes cannot be deduplicated as diskutil program could not be found."
             )
             return self._disk_dict
+        except TimeoutExpired:
+            self._logger.warning("APFS volumes cannot be deduplicated as diskutil timed out.")
+            return self._disk_dict
         except plistlib.InvalidFileException:
             self._logger.error(
                 "APFS volumes cannot be deduplicated as diskutil output could not be parsed."
@@ -155,8 +159,7 @@ class Disk(Entry):
 
         return specified_disk_dict
 
-    @staticmethod
-    def _get_df_output_dict() -> Dict[str, dict]:
+    def _get_df_output_dict(self) -> Dict[str, dict]:
         """
         Runs `df -P -k` and returns disks in a dict formatted as:
         {
@@ -176,7 +179,7 @@ class Disk(Entry):
         try:
             df_output = run(
                 ["df", "-P", "-k"],
-                env={"LANG": "C"},
+                c_locale=True,
                 universal_newlines=True,
                 stdout=PIPE,
                 # On error, `df` may "hold" `EXIT_FAILURE` as exit status code.
@@ -190,6 +193,10 @@ class Disk(Entry):
         except OSError:
             # `df` isn't available on this system.
             return {}
+        except TimeoutExpired:
+            # `df` may hang on unresponsive (network) filesystems.
+            self._logger.warning("`df` timed out, filesystems could not be listed.")
+            return {}
 
         df_output_dict = {}
         for df_entry_match in re.finditer(
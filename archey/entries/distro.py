@@ -1,17 +1,29 @@
 """Distribution and architecture detection class"""
 
 import platform
-from subprocess import check_output
+from subprocess import TimeoutExpired
 from typing import Optional
 
+from archey.command import check_output
 from archey.distributions import Distributions
 from archey.entry import Entry
+from archey.record import Record
+
+
+class DistroValue(Record):
+    """Distribution name (if detected) and machine architecture"""
+
+    __slots__ = ("name", "arch")
+
+    name: Optional[str]
+    arch: str
 
 
 class Distro(Entry):
     """Uses `distro` and `platform` modules to retrieve distribution and architecture information"""
 
     _ICON = "\uf17c"  # fa_linux
+    _VALUE_RECORD = DistroValue
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -21,7 +33,7 @@ class Distro(Entry):
         else:
             distro_name = Distributions.get_distro_name() or self._fetch_android_release()
 
-        self.value = {"name": distro_name, "arch": platform.machine()}
+        self.value = DistroValue(distro_name, platform.machine())
 
     @staticmethod
     def _fetch_android_release() -> Optional[str]:
@@ -30,7 +42,7 @@ class Distro(Entry):
             release = check_output(
                 ["getprop", "ro.build.version.release"], universal_newlines=True
             ).rstrip()
-        except OSError:
+        except (OSError, TimeoutExpired):
             return None
 
         return f"Android {release}"
@@ -48,7 +60,7 @@ class Distro(Entry):
     def output(self, output) -> None:
         output.append(
             self.name,
-            f"{{}} {self.value['arch']}".format(
-                self.value["name"] or self._default_strings.get("not_detected")
+            f"{{}} {self.value.arch}".format(
+                self.value.name or self._default_strings.get("not_detected")
             ),
         )
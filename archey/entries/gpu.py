@@ -6,9 +6,10 @@ import platform
 import re
 from pathlib import Path
 from shlex import split
-from subprocess import DEVNULL, CalledProcessError, check_output
+from subprocess import DEVNULL, SubprocessError, TimeoutExpired
 from typing import List
 
+from archey.command import check_output
 from archey.entry import Entry
 
 LINUX_DRI_DEBUGFS_PATH = Path("/sys/kernel/debug/dri")
@@ -49,7 +50,7 @@ class GPU(Entry):
         """Based on `lspci` output, return a list of video controllers names"""
         try:
             lspci_output = check_output(["lspci", "-m"], universal_newlines=True).splitlines()
-        except (OSError, CalledProcessError):
+        except (OSError, SubprocessError):
             return []
 
         gpus_list = []
@@ -122,7 +123,7 @@ class GPU(Entry):
             profiler_output = check_output(
                 ["system_profiler", "SPDisplaysDataType"], stderr=DEVNULL, universal_newlines=True
             )
-        except OSError:
+        except (OSError, TimeoutExpired):
             return []
 
         return re.findall(r"Chipset Model: (.*)", profiler_output, re.MULTILINE)
@@ -134,7 +135,7 @@ class GPU(Entry):
             pciconf_output = check_output(
                 ["pciconf", "-lv"], stderr=DEVNULL, universal_newlines=True
             )
-        except (OSError, CalledProcessError):
+        except (OSError, SubprocessError):
             return []
 
         gpus_list = []
@@ -1,16 +1,36 @@
 """Kernel information detection class"""
 
+import codecs
 import json
 import platform
-from socket import timeout as SocketTimeoutError
+import re
+from functools import partial
+from http.client import HTTPException
 from typing import Optional
-from urllib.error import URLError
-from urllib.request import urlopen
 
+from archey.cache import Cache
 from archey.entry import Entry
 from archey.environment import Environment
+from archey.http_client import HTTPClient
+from archey.record import Record
 from archey.utility import Utility
 
+KERNEL_RELEASES_URL = "https://www.kernel.org/releases.json"
+
+# `latest_stable` object is located at the very beginning of the (large) releases document.
+LATEST_STABLE_KEY_REGEXP = re.compile(r'"latest_stable"\s*:\s*')
+
+
+class KernelValue(Record):
+    """Running kernel identity, and latest (upstream) release when it has been checked"""
+
+    __slots__ = ("name", "release", "latest", "is_outdated")
+
+    name: str
+    release: str
+    latest: Optional[str]
+    is_outdated: Optional[bool]
+
 
 class Kernel(Entry):
     """
@@ -19,52 +39,118 @@ class Kernel(Entry):
     """
 
     _ICON = "\uf305"  # linux_coreos
+    _VALUE_RECORD = KernelValue
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self.value = {
-            "name": platform.system(),
-            "release": platform.release(),
-            "latest": None,
-            "is_outdated": None,
-        }
+        self.value = KernelValue(platform.system(), platform.release(), None, None)
 
         # On GNU/Linux systems, if `check_version` has been enabled and `DO_NOT_TRACK` isn't set,
         #  retrieve the latest kernel release in order to compare the current one against it.
         if (
             not self.options.get("check_version")
-            or self.value["name"] != "Linux"
+            or self.value.name != "Linux"
             or Environment.DO_NOT_TRACK
         ):
             return
 
-        self.value["latest"] = self._fetch_latest_linux_release()
-        if self.value["latest"]:
-            self.value["is_outdated"] = Utility.version_to_semver_segments(
-                self.value["release"]
-            ) < Utility.version_to_semver_segments(self.value["latest"])
+        self.value.latest = self._fetch_latest_linux_release(
+            self.options.get("timeout", 1), self.options.get("cache_ttl", 86400)
+        )
+        if self.value.latest:
+            self.value.is_outdated = Utility.version_to_semver_segments(
+                self.value.release
+            ) < Utility.version_to_semver_segments(self.value.latest)
+
+    @classmethod
+    def _fetch_latest_linux_release(
+        cls, timeout: float, cache_ttl: Optional[float]
+    ) -> Optional[str]:
+        """
+        Return latest (stable) Linux kernel release, which is cached for `cache_ttl` seconds.
+        Past this delay, the cached release is revalidated against upstream (conditional request),
+          and is still used when upstream could not be reached.
+        """
+        if not cache_ttl:
+            return cls._request_latest_linux_release(timeout, {}).get("version")
+
+        cache = Cache("kernel")
+
+        latest_release = cache.get("latest_release", cache_ttl)
+        if latest_release is not None:
+            return latest_release.get("version")
+
+        # Expired release (if any) is kept for revalidation.
+        latest_release = cache.get("latest_release") or {}
+
+        fetched_release = cls._request_latest_linux_release(timeout, latest_release)
+        if fetched_release:
+            latest_release = fetched_release
+            cache.set("latest_release", latest_release)
+
+        return latest_release.get("version")
 
     @staticmethod
-    def _fetch_latest_linux_release() -> Optional[str]:
+    def _request_latest_linux_release(timeout: float, cached_release: dict) -> dict:
+        """
+        Request upstream kernel releases document (conditionally if `cached_release` carries
+          validators), and stream-parse it until `latest_stable` object is read.
+        Return a dictionary with `version` and validators (`etag`, `last_modified`) or, when
+          `cached_release` is still up to date, `cached_release`. Return an empty one on error.
+        """
+        headers = {}
+        if cached_release.get("etag"):
+            headers["If-None-Match"] = cached_release["etag"]
+        if cached_release.get("last_modified"):
+            headers["If-Modified-Since"] = cached_release["last_modified"]
+
         try:
-            with urlopen("https://www.kernel.org/releases.json") as http_request:
-                try:
-                    kernel_releases = json.load(http_request)
-                except json.JSONDecodeError:
-                    return None
-        except (URLError, SocketTimeoutError):
-            return None
+            with HTTPClient().request(KERNEL_RELEASES_URL, timeout, headers) as http_response:
+                # Upstream document did not change since our last request.
+                if http_response.status == 304:
+                    return cached_release
+
+                if http_response.status != 200:
+                    return {}
+
+                decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+                content = ""
+                for chunk in iter(partial(http_response.read, 4096), b""):
+                    content += decoder.decode(chunk)
+
+                    latest_stable_key = LATEST_STABLE_KEY_REGEXP.search(content)
+                    if latest_stable_key is None:
+                        continue
+
+                    try:
+                        latest_stable, _ = json.JSONDecoder().raw_decode(
+                            content, latest_stable_key.end()
+                        )
+                    except json.JSONDecodeError:
+                        # `latest_stable` object has not been completely received yet.
+                        continue
+
+                    if not isinstance(latest_stable, dict) or not latest_stable.get("version"):
+                        return {}
+
+                    return {
+                        "version": latest_stable["version"],
+                        "etag": http_response.headers.get("ETag"),
+                        "last_modified": http_response.headers.get("Last-Modified"),
+                    }
+        except (OSError, HTTPException):
+            pass
 
-        return kernel_releases.get("latest_stable", {}).get("version")
+        return {}
 
     def output(self, output) -> None:
         """Display running kernel and latest kernel if possible"""
-        text_output = " ".join((self.value["name"], self.value["release"]))
+        text_output = " ".join((self.value.name, self.value.release))
 
-        if self.value["latest"]:
-            if self.value["is_outdated"]:
-                text_output += f" ({self.value['latest']} {self._default_strings.get('available')})"
+        if self.value.latest:
+            if self.value.is_outdated:
+                text_output += f" ({self.value.latest} {self._default_strings.get('available')})"
             else:
                 text_output += f" ({self._default_strings.get('latest')})"
 
@@ -1,8 +1,9 @@
 """Local IP addresses detection class"""
 
-import ipaddress
+import socket
+from fnmatch import fnmatch
 from itertools import islice
-from typing import Iterator
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 try:
     import netifaces
@@ -10,10 +11,65 @@ except ImportError:
     netifaces = None
 
 from archey.entry import Entry
+from archey.network import Network
+
+
+def _precompute_networks(*networks: str) -> Dict[int, List[Tuple[int, int]]]:
+    """Pre-compute (integer) network addresses and masks of passed CIDR blocks, by family"""
+    precomputed_networks: Dict[int, List[Tuple[int, int]]] = {
+        socket.AF_INET: [],
+        socket.AF_INET6: [],
+    }
+    for network in networks:
+        address, prefix_length = network.split("/")
+        addr_family = socket.AF_INET6 if ":" in address else socket.AF_INET
+        addr_bits = 128 if addr_family == socket.AF_INET6 else 32
+
+        mask = ((1 << int(prefix_length)) - 1) << (addr_bits - int(prefix_length))
+        precomputed_networks[addr_family].append(
+            (int.from_bytes(socket.inet_pton(addr_family, address), "big") & mask, mask)
+        )
+
+    return precomputed_networks
+
+
+# Address blocks we classify addresses with (mimicking `ipaddress` properties).
+LOOPBACK_NETWORKS = _precompute_networks("127.0.0.0/8", "::1/128")
+LINK_LOCAL_NETWORKS = _precompute_networks("169.254.0.0/16", "fe80::/10")
+# See <https://www.iana.org/assignments/iana-ipv4-special-registry/> and
+#  <https://www.iana.org/assignments/iana-ipv6-special-registry/>.
+NON_GLOBAL_NETWORKS = _precompute_networks(
+    "0.0.0.0/8",
+    "10.0.0.0/8",
+    "100.64.0.0/10",
+    "127.0.0.0/8",
+    "169.254.0.0/16",
+    "172.16.0.0/12",
+    "192.0.0.0/29",
+    "192.0.0.170/31",
+    "192.0.2.0/24",
+    "192.168.0.0/16",
+    "198.18.0.0/15",
+    "198.51.100.0/24",
+    "203.0.113.0/24",
+    "240.0.0.0/4",
+    "255.255.255.255/32",
+    "::1/128",
+    "::/128",
+    "::ffff:0:0/96",
+    "100::/64",
+    "2001::/23",
+    "2001:db8::/32",
+    "fc00::/7",
+    "fe80::/10",
+)
 
 
 class LanIP(Entry):
-    """Relies on the `netifaces` module to detect LAN IP addresses"""
+    """
+    Relies on rtnetlink (GNU/Linux) to detect LAN IP addresses.
+    On other platforms, falls back on the `netifaces` module.
+    """
 
     _ICON = "\U000f0a60"  # md_ip_network
     _PRETTY_NAME = "LAN IP"
@@ -21,17 +77,49 @@ class LanIP(Entry):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        if not netifaces:
-            self._logger.warning(
-                "`netifaces` Python module couldn't be found. "
-                "Please either install it or explicitly disable `LAN_IP` entry in configuration."
+        # Interfaces may be filtered (e.g. virtual ones on container hosts) by name patterns.
+        interface_include = self.options.get("interface_include")
+        interface_exclude = self.options.get("interface_exclude", [])
+
+        # Interfaces holding a default route will be processed first.
+        default_route_interfaces = Network.get_default_route_interfaces()
+
+        interfaces_addresses: Iterable[Tuple[str, List[Tuple[int, bytes]]]]
+        try:
+            # Dump every interface addresses at once.
+            all_interfaces_addresses = Network.get_interfaces_addresses()
+            interfaces_addresses = (
+                (if_name, all_interfaces_addresses[if_name])
+                for if_name in self._select_interfaces(
+                    all_interfaces_addresses,
+                    interface_include,
+                    interface_exclude,
+                    default_route_interfaces,
+                )
+            )
+        except OSError:
+            if not netifaces:
+                self._logger.warning(
+                    "`netifaces` Python module couldn't be found. "
+                    "Please either install it or explicitly disable `LAN_IP` entry in "
+                    "configuration."
+                )
+                return
+
+            # Filter interfaces out before any of their addresses are fetched.
+            interfaces_addresses = self._netifaces_interfaces_addresses(
+                self._select_interfaces(
+                    netifaces.interfaces(),
+                    interface_include,
+                    interface_exclude,
+                    default_route_interfaces,
+                )
             )
-            return
 
         # IPv4 will be enabled by default.
-        addr_families = [netifaces.AF_INET]
+        addr_families = [socket.AF_INET]
         if self.options.get("ipv6_support", True):
-            addr_families.append(netifaces.AF_INET6)
+            addr_families.append(socket.AF_INET6)
 
         max_count = self.options.get("max_count", 2)
         # Consistency with other entries' configuration: Infinite count if false.
@@ -46,39 +134,115 @@ class LanIP(Entry):
 
         self.value = list(
             islice(
-                self._lan_ip_addresses_generator(addr_families, show_global, show_link_local),
+                self._lan_ip_addresses_generator(
+                    interfaces_addresses, addr_families, show_global, show_link_local
+                ),
                 max_count,
             )
         )
 
+    @staticmethod
+    def _select_interfaces(
+        if_names: Iterable[str],
+        interface_include: Optional[List[str]],
+        interface_exclude: List[str],
+        default_route_interfaces: List[str],
+    ) -> List[str]:
+        """
+        Filter interface names according to include/exclude (`fnmatch`) patterns, and order them
+          so default route interfaces come first (`max_count` may then be reached sooner).
+        """
+        selected_interfaces = [
+            if_name
+            for if_name in if_names
+            if (
+                interface_include is None
+                or any(fnmatch(if_name, pattern) for pattern in interface_include)
+            )
+            and not any(fnmatch(if_name, pattern) for pattern in interface_exclude)
+        ]
+
+        # `sorted` is stable, so other interfaces keep their original order.
+        return sorted(
+            selected_interfaces,
+            key=lambda if_name: (
+                default_route_interfaces.index(if_name)
+                if if_name in default_route_interfaces
+                else len(default_route_interfaces)
+            ),
+        )
+
+    @staticmethod
+    def _netifaces_interfaces_addresses(
+        if_names: Iterable[str],
+    ) -> Iterator[Tuple[str, List[Tuple[int, bytes]]]]:
+        """
+        Generator yielding interfaces IP addresses (as `(address family, packed address)` tuples)
+          from `netifaces`, so they can be lazily fetched.
+        """
+        # Loop through passed network interfaces.
+        for if_name in if_names:
+            # Fetch associated addresses elements.
+            if_addrs = netifaces.ifaddresses(if_name)
+
+            addresses: List[Tuple[int, bytes]] = []
+            for netifaces_family, addr_family in (
+                (netifaces.AF_INET, socket.AF_INET),
+                (netifaces.AF_INET6, socket.AF_INET6),
+            ):
+                for if_addr in if_addrs.get(netifaces_family, []):
+                    try:
+                        # IPv6 addresses may contain '%' token separator.
+                        addresses.append(
+                            (
+                                addr_family,
+                                socket.inet_pton(addr_family, if_addr["addr"].split("%")[0]),
+                            )
+                        )
+                    except OSError:
+                        continue
+
+            yield if_name, addresses
+
     @staticmethod
     def _lan_ip_addresses_generator(
-        addr_families: list, show_global: bool, show_link_local: bool
+        interfaces_addresses: Iterable[Tuple[str, List[Tuple[int, bytes]]]],
+        addr_families: list,
+        show_global: bool,
+        show_link_local: bool,
     ) -> Iterator[str]:
         """Generator yielding local IP address according to passed address families"""
-        # Loop through all available network interfaces.
-        for if_name in netifaces.interfaces():
-            # Fetch associated addresses elements.
-            if_addrs = netifaces.ifaddresses(if_name)
 
+        def _in_networks(addr_family: int, ip_addr: int, networks: dict) -> bool:
+            return any(
+                ip_addr & mask == network_addr for network_addr, mask in networks[addr_family]
+            )
+
+        # Loop through all available network interfaces.
+        for _, if_addrs in interfaces_addresses:
             for addr_family in addr_families:
-                for if_addr in if_addrs.get(addr_family, []):
-                    # IPv6 addresses may contain '%' token separator.
-                    ip_addr = ipaddress.ip_address(if_addr["addr"].split("%")[0])
+                for if_addr_family, packed_addr in if_addrs:
+                    if if_addr_family != addr_family:
+                        continue
+
+                    ip_addr = int.from_bytes(packed_addr, "big")
 
                     # Filter out loopback and public/link-local IP addresses (if enabled).
                     if (
-                        not ip_addr.is_loopback
-                        and (not ip_addr.is_global or show_global)
-                        and (not ip_addr.is_link_local or show_link_local)
+                        not _in_networks(addr_family, ip_addr, LOOPBACK_NETWORKS)
+                        and (show_global or _in_networks(addr_family, ip_addr, NON_GLOBAL_NETWORKS))
+                        and (
+                            show_link_local
+                            or not _in_networks(addr_family, ip_addr, LINK_LOCAL_NETWORKS)
+                        )
                     ):
                         # Finally, yield the address compressed representation.
-                        yield ip_addr.compressed
+                        yield socket.inet_ntop(addr_family, packed_addr)
 
     def output(self, output) -> None:
         """Adds the entry to `output` after pretty-formatting the IP address list."""
         # If we found IP addresses, join them together nicely.
-        # If not, fall back on default strings according to `netifaces` availability.
+        # If not, fall back on default strings according to addresses enumeration availability.
         if self.value:
             if not self.options.get("one_line", True):
                 # One-line output has been disabled, add one IP address per item.
@@ -89,7 +253,7 @@ class LanIP(Entry):
 
             text_output = ", ".join(self.value)
 
-        elif netifaces:
+        elif self.value is not None:
             text_output = self._default_strings.get("no_address")
         else:
             text_output = self._default_strings.get("not_detected")
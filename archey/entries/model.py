@@ -4,11 +4,13 @@ import contextlib
 import os
 import platform
 import re
-from subprocess import DEVNULL, CalledProcessError, check_output
+from subprocess import DEVNULL, SubprocessError, TimeoutExpired
 from typing import Optional
 
+from archey.command import check_output
 from archey.distributions import Distributions
 from archey.entry import Entry
+from archey.pseudo_files import PseudoFiles
 
 LINUX_DMI_SYS_PATH = "/sys/devices/virtual/dmi/id"
 LINUX_DMI_FUZZY_PATTERNS = [
@@ -61,7 +63,7 @@ class Model(Entry):
             return check_output(
                 "systemd-detect-virt", stderr=DEVNULL, universal_newlines=True
             ).rstrip()
-        except CalledProcessError:
+        except SubprocessError:
             # Not a virtual environment.
             return None
         except OSError:
@@ -77,7 +79,7 @@ class Model(Entry):
                     )
                     or None
                 )
-            except (OSError, CalledProcessError):
+            except (OSError, SubprocessError):
                 return None
 
     @staticmethod
@@ -136,7 +138,7 @@ class Model(Entry):
                 )
             except OSError:
                 return None
-            except CalledProcessError:
+            except SubprocessError:
                 pass
             else:
                 return model.rstrip().replace(",", ".")
@@ -150,7 +152,7 @@ class Model(Entry):
                 )
             except OSError:
                 return None
-            except CalledProcessError:
+            except SubprocessError:
                 pass
             else:
                 sysctl_output = sysctl_output.rstrip()
@@ -168,8 +170,7 @@ class Model(Entry):
             return f_model.read().rstrip()
 
         try:
-            with open("/proc/cpuinfo", encoding="ASCII") as f_cpu_info:
-                cpu_info = f_cpu_info.read()
+            cpu_info = PseudoFiles().read("/proc/cpuinfo")
         except OSError:
             return None
 
@@ -193,7 +194,7 @@ class Model(Entry):
         try:
             brand = check_output(["getprop", "ro.product.brand"], universal_newlines=True).rstrip()
             model = check_output(["getprop", "ro.product.model"], universal_newlines=True).rstrip()
-        except OSError:
+        except (OSError, TimeoutExpired):
             return None
 
         return f"{brand} ({model})"
@@ -206,7 +207,7 @@ class Model(Entry):
             product = check_output(
                 ["kenv", "smbios.system.version"], universal_newlines=True
             ).rstrip()
-        except (OSError, CalledProcessError):
+        except (OSError, SubprocessError):
             return None
 
         return f"{vendor} ({product})"
@@ -1,17 +1,20 @@
 """Number of installed packages detection class"""
 
-import os
 import typing
 from contextlib import suppress
-from subprocess import DEVNULL, CalledProcessError, check_output
+from subprocess import DEVNULL, SubprocessError, TimeoutExpired
 
+from archey.command import check_output, count_output
 from archey.distributions import Distributions
 from archey.entry import Entry
 
+# Some packages tools may be (very) slow, especially on a cold cache (e.g. `emerge -ep world`).
+PACKAGES_TOOLS_TIMEOUT = 300.0
+
 
 def get_homebrew_cellar_path() -> str:
     """Return Homebrew Cellar path (if available)"""
-    with suppress(OSError, CalledProcessError):
+    with suppress(OSError, SubprocessError):
         return check_output(["brew", "--cellar"], stderr=DEVNULL, universal_newlines=True).rstrip()
 
     return "/usr/local/Cellar/"
@@ -65,33 +68,27 @@ class Packages(Entry):
             ):
                 continue
 
+            pkg_tool_name = packages_tool.get("name", packages_tool["cmd"][0])
+
+            # Outputs are only line-counted, so they are consumed as streams (some of them, like
+            #  `emerge -ep world` ones, may be large).
+            # For DPKG only, not purged packages are counted too, so they may be removed.
             try:
-                results = check_output(
+                count, *deinstall_count = count_output(
                     packages_tool["cmd"],
+                    ((b"\n", b"deinstall") if pkg_tool_name == "dpkg" else (b"\n",)),
                     stderr=DEVNULL,
-                    env={
-                        # Honor current process environment variables as some package managers
-                        #  require an extended `PATH`.
-                        **os.environ,
-                        "LANG": "C",
-                    },
-                    universal_newlines=True,
+                    c_locale=True,
+                    timeout=PACKAGES_TOOLS_TIMEOUT,
                 )
-            except (OSError, CalledProcessError):
+            except TimeoutExpired:
+                self._logger.warning("%s timed out, its packages are not counted.", pkg_tool_name)
+                continue
+            except (OSError, SubprocessError):
                 continue
-
-            # Here we *may* use `\n` as `universal_newlines` has been set.
-            count = results.count("\n")
 
             # If any, deduct output skew present due to the packages tool itself.
-            if "skew" in packages_tool:
-                count -= packages_tool["skew"]
-
-            pkg_tool_name = packages_tool.get("name", packages_tool["cmd"][0])
-
-            # For DPKG only, remove any not purged package.
-            if pkg_tool_name == "dpkg":
-                count -= results.count("deinstall")
+            count -= packages_tool.get("skew", 0) + sum(deinstall_count)
 
             self.value[pkg_tool_name] = count
 
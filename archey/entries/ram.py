@@ -4,12 +4,25 @@ import os
 import platform
 import re
 from contextlib import suppress
-from subprocess import check_output
+from subprocess import TimeoutExpired
 from typing import Tuple
 
 from archey.colors import Colors
+from archey.command import check_output
 from archey.entry import Entry
 from archey.exceptions import ArcheyException
+from archey.pseudo_files import PseudoFiles
+from archey.record import Record
+
+
+class RAMValue(Record):
+    """RAM usage, expressed in `unit`"""
+
+    __slots__ = ("used", "total", "unit")
+
+    used: float
+    total: float
+    unit: str
 
 
 class RAM(Entry):
@@ -19,6 +32,7 @@ class RAM(Entry):
     """
 
     _ICON = "\U000f035b"  # md_memory
+    _VALUE_RECORD = RAMValue
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -27,11 +41,7 @@ class RAM(Entry):
         if not total:
             return
 
-        self.value = {
-            "used": used,
-            "total": total,
-            "unit": "MiB",
-        }
+        self.value = RAMValue(used, total, "MiB")
 
     def _get_used_total_values(self) -> Tuple[float, float]:
         """
@@ -39,14 +49,14 @@ class RAM(Entry):
         Tries a variety of methods, increasing compatibility for a wide range of systems.
         """
         if platform.system() == "Linux":
-            with suppress(IndexError, OSError):
+            with suppress(IndexError, OSError, TimeoutExpired):
                 return self._run_free_dash_m()
         elif platform.system() == "FreeBSD":
-            with suppress(OSError):
+            with suppress(OSError, TimeoutExpired):
                 return self._run_sysctl_mem()
         else:
             # Darwin or any other BSD-based system.
-            with suppress(OSError):
+            with suppress(OSError, TimeoutExpired):
                 return self._run_sysctl_and_vmstat()
 
         with suppress(OSError):
@@ -60,9 +70,7 @@ class RAM(Entry):
         memory_usage = "".join(
             filter(
                 re.compile(r"Mem").search,
-                check_output(
-                    ["free", "-m"], env={"LANG": "C"}, universal_newlines=True
-                ).splitlines(),
+                check_output(["free", "-m"], c_locale=True, universal_newlines=True).splitlines(),
             )
         ).split()
 
@@ -71,8 +79,7 @@ class RAM(Entry):
     @staticmethod
     def _read_proc_meminfo() -> Tuple[float, float]:
         """Same behavior but by reading from `/proc/meminfo` directly"""
-        with open("/proc/meminfo", encoding="ASCII") as f_mem_info:
-            mem_info_lines = f_mem_info.read().splitlines()
+        mem_info_lines = PseudoFiles().read("/proc/meminfo").splitlines()
 
         # Store memory information into a dictionary.
         mem_info = {}
@@ -164,9 +171,7 @@ class RAM(Entry):
             return
 
         # DRY some constants
-        used = self.value["used"]
-        total = self.value["total"]
-        unit = self.value["unit"]
+        used, total, unit = self.value
 
         # Based on the RAM percentage usage, select the corresponding level color.
         level_color = Colors.get_level_color(
@@ -1,9 +1,10 @@
 """Shell detection class"""
 
 import os
-from subprocess import CalledProcessError, check_output
+from subprocess import SubprocessError
 from typing import Optional
 
+from archey.command import check_output
 from archey.entry import Entry
 
 
@@ -34,7 +35,7 @@ class Shell(Entry):
                 .rstrip()
                 .rsplit(":", maxsplit=1)[-1]
             )
-        except CalledProcessError:
+        except SubprocessError:
             # Ghost user...
             return None
 
@@ -5,16 +5,23 @@ import os
 import platform
 import re
 import shutil
+import time
+from fnmatch import fnmatch
 from glob import iglob
-from subprocess import DEVNULL, PIPE, CalledProcessError, check_output, run
-from typing import List, Optional
+from subprocess import DEVNULL, PIPE, CalledProcessError, SubprocessError, TimeoutExpired
+from threading import Thread
+from typing import Dict, List, Optional, cast
 
+from archey.command import check_output, run
 from archey.entry import Entry
 
+LINUX_HWMON_SYS_PATH = "/sys/class/hwmon"
+
 
 class Temperature(Entry):
     """
-    Tries to compute an average temperature from `sensors` (LM-Sensors).
+    Tries to compute an average temperature from hwmon sysfs interface (GNU/Linux), as `sensors`
+      (LM-Sensors) would do, or from `sensors` itself.
     If not available, falls back on system thermal zones files (GNU/Linux)
       or `sysctl` output for BSD and derivatives systems.
     On Raspberry devices, retrieves temperature from the `vcgencmd` binary.
@@ -22,15 +29,31 @@ class Temperature(Entry):
 
     _ICON = "\U000f1a45"  # md_heat_wave
 
+    # Background thread (if any) polling sysfs sensors during the sampling window.
+    _sampler: Optional[Thread] = None
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self._temps: List[float] = []
 
-        # Tries `sensors` at first.
-        self._run_sensors(
-            self.options.get("sensors_chipsets"), self.options.get("sensors_excluded_subfeatures")
-        )
+        # Native sysfs sensors (name -> input file path) and their temperature samples.
+        self._sysfs_sensors: Dict[str, str] = {}
+        self._samples: Dict[str, List[float]] = {}
+
+        # On GNU/Linux, natively reads hwmon sysfs interface at first (without forking `sensors`).
+        if platform.system() == "Linux":
+            self._poll_hwmon_sysfs(
+                self.options.get("sensors_chipsets"),
+                self.options.get("sensors_excluded_subfeatures"),
+            )
+
+        # Tries `sensors` then.
+        if not self._temps:
+            self._run_sensors(
+                self.options.get("sensors_chipsets"),
+                self.options.get("sensors_excluded_subfeatures"),
+            )
 
         # On error (list still empty)...
         if not self._temps:
@@ -46,9 +69,56 @@ class Temperature(Entry):
         # Tries `vcgencmd` for Raspberry devices.
         self._run_vcgencmd()
 
+        # Each input source has been read once so far (samples don't count as sources).
+        self._sources_count = len(self._temps)
+
+        # When sampling has been enabled, keep polling sysfs sensors in background.
+        # Sampling window thus overlaps other entries work, and will only be waited for when
+        #  `value` is actually accessed.
+        sample_count = self.options.get("sample_count", 1)
+        if sample_count > 1 and self._sysfs_sensors:
+            self._sampler = Thread(
+                target=self._sample_sysfs_sensors,
+                args=(sample_count - 1, self.options.get("sample_interval", 0.25)),
+                daemon=True,
+            )
+            self._sampler.start()
+            return
+
+        self.value = self._compute_value()
+
+    @classmethod
+    def from_value(cls, *args, **kwargs) -> "Temperature":
+        entry = cast(Temperature, super().from_value(*args, **kwargs))
+
+        # Only aggregated values are known : maximum is shown when it differs from average.
+        entry._sampler = None
+        entry._temps = []
+        if entry.value:
+            entry._temps = list({entry.value["temperature"], entry.value["max_temperature"]})
+        entry._sources_count = len(entry._temps)
+
+        return entry
+
+    @property
+    def value(self) -> Optional[dict]:
+        """Wait for any on-going sampling before (lazily) computing entry value"""
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+            self._value = self._compute_value()
+
+        return self._value
+
+    @value.setter
+    def value(self, value: Optional[dict]) -> None:
+        self._value = value
+
+    def _compute_value(self) -> Optional[dict]:
+        """Compute entry value from gathered temperatures (or samples)"""
         # No value could be fetched, leave `self.value` to `None`.
         if not self._temps:
-            return
+            return None
 
         # Let's DRY some constants once.
         use_fahrenheit = self.options.get("use_fahrenheit")
@@ -57,15 +127,112 @@ class Temperature(Entry):
         # Conversion to Fahrenheit if needed.
         if use_fahrenheit:
             self._temps = list(map(self._convert_to_fahrenheit, self._temps))
+            for sensor_name, samples in self._samples.items():
+                self._samples[sensor_name] = list(map(self._convert_to_fahrenheit, samples))
 
         # Final average and maximum computations.
-        self.value = {
+        value = {
             "temperature": float(round(sum(self._temps) / len(self._temps), 1)),
             "max_temperature": float(round(max(self._temps), 1)),
             "char_before_unit": char_before_unit,
             "unit": ("F" if use_fahrenheit else "C"),
         }
 
+        # When samples have been gathered, additionally expose per-sensor windowed values.
+        if self.options.get("sample_count", 1) > 1 and self._samples:
+            value["sensors"] = {
+                sensor_name: {
+                    "temperature": float(round(sum(samples) / len(samples), 1)),
+                    "max_temperature": float(round(max(samples), 1)),
+                }
+                for sensor_name, samples in self._samples.items()
+                if samples
+            }
+
+        return value
+
+    def _sample_sysfs_sensors(self, samples_count: int, sample_interval: float) -> None:
+        """Poll (already discovered) sysfs sensors `samples_count` more times"""
+        for _ in range(samples_count):
+            time.sleep(sample_interval)
+
+            for sensor_name, input_path in self._sysfs_sensors.items():
+                temp = self._read_sysfs_temperature(input_path)
+                if temp is not None:
+                    self._samples[sensor_name].append(temp)
+                    self._temps.append(temp)
+
+    @staticmethod
+    def _read_sysfs_temperature(input_path: str) -> Optional[float]:
+        """Read a (non-null) temperature in Celsius from a sysfs millidegree input file"""
+        try:
+            with open(input_path, encoding="ASCII") as f_input:
+                temp = float(f_input.read())
+        except (OSError, ValueError):
+            return None
+
+        # Some chips/adapters might return null temperatures.
+        if temp == 0.0:
+            return None
+
+        return temp / 1000
+
+    def _poll_hwmon_sysfs(
+        self,
+        whitelisted_chips: Optional[List[str]] = None,
+        excluded_subfeatures: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Walk hwmon sysfs interface to retrieve the same temperatures as `sensors -A -j` would.
+        See <https://www.kernel.org/doc/html/latest/hwmon/sysfs-interface.html>.
+
+        Whitelisted chips are matched against hwmon `name` attribute, as (glob) patterns. Full
+          LM-Sensors chip identifiers (e.g. `coretemp-isa-0000`) don't match any, so they are
+          left to `sensors`.
+        Excluded subfeatures are matched against `temp*_label` attributes (when available), or
+          against their `temp*` prefix (as `sensors` would do).
+        """
+
+        def _read_hwmon_attribute(attribute_path: str) -> Optional[str]:
+            try:
+                with open(attribute_path, encoding="ASCII") as f_attribute:
+                    return f_attribute.read().rstrip()
+            except (OSError, UnicodeDecodeError):
+                return None
+
+        for hwmon_path in iglob(os.path.join(LINUX_HWMON_SYS_PATH, "hwmon*")):
+            chip_name = _read_hwmon_attribute(os.path.join(hwmon_path, "name"))
+            if chip_name is None:
+                continue
+
+            # Has this chip been whitelisted in configuration ?
+            if whitelisted_chips and not any(
+                fnmatch(chip_name, whitelisted_chip) for whitelisted_chip in whitelisted_chips
+            ):
+                continue
+
+            for temp_input_path in iglob(os.path.join(hwmon_path, "temp*_input")):
+                temp_prefix = temp_input_path[: -len("_input")]
+
+                # Subfeatures are named after their label (if any), as `sensors` would do.
+                subfeature_name = _read_hwmon_attribute(f"{temp_prefix}_label") or os.path.basename(
+                    temp_prefix
+                )
+
+                # Has this subfeature been explicitly excluded in configuration ?
+                if excluded_subfeatures and subfeature_name in excluded_subfeatures:
+                    continue
+
+                temp = self._read_sysfs_temperature(temp_input_path)
+                if temp is None:
+                    continue
+
+                # Remember this sensor for (optional) sampling.
+                sensor_name = f"{chip_name}/{subfeature_name}"
+                self._sysfs_sensors[sensor_name] = temp_input_path
+                self._samples[sensor_name] = [temp]
+                self._temps.append(temp)
+
     def _run_sensors(
         self,
         whitelisted_chips: Optional[List[str]] = None,
@@ -84,8 +251,8 @@ class Temperature(Entry):
                 )
             except OSError:
                 return None
-            except CalledProcessError as called_process_error:
-                error_message = called_process_error.stderr
+            except (CalledProcessError, TimeoutExpired) as subprocess_error:
+                error_message = subprocess_error.stderr
                 return None
             else:
                 error_message = sensors_output.stderr
@@ -139,14 +306,15 @@ class Temperature(Entry):
     def _poll_thermal_zones(self) -> None:
         # We just check for values within files present in the path below.
         for thermal_file in iglob(r"/sys/class/thermal/thermal_zone*/temp"):
-            try:
-                with open(thermal_file, encoding="ASCII") as file:
-                    temp = float(file.read())
-            except OSError:
+            temp = self._read_sysfs_temperature(thermal_file)
+            if temp is None:
                 continue
 
-            if temp != 0.0:
-                self._temps.append(temp / 1000)
+            # Remember this sensor (named after its thermal zone) for (optional) sampling.
+            sensor_name = os.path.basename(os.path.dirname(thermal_file))
+            self._sysfs_sensors[sensor_name] = thermal_file
+            self._samples[sensor_name] = [temp]
+            self._temps.append(temp)
 
     def _run_istats_or_osxcputemp(self) -> None:
         """
@@ -159,7 +327,7 @@ class Temperature(Entry):
             istats_output = check_output(
                 ["istats", "cpu", "temperature", "--value-only"], universal_newlines=True
             )
-        except OSError:
+        except (OSError, TimeoutExpired):
             pass
         else:
             self._temps.append(float(istats_output))
@@ -168,7 +336,7 @@ class Temperature(Entry):
         # Run OSX CPU Temp binary (<https://github.com/lavoiesl/osx-cpu-temp>).
         try:
             osxcputemp_output = check_output("osx-cpu-temp", universal_newlines=True)
-        except OSError:
+        except (OSError, TimeoutExpired):
             pass
         else:
             # Parse output across <= 1.1.0 versions and above.
@@ -190,7 +358,7 @@ class Temperature(Entry):
         except OSError:
             # `sysctl` does not seem to be available on this system.
             return
-        except CalledProcessError as error_message:
+        except (CalledProcessError, TimeoutExpired) as error_message:
             self._logger.warning(
                 "[sysctl]: Couldn't fetch temperature from CPU sensors (%s). "
                 "Please be sure to load the corresponding kernel driver beforehand "
@@ -214,7 +382,7 @@ class Temperature(Entry):
             vcgencmd_output = check_output(
                 [vcgencmd_path, "measure_temp"], stderr=DEVNULL, universal_newlines=True
             )
-        except (FileNotFoundError, CalledProcessError):
+        except (FileNotFoundError, SubprocessError):
             return
 
         temp_match = re.search(r"\d+\.\d+", vcgencmd_output)
@@ -239,7 +407,7 @@ class Temperature(Entry):
 
         entry_text = f"{self.value['temperature']}{char_before_unit}{unit}"
         # When there are multiple input sources, show the hottest value.
-        if len(self._temps) > 1:
+        if self._sources_count > 1:
             entry_text += f" (Max. {self.value['max_temperature']}{char_before_unit}{unit})"
 
         output.append(self.name, entry_text)
@@ -4,16 +4,31 @@ import re
 import time
 from contextlib import suppress
 from datetime import timedelta
-from subprocess import PIPE, run
+from subprocess import PIPE, TimeoutExpired
 
+from archey.command import run
 from archey.entry import Entry
 from archey.exceptions import ArcheyException
+from archey.pseudo_files import PseudoFiles
+from archey.record import Record
+
+
+class UptimeValue(Record):
+    """Uptime, split into days, hours, minutes and seconds"""
+
+    __slots__ = ("days", "hours", "minutes", "seconds")
+
+    days: int
+    hours: int
+    minutes: int
+    seconds: int
 
 
 class Uptime(Entry):
     """Returns a pretty-formatted string representing the host uptime"""
 
     _ICON = "\U000f1925"  # md_timer_cog
+    _VALUE_RECORD = UptimeValue
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -24,7 +39,7 @@ class Uptime(Entry):
         hours, uptime_seconds = divmod(uptime_seconds, 3600)
         minutes, seconds = divmod(uptime_seconds, 60)
 
-        self.value = {"days": days, "hours": hours, "minutes": minutes, "seconds": seconds}
+        self.value = UptimeValue(days, hours, minutes, seconds)
 
     def _get_uptime_delta(self) -> timedelta:
         """
@@ -54,8 +69,7 @@ class Uptime(Entry):
     @staticmethod
     def _proc_file_uptime() -> timedelta:
         """Tries to get uptime using the `/proc/uptime` file"""
-        with open("/proc/uptime", encoding="ASCII") as f_uptime:
-            return timedelta(seconds=float(f_uptime.read().split()[0]))
+        return timedelta(seconds=float(PseudoFiles().read("/proc/uptime").split()[0]))
 
     @staticmethod
     def _clock_uptime() -> timedelta:
@@ -71,9 +85,11 @@ class Uptime(Entry):
     def _parse_uptime_cmd(self) -> timedelta:
         """Tries to get uptime by parsing the `uptime` command"""
         try:
-            uptime_output = run("uptime", env={"LANG": "C"}, stdout=PIPE, stderr=PIPE, check=True)
+            uptime_output = run("uptime", c_locale=True, stdout=PIPE, stderr=PIPE, check=True)
         except (FileNotFoundError, NotADirectoryError) as error:
             raise ArcheyException("Couldn't find `uptime` command on this system.") from error
+        except TimeoutExpired as error:
+            raise ArcheyException("`uptime` command timed out.") from error
 
         # Log any `uptime` error messages at warning level.
         if uptime_output.stderr:
@@ -149,9 +165,7 @@ class Uptime(Entry):
 
     def output(self, output) -> None:
         """Adds the entry to `output` after pretty-formatting the uptime to a string."""
-        days = self.value["days"]
-        hours = self.value["hours"]
-        minutes = self.value["minutes"]
+        days, hours, minutes, _ = self.value
 
         uptime = ""
         if days:
@@ -1,13 +1,15 @@
 """Public IP address detection class"""
 
-from socket import timeout as SocketTimeoutError
-from subprocess import DEVNULL, CalledProcessError, TimeoutExpired, check_output
-from typing import Optional
-from urllib.error import URLError
-from urllib.request import urlopen
+import time
+from http.client import HTTPException
+from threading import Thread
+from typing import Dict, List, Optional
 
+from archey.cache import Cache
 from archey.entry import Entry
 from archey.environment import Environment
+from archey.http_client import HTTPClient
+from archey.network import Network
 
 
 class WanIP(Entry):
@@ -24,18 +26,84 @@ class WanIP(Entry):
         if Environment.DO_NOT_TRACK:
             return
 
-        ipv4_addr = self._retrieve_ip_address(4)
-        if ipv4_addr:
-            self.value.append(ipv4_addr)
+        # Public addresses are cached as long as local network context does not change.
+        cache_ttl = self.options.get("cache_ttl", 3600)
+        if not cache_ttl:
+            self.value = self._retrieve_ip_addresses()
+            return
+
+        cache = Cache("wan_ip")
+        fingerprint = {
+            "network": self._get_network_fingerprint(),
+            "ipv4": self.options.get("ipv4"),
+            "ipv6": self.options.get("ipv6"),
+        }
+
+        cached_ip_addresses = cache.get("ip_addresses", cache_ttl, fingerprint)
+        if isinstance(cached_ip_addresses, list):
+            self.value = cached_ip_addresses
+            return
 
-        ipv6_addr = self._retrieve_ip_address(6)
-        if ipv6_addr:
-            self.value.append(ipv6_addr)
+        self.value = self._retrieve_ip_addresses()
 
-    def _retrieve_ip_address(self, ip_version: int) -> Optional[str]:
+        # Don't cache retrieval failures (we may be temporarily offline).
+        if self.value:
+            cache.set("ip_addresses", self.value, fingerprint)
+
+    @staticmethod
+    def _get_network_fingerprint() -> dict:
+        """
+        Return default routes (gateways) and their interfaces addresses, which public IP addresses
+          are very likely to change with.
+        """
+        default_routes = Network.get_default_routes()
+
+        try:
+            interfaces_addresses = Network.get_interfaces_addresses()
+        except OSError:
+            interfaces_addresses = {}
+
+        return {
+            "routes": default_routes,
+            "addresses": {
+                if_name: sorted(
+                    packed_addr.hex() for _, packed_addr in interfaces_addresses.get(if_name, [])
+                )
+                for if_name, _ in default_routes
+            },
+        }
+
+    def _retrieve_ip_addresses(self) -> List[str]:
+        """
+        IPv4 and IPv6 addresses (and their fallback chains) are retrieved concurrently, under a
+          single entry-level deadline.
+        """
+        deadline = time.monotonic() + self.options.get("timeout", 2)
+
+        ip_addresses: Dict[int, Optional[str]] = {}
+
+        def _retrieve(ip_version: int) -> None:
+            ip_addresses[ip_version] = self._retrieve_ip_address(ip_version, deadline)
+
+        # Daemon threads, so late retrievals won't hold the process back at exit.
+        threads = [
+            Thread(target=_retrieve, args=(ip_version,), daemon=True) for ip_version in (4, 6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(max(deadline - time.monotonic(), 0))
+
+        # Keep whatever finished in time.
+        return [ip_address for ip_address in map(ip_addresses.get, (4, 6)) if ip_address]
+
+    def _retrieve_ip_address(
+        self, ip_version: int, deadline: Optional[float] = None
+    ) -> Optional[str]:
         """
         Best effort to retrieve public IP address based on corresponding options.
-        We are trying special DNS resolutions first for performance and (system) caching purposes.
+        We are trying special DNS resolutions first (in-process) for performance purposes.
+        Each back-end timeout is capped so retrieval is over by `deadline` (monotonic clock).
         """
         options = self.options.get(f"ipv{ip_version}", {})
 
@@ -43,15 +111,20 @@ class WanIP(Entry):
         if not options and not isinstance(options, dict):
             return None
 
+        def _capped_timeout(timeout: float) -> float:
+            if deadline is None:
+                return timeout
+            return min(timeout, deadline - time.monotonic())
+
         # Is retrieval via DNS query enabled ?
         dns_query = options.get("dns_query", "myip.opendns.com")
         if dns_query:
             # Run the DNS query.
-            ip_address = self._run_dns_query(
+            ip_address = Network.run_dns_query(
                 dns_query,
                 options.get("dns_resolver", "resolver1.opendns.com"),
                 ip_version,
-                options.get("dns_timeout", 1),
+                _capped_timeout(options.get("dns_timeout", 1)),
             )
             # Return IP only if the query was successful
             if ip_address is not None:
@@ -62,39 +135,24 @@ class WanIP(Entry):
         if not http_url:
             return None
 
-        # Run the HTTP(S) request.
-        return self._run_http_request(http_url, options.get("http_timeout", 1))
-
-    @staticmethod
-    def _run_dns_query(query: str, resolver: str, ip_version: int, timeout: float) -> Optional[str]:
-        """Simple wrapper to `dig` command to perform DNS queries"""
-        try:
-            ip_address = check_output(
-                [
-                    "dig",
-                    "+short",
-                    ("-" + str(ip_version)),
-                    ("AAAA" if ip_version == 6 else "A"),
-                    query,
-                    "@" + resolver,
-                ],
-                timeout=timeout,
-                stderr=DEVNULL,
-                universal_newlines=True,
-            ).rstrip()
-        except (OSError, TimeoutExpired, CalledProcessError):
+        # Is there still time for it ?
+        http_timeout = _capped_timeout(options.get("http_timeout", 1))
+        if http_timeout <= 0:
             return None
 
-        # `ip_address` might be empty here.
-        return ip_address
+        # Run the HTTP(S) request.
+        return self._run_http_request(http_url, http_timeout)
 
     @staticmethod
     def _run_http_request(server_url: str, timeout: float) -> Optional[str]:
-        """Simple wrapper to `urllib` module to perform HTTP requests"""
+        """Simple wrapper to (shared) HTTP client to perform HTTP requests"""
         try:
-            with urlopen(server_url, timeout=timeout) as http_request:
-                return http_request.read().decode().strip()
-        except (URLError, SocketTimeoutError):
+            with HTTPClient().request(server_url, timeout) as http_response:
+                if http_response.status != 200:
+                    return None
+
+                return http_response.read().decode().strip()
+        except (OSError, HTTPException):
             return None
 
     def output(self, output) -> None:
@@ -3,10 +3,13 @@
 import os
 import platform
 import re
-from subprocess import DEVNULL, CalledProcessError, check_output
+from subprocess import DEVNULL, SubprocessError
+from typing import Optional
 
+from archey.command import check_output
 from archey.entry import Entry
 from archey.processes import Processes
+from archey.record import Record
 
 WM_DICT = {
     "Amethyst": "Amethyst",
@@ -58,6 +61,15 @@ DSP_DICT = {
 }
 
 
+class WindowManagerValue(Record):
+    """Window manager and display server protocol names (when detected)"""
+
+    __slots__ = ("name", "display_server_protocol")
+
+    name: Optional[str]
+    display_server_protocol: Optional[str]
+
+
 class WindowManager(Entry):
     """
     Uses `wmctrl` to retrieve some information about the window manager.
@@ -65,6 +77,7 @@ class WindowManager(Entry):
     """
 
     _ICON = "\ueae4"  # cod_empty_window
+    _VALUE_RECORD = WindowManagerValue
     _PRETTY_NAME = "Window Manager"
 
     def __init__(self, *args, **kwargs):
@@ -76,7 +89,7 @@ class WindowManager(Entry):
                 r"(?<=Name: ).*",
                 check_output(["wmctrl", "-m"], stderr=DEVNULL, universal_newlines=True),
             ).group(0)
-        except (OSError, CalledProcessError):
+        except (OSError, SubprocessError):
             processes = Processes().list
             for wm_id, wm_name in WM_DICT.items():
                 if wm_id in processes:
@@ -90,19 +103,16 @@ class WindowManager(Entry):
 
         display_server_protocol = DSP_DICT.get(os.getenv("XDG_SESSION_TYPE", ""))
 
-        self.value = {
-            "name": name,
-            "display_server_protocol": display_server_protocol,
-        }
+        self.value = WindowManagerValue(name, display_server_protocol)
 
     def output(self, output) -> None:
         # No WM could be detected.
-        if self.value["name"] is None:
+        if self.value.name is None:
             output.append(self.name, self._default_strings.get("not_detected"))
             return
 
-        text_output = self.value["name"]
-        if self.value["display_server_protocol"] is not None:
-            text_output += f" ({self.value['display_server_protocol']})"
+        text_output = self.value.name
+        if self.value.display_server_protocol is not None:
+            text_output += f" ({self.value.display_server_protocol})"
 
         output.append(self.name, text_output)
@@ -3,9 +3,10 @@
 import logging
 from abc import ABC as AbstractBaseClass
 from abc import abstractmethod
-from typing import Optional
+from typing import Optional, Type
 
 from archey.configuration import Configuration
+from archey.record import Record
 
 
 class Entry(AbstractBaseClass):
@@ -13,6 +14,8 @@ class Entry(AbstractBaseClass):
 
     _ICON: Optional[str] = None
     _PRETTY_NAME: Optional[str] = None
+    # Record type of `value` (when structured), see `archey.record`.
+    _VALUE_RECORD: Optional[Type[Record]] = None
 
     def __new__(cls, *_, **kwargs):
         """Hook object instantiation to handle our particular `disabled` config field"""
@@ -29,14 +32,9 @@ class Entry(AbstractBaseClass):
         # `name`: key (defaults to the instantiated entry class name);
         # `value`: value of entry as an appropriate object;
         # `options`: configuration options *specific* to an entry instance;
-        self.name = name or self._PRETTY_NAME or self.__class__.__name__
-        self.value = value
         self.options = options or {}
-
-        # optionally prepend entry name with an icon
-        icon = self.options.get("icon", self._ICON)
-        if icon is not None and configuration.get("entries_icon"):
-            self.name = f"{icon} {self.name}"
+        self.name = self.get_display_name(name, self.options)
+        self.value = value
 
         # Propagates a reference to default strings specified in `Configuration`.
         self._default_strings = configuration.get("default_strings")
@@ -44,9 +42,55 @@ class Entry(AbstractBaseClass):
         # Provision a logger for each entry.
         self._logger = logging.getLogger(self.__module__)
 
+    @classmethod
+    def get_display_name(cls, name: Optional[str] = None, options: Optional[dict] = None) -> str:
+        """
+        Return entry name, defaulting to its "pretty name" (or class name), and optionally
+          prepended with an icon.
+        """
+        display_name = name or cls._PRETTY_NAME or cls.__name__
+
+        icon = (options or {}).get("icon", cls._ICON)
+        if icon is not None and Configuration().get("entries_icon"):
+            display_name = f"{icon} {display_name}"
+
+        return display_name
+
+    @classmethod
+    def from_value(cls, name: str, value, options: Optional[dict] = None) -> "Entry":
+        """
+        Build an entry out of an already known `value` (e.g. from a previous JSON serialization),
+          so it may be output without running any detection. `name` is kept as is.
+        Structured values are validated against entry value record schema.
+        """
+        if value is not None and cls._VALUE_RECORD is not None:
+            value = cls._VALUE_RECORD.from_dict(value)
+
+        entry = object.__new__(cls)
+        entry.name = name
+        entry.value = value
+        entry.options = options or {}
+        entry._default_strings = Configuration().get("default_strings")
+        entry._logger = logging.getLogger(cls.__module__)
+        return entry
+
     def __bool__(self) -> bool:
         return bool(self.value)
 
+    def __getstate__(self) -> dict:
+        """
+        Entries may be sent back from worker processes : they are pickled as plain data, with their
+          (possibly lazily computed) `value` resolved.
+        """
+        self.value = self.value
+        state = self.__dict__.copy()
+        del state["_logger"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._logger = logging.getLogger(self.__module__)
+
     def output(self, output) -> None:
         """Output the results to output. Can be overridden by subclasses."""
         if self.value:
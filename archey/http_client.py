@@ -0,0 +1,237 @@
+"""
+Simple HTTP client (acting as a singleton) shared by network-backed entries.
+Connections are kept alive (per server) and TLS sessions are resumed, so requests to the same server
+  don't pay TCP and TLS handshakes again. Responses may be (transparently) gzip-compressed.
+"""
+
+import http.client
+import ssl
+import typing
+import zlib
+from contextlib import contextmanager, suppress
+from threading import BoundedSemaphore, Lock
+from urllib.error import HTTPError
+from urllib.parse import urljoin, urlsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
+
+from archey.singleton import Singleton
+
+# Maximum number of requests being concurrently processed (across all entries).
+MAX_CONCURRENT_REQUESTS = 4
+
+# Maximum number of (followed) redirections.
+MAX_REDIRECTIONS = 5
+
+_ServerKey = typing.Tuple[str, str, int]
+
+
+class _HTTPSConnection(http.client.HTTPSConnection):
+    """`HTTPSConnection` resuming TLS sessions previously established with the same server"""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        timeout: float,
+        ssl_context: ssl.SSLContext,
+        tls_sessions: typing.Dict[typing.Tuple[str, int], ssl.SSLSession],
+    ):
+        super().__init__(host, port, timeout=timeout, context=ssl_context)
+        self._ssl_context = ssl_context
+        self._tls_sessions = tls_sessions
+
+    def connect(self) -> None:
+        # Establish TCP connection only, TLS layer is set up below.
+        http.client.HTTPConnection.connect(self)
+
+        self.sock = self._ssl_context.wrap_socket(
+            self.sock,
+            server_hostname=self.host,
+            session=self._tls_sessions.get((self.host, self.port)),
+        )
+
+    def save_tls_session(self) -> None:
+        """Remember current TLS session, so it may be resumed by future connections"""
+        if isinstance(self.sock, ssl.SSLSocket) and self.sock.session is not None:
+            self._tls_sessions[(self.host, self.port)] = self.sock.session
+
+
+class HTTPResponse:
+    """Minimal response object, transparently decoding gzip-compressed bodies"""
+
+    def __init__(self, status: int, headers, raw_response):
+        self.status = status
+        self.headers = headers
+        self._raw_response = raw_response
+
+        self._decompressor = None
+        if (headers.get("Content-Encoding") or "").lower() == "gzip":
+            self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    def read(self, amt: typing.Optional[int] = None) -> bytes:
+        """Read (at most `amt` bytes of raw) body, as `http.client.HTTPResponse.read` would"""
+        if self._decompressor is None:
+            return self._raw_response.read(amt)
+
+        if amt is None:
+            return self._decompressor.decompress(self._raw_response.read()) + (
+                self._decompressor.flush()
+            )
+
+        # Decompressor may need more than one chunk before producing any output.
+        while True:  # pylint: disable=while-used
+            chunk = self._raw_response.read(amt)
+            if not chunk:
+                return self._decompressor.flush()
+
+            data = self._decompressor.decompress(chunk)
+            if data:
+                return data
+
+
+class HTTPClient(metaclass=Singleton):
+    """
+    HTTP(S) client keeping a pool of idle (keep-alive) connections per server.
+    Requests going through a proxy (see `getproxies`) are delegated to `urllib`.
+    """
+
+    def __init__(self):
+        self._ssl_context = ssl.create_default_context()
+        self._tls_sessions: typing.Dict[typing.Tuple[str, int], ssl.SSLSession] = {}
+
+        self._lock = Lock()
+        self._idle_connections: typing.Dict[_ServerKey, typing.List[http.client.HTTPConnection]] = (
+            {}
+        )
+
+        self._semaphore = BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+    @contextmanager
+    def request(
+        self,
+        url: str,
+        timeout: float,
+        headers: typing.Optional[typing.Dict[str, str]] = None,
+    ) -> typing.Iterator[HTTPResponse]:
+        """
+        Context manager performing a GET request on `url` (following redirections) and yielding its
+          response (whatever its status). Connection is released on exit.
+        Raise `OSError` or `http.client.HTTPException` on (network) errors.
+        """
+        request_headers = {"Accept-Encoding": "gzip"}
+        request_headers.update(headers or {})
+
+        with self._semaphore:
+            for _ in range(MAX_REDIRECTIONS + 1):
+                scheme = urlsplit(url).scheme
+                if scheme in getproxies() and not proxy_bypass(urlsplit(url).hostname or ""):
+                    with self._proxied_request(url, timeout, request_headers) as response:
+                        yield response
+                    return
+
+                connection, raw_response = self._send_request(url, timeout, request_headers)
+                try:
+                    location = raw_response.getheader("Location")
+                    if raw_response.status not in (301, 302, 303, 307, 308) or not location:
+                        yield HTTPResponse(raw_response.status, raw_response.headers, raw_response)
+                        return
+
+                    # Body is drained, so connection may be reused to follow redirection.
+                    raw_response.read()
+                finally:
+                    self._release(url, connection, raw_response)
+
+                url = urljoin(url, location)
+
+        raise http.client.HTTPException(f"Too many redirections ({url})")
+
+    @contextmanager
+    def _proxied_request(
+        self, url: str, timeout: float, headers: typing.Dict[str, str]
+    ) -> typing.Iterator[HTTPResponse]:
+        try:
+            raw_response = urlopen(  # pylint: disable=consider-using-with
+                Request(url, headers=headers), timeout=timeout
+            )
+        except HTTPError as http_error:
+            # Non-2xx responses are yielded as well.
+            raw_response = http_error
+
+        with raw_response:
+            yield HTTPResponse(raw_response.code, raw_response.headers, raw_response)
+
+    @staticmethod
+    def _server_key(url: str) -> _ServerKey:
+        url_parts = urlsplit(url)
+        port = url_parts.port or (443 if url_parts.scheme == "https" else 80)
+        return url_parts.scheme, url_parts.hostname or "", port
+
+    def _send_request(
+        self, url: str, timeout: float, headers: typing.Dict[str, str]
+    ) -> typing.Tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        server_key = self._server_key(url)
+        url_parts = urlsplit(url)
+        path = url_parts.path or "/"
+        if url_parts.query:
+            path += "?" + url_parts.query
+
+        with self._lock:
+            idle_connections = self._idle_connections.get(server_key)
+            connection = idle_connections.pop() if idle_connections else None
+
+        if connection is not None:
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+
+            # Idle connection may have been closed by server in the meantime, request is then
+            #  retried on a brand new connection.
+            with suppress(
+                ConnectionError, http.client.RemoteDisconnected, http.client.BadStatusLine
+            ):
+                return connection, self._exchange(connection, path, headers)
+
+        connection = self._new_connection(server_key, timeout)
+        return connection, self._exchange(connection, path, headers)
+
+    @staticmethod
+    def _exchange(
+        connection: http.client.HTTPConnection, path: str, headers: typing.Dict[str, str]
+    ) -> http.client.HTTPResponse:
+        try:
+            connection.request("GET", path, headers=headers)
+            return connection.getresponse()
+        except BaseException:
+            connection.close()
+            raise
+
+    def _new_connection(self, server_key: _ServerKey, timeout: float) -> http.client.HTTPConnection:
+        scheme, host, port = server_key
+        if scheme == "https":
+            return _HTTPSConnection(host, port, timeout, self._ssl_context, self._tls_sessions)
+        if scheme == "http":
+            return http.client.HTTPConnection(host, port, timeout=timeout)
+
+        raise http.client.HTTPException(f"Unsupported URL scheme ({scheme})")
+
+    def _release(
+        self,
+        url: str,
+        connection: http.client.HTTPConnection,
+        raw_response: http.client.HTTPResponse,
+    ) -> None:
+        """Put `connection` back into the pool when its response has been completely read"""
+        if isinstance(connection, _HTTPSConnection):
+            connection.save_tls_session()
+
+        # Empty bodies (e.g. of `304 Not Modified` responses) are not consumed yet.
+        if raw_response.length == 0:
+            raw_response.read()
+
+        if not raw_response.isclosed() or raw_response.will_close:
+            with suppress(OSError):
+                raw_response.close()
+            connection.close()
+            return
+
+        with self._lock:
+            self._idle_connections.setdefault(self._server_key(url), []).append(connection)
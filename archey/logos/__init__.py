@@ -1,8 +1,17 @@
 """`__init__` file for the `logos` submodule, containing dedicated utility methods"""
 
+import json
+import os
+import pkgutil
+from functools import lru_cache
 from importlib import import_module
-from types import ModuleType
-from typing import List
+from types import ModuleType, SimpleNamespace
+from typing import List, Tuple, Union
+
+from archey.colors import Colors, Colors8Bit
+
+# Logos modules remain the source of truth, but they are packed (see `pack_logos`) in a single file.
+LOGOS_BUNDLE_PATH = os.path.join(os.path.dirname(__file__), "logos.bundle")
 
 
 def lazy_load_logo_module(logo_name: str) -> ModuleType:
@@ -13,6 +22,81 @@ def lazy_load_logo_module(logo_name: str) -> ModuleType:
     return import_module(f"{__name__}.{logo_name}")
 
 
+def _encode_color(color: Union[Colors, Colors8Bit]) -> list:
+    if isinstance(color, Colors):
+        return ["Colors", color.name]
+
+    # `Colors8Bit` values are `(bright, 38, 5, value)` tuples.
+    return ["Colors8Bit", color.value[0], color.value[3]]
+
+
+def _decode_color(encoded_color: list) -> Union[Colors, Colors8Bit]:
+    if encoded_color[0] == "Colors":
+        return Colors[encoded_color[1]]
+
+    return Colors8Bit(encoded_color[1], encoded_color[2])
+
+
+def pack_logos(bundle_path: str = LOGOS_BUNDLE_PATH) -> None:
+    """
+    Pack every logo module attributes (`LOGO*` & `COLORS*`) into a single bundle file.
+    Its first line is a JSON index mapping logo names to `[offset, length]` of their (JSON)
+      data, relative to the end of this line. Output is deterministic.
+    This is meant to be run at build time, each time a logo module is added or changed.
+    """
+    payloads = []
+    for logo_module_info in sorted(pkgutil.iter_modules(__path__), key=lambda info: info.name):
+        logo_module = lazy_load_logo_module(logo_module_info.name)
+
+        logo_data = {}
+        for attribute in sorted(dir(logo_module)):
+            if attribute.startswith("LOGO"):
+                logo_data[attribute] = getattr(logo_module, attribute)
+            elif attribute.startswith("COLORS"):
+                logo_data[attribute] = list(map(_encode_color, getattr(logo_module, attribute)))
+
+        payloads.append(
+            (
+                logo_module_info.name,
+                json.dumps(logo_data, ensure_ascii=False, separators=(",", ":")).encode("UTF-8"),
+            )
+        )
+
+    index = {}
+    offset = 0
+    for logo_name, payload in payloads:
+        index[logo_name] = [offset, len(payload)]
+        offset += len(payload)
+
+    with open(bundle_path, "wb") as f_bundle:
+        f_bundle.write(json.dumps(index, separators=(",", ":")).encode("UTF-8") + b"\n")
+        for _, payload in payloads:
+            f_bundle.write(payload)
+
+
+@lru_cache(maxsize=None)
+def load_logo(logo_name: str) -> Union[ModuleType, SimpleNamespace]:
+    """
+    Utility function returning a logo (exposing the same attributes as its module), only reading
+      its own data from logos bundle.
+    When bundle is missing (or does not know this logo), logo module is loaded instead.
+    Results are memoized, so each logo is only read once (callers must not mutate them).
+    """
+    try:
+        with open(LOGOS_BUNDLE_PATH, "rb") as f_bundle:
+            offset, length = json.loads(f_bundle.readline())[logo_name]
+            f_bundle.seek(f_bundle.tell() + offset)
+            logo_data = json.loads(f_bundle.read(length))
+    except (OSError, ValueError, KeyError, TypeError):
+        return lazy_load_logo_module(logo_name)
+
+    for attribute in logo_data:
+        if attribute.startswith("COLORS"):
+            logo_data[attribute] = list(map(_decode_color, logo_data[attribute]))
+
+    return SimpleNamespace(**logo_data)
+
+
 def get_logo_width(logo: List[str], nb_colors: int = 8) -> int:
     """
     Utility function computing the real width of a distribution logo.
@@ -30,3 +114,16 @@ def get_logo_width(logo: List[str], nb_colors: int = 8) -> int:
 
     # We replace each placeholder by a 0-character string.
     return len(logo[0].format(c=[""] * nb_colors))
+
+
+@lru_cache(maxsize=None)
+def render_logo(logo: Tuple[str, ...], colors: Tuple[str, ...]) -> Tuple[Tuple[str, ...], int]:
+    """
+    Utility function returning `logo` lines ready to be printed (with colors placeholders replaced
+      by `colors` escape codes), along with its width.
+    Results are memoized, so each (logo, colors) combination is only rendered once.
+    """
+    return (
+        tuple(line.format(c=colors) for line in logo),
+        get_logo_width(list(logo), len(colors)),
+    )
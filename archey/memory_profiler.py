@@ -0,0 +1,121 @@
+"""
+Memory profiling of entries loading (see `--profile-memory` option).
+Allocations are traced (through `tracemalloc`) and compared between completed entries, so top
+  allocators may be reported per entry, along with process peak resident set size.
+"""
+
+import os
+import platform
+import sys
+import tracemalloc
+from typing import Callable, List, Optional, TextIO, Tuple
+
+try:
+    import resource
+except ImportError:
+    resource = None  # type: ignore[assignment]
+
+from archey.entry import Entry
+
+# Number of top allocators reported per entry.
+TOP_ALLOCATORS_COUNT = 5
+
+
+def _format_size(size: float, signed: bool = False) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            break
+        size /= 1024
+    else:
+        unit = "GiB"
+
+    return f"{size:{'+' if signed else ''}.1f} {unit}"
+
+
+class MemoryProfiler:
+    """
+    Trace allocations retained by each entry (in completion order), between `track`-ed completion
+      callback calls. Entries should be loaded sequentially, so allocations may be attributed.
+    Shared work (e.g. prerequisites warm up) is accounted to the first completed entry.
+    """
+
+    def __init__(self):
+        # Profiler's own bookkeeping is not reported.
+        self._filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ]
+        self._entries_stats: List[Tuple[str, int, List[tracemalloc.StatisticDiff]]] = []
+
+        tracemalloc.start()
+        self._snapshot = self._take_snapshot()
+
+    def _take_snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(self._filters)
+
+    def track(
+        self, on_entry_completed: Optional[Callable[[int, Entry, float], None]] = None
+    ) -> Callable[[int, Entry, float], None]:
+        """
+        Return an entry completion callback (see `run_entries`) recording allocations of each
+          completed entry, before calling `on_entry_completed` (if any).
+        """
+
+        def _on_entry_completed(index: int, entry: Entry, duration: float) -> None:
+            snapshot = self._take_snapshot()
+            statistics = snapshot.compare_to(self._snapshot, "lineno")
+            self._entries_stats.append(
+                (
+                    entry.name,
+                    sum(statistic.size_diff for statistic in statistics),
+                    [statistic for statistic in statistics if statistic.size_diff > 0][
+                        :TOP_ALLOCATORS_COUNT
+                    ],
+                )
+            )
+            # Don't keep this snapshot, as it may be large.
+            del snapshot, statistics
+
+            if on_entry_completed is not None:
+                on_entry_completed(index, entry, duration)
+
+            self._snapshot = self._take_snapshot()
+
+        return _on_entry_completed
+
+    @staticmethod
+    def get_peak_rss() -> Optional[Tuple[int, int]]:
+        """Return peak resident set sizes (in bytes) of current process and of its children"""
+        if resource is None:
+            return None
+
+        # `ru_maxrss` is expressed in bytes on Darwin, but in kibibytes elsewhere.
+        factor = 1 if platform.system() == "Darwin" else 1024
+        return (
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * factor,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * factor,
+        )
+
+    def report(self, stream: TextIO = sys.stderr) -> None:
+        """Write memory profile to `stream`, and stop tracing allocations"""
+        _, traced_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        lines = [f"Peak traced memory: {_format_size(traced_peak)}"]
+        peak_rss = self.get_peak_rss()
+        if peak_rss is not None:
+            lines.append(
+                f"Peak RSS: {_format_size(peak_rss[0])} (commands: {_format_size(peak_rss[1])})"
+            )
+
+        for entry_name, size_diff, top_statistics in self._entries_stats:
+            lines.append(f"{entry_name}: {_format_size(size_diff, signed=True)}")
+            for statistic in top_statistics:
+                frame = statistic.traceback[0]
+                lines.append(
+                    f"  {os.path.relpath(frame.filename)}:{frame.lineno}: "
+                    f"{_format_size(statistic.size_diff, signed=True)} "
+                    f"({statistic.count_diff:+d} blocks)"
+                )
+
+        stream.write(os.linesep.join(lines) + os.linesep)
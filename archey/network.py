@@ -0,0 +1,386 @@
+"""
+Network utility module.
+Natively interfaces with Linux kernel (rtnetlink) to enumerate network interfaces addresses.
+Also embeds a minimal DNS (stub) client, so address records may be resolved in-process.
+"""
+
+import random
+import socket
+import struct
+import time
+from contextlib import suppress
+from functools import partial
+from select import select
+from threading import Thread
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from archey.pseudo_files import PseudoFiles
+
+# See <https://man7.org/linux/man-pages/man7/netlink.7.html>.
+NETLINK_ROUTE = 0
+NLM_F_REQUEST = 0x1
+NLM_F_DUMP = 0x300
+NLMSG_ERROR = 0x2
+NLMSG_DONE = 0x3
+
+# See <https://man7.org/linux/man-pages/man7/rtnetlink.7.html>.
+RTM_NEWADDR = 20
+RTM_GETADDR = 22
+IFA_ADDRESS = 1
+IFA_LOCAL = 2
+IFA_LABEL = 3
+
+# `struct nlmsghdr`, `struct ifaddrmsg` and `struct rtattr` (native byte order).
+NLMSGHDR = struct.Struct("=LHHLL")
+IFADDRMSG = struct.Struct("=BBBBL")
+RTATTR = struct.Struct("=HH")
+
+# Kernel routing tables, see <https://man7.org/linux/man-pages/man5/proc_net.5.html>.
+PROC_NET_ROUTE_PATH = "/proc/net/route"
+PROC_NET_IPV6_ROUTE_PATH = "/proc/net/ipv6_route"
+RTF_UP = 0x1
+RTF_REJECT = 0x200
+
+# See <https://datatracker.ietf.org/doc/html/rfc1035#section-4.1>.
+DNS_HEADER = struct.Struct("!HHHHHH")
+DNS_QUESTION = struct.Struct("!HH")
+DNS_RR = struct.Struct("!HHLH")
+DNS_FLAG_QR = 0x8000
+DNS_FLAG_RD = 0x0100
+DNS_CLASS_IN = 1
+DNS_TYPE_A = 1
+DNS_TYPE_AAAA = 28
+
+# Netlink messages and attributes are aligned on 4 bytes.
+NLMSG_ALIGNTO = 4
+
+
+def _nlmsg_align(length: int) -> int:
+    return (length + NLMSG_ALIGNTO - 1) & ~(NLMSG_ALIGNTO - 1)
+
+
+class Network:
+    """Network interfaces and addresses related logic, used in Archey internals"""
+
+    @classmethod
+    def get_interfaces_addresses(cls) -> Dict[str, List[Tuple[int, bytes]]]:
+        """
+        Return IP addresses (as `(address family, packed address)` tuples) of each network
+          interface, with a single rtnetlink `RTM_GETADDR` dump request.
+        Interfaces are ordered by their index.
+        Raise `OSError` when rtnetlink is not available (i.e. not on GNU/Linux).
+        """
+        af_netlink = getattr(socket, "AF_NETLINK", None)
+        if af_netlink is None:
+            raise OSError("rtnetlink is not available on this platform")
+
+        # Addresses are stored by interface index, and we remember interface labels (when set).
+        interfaces_addresses: Dict[int, List[Tuple[int, bytes]]] = {}
+        interfaces_labels: Dict[int, str] = {}
+
+        with socket.socket(af_netlink, socket.SOCK_RAW, NETLINK_ROUTE) as netlink_socket:
+            netlink_socket.sendall(
+                NLMSGHDR.pack(
+                    NLMSGHDR.size + IFADDRMSG.size,
+                    RTM_GETADDR,
+                    NLM_F_REQUEST | NLM_F_DUMP,
+                    1,  # sequence number
+                    0,  # port ID (kernel)
+                )
+                + IFADDRMSG.pack(socket.AF_UNSPEC, 0, 0, 0, 0)
+            )
+
+            # Kernel answers with (possibly) multiple datagrams, until a `NLMSG_DONE` message.
+            for data in iter(partial(netlink_socket.recv, 65536), b""):
+                if cls._parse_rtm_newaddr_messages(data, interfaces_addresses, interfaces_labels):
+                    break
+
+        interfaces: Dict[str, List[Tuple[int, bytes]]] = {}
+        for if_index in sorted(interfaces_addresses):
+            # IPv6 addresses do not carry interface label, resolve their name by index.
+            if_name = interfaces_labels.get(if_index)
+            if if_name is None:
+                try:
+                    if_name = socket.if_indextoname(if_index)
+                except OSError:
+                    # Interface vanished in the meantime.
+                    continue
+
+            interfaces.setdefault(if_name, []).extend(interfaces_addresses[if_index])
+
+        return interfaces
+
+    @staticmethod
+    def get_default_routes() -> List[Tuple[str, str]]:
+        """
+        Return `(interface name, gateway address)` tuples of default routes (IPv4 ones first), by
+          ascending metric.
+        Kernel routing tables are read from procfs, so an empty list is returned when unavailable.
+        """
+        default_routes: List[Tuple[int, int, str, str]] = []
+
+        # `/proc/net/route` has a header line, and "Iface Destination Gateway Flags RefCnt Use
+        #  Metric Mask ..." columns (hexadecimal values, in host byte order).
+        try:
+            for line in PseudoFiles().read(PROC_NET_ROUTE_PATH).splitlines()[1:]:
+                fields = line.split()
+                if (
+                    len(fields) >= 8
+                    and int(fields[1], 16) == 0
+                    and int(fields[7], 16) == 0
+                    and int(fields[3], 16) & RTF_UP
+                ):
+                    default_routes.append(
+                        (
+                            0,
+                            int(fields[6]),
+                            fields[0],
+                            socket.inet_ntop(socket.AF_INET, struct.pack("=L", int(fields[2], 16))),
+                        )
+                    )
+        except (OSError, ValueError):
+            pass
+
+        # `/proc/net/ipv6_route` has no header, and "Destination PrefixLength Source
+        #  SourcePrefixLength NextHop Metric RefCnt Use Flags Iface" columns.
+        try:
+            for line in PseudoFiles().read(PROC_NET_IPV6_ROUTE_PATH).splitlines():
+                fields = line.split()
+                if (
+                    len(fields) >= 10
+                    and int(fields[0], 16) == 0
+                    and int(fields[1], 16) == 0
+                    and int(fields[8], 16) & (RTF_UP | RTF_REJECT) == RTF_UP
+                ):
+                    default_routes.append(
+                        (
+                            1,
+                            int(fields[5], 16),
+                            fields[9],
+                            socket.inet_ntop(socket.AF_INET6, bytes.fromhex(fields[4])),
+                        )
+                    )
+        except (OSError, ValueError):
+            pass
+
+        return [(if_name, gateway) for _, _, if_name, gateway in sorted(default_routes)]
+
+    @classmethod
+    def get_default_route_interfaces(cls) -> List[str]:
+        """Return names of interfaces holding a default route (see `get_default_routes`)"""
+        default_route_interfaces: List[str] = []
+        for if_name, _ in cls.get_default_routes():
+            if if_name not in default_route_interfaces:
+                default_route_interfaces.append(if_name)
+
+        return default_route_interfaces
+
+    @classmethod
+    def run_dns_query(
+        cls, query: str, resolver: str, ip_version: int, timeout: float, resolver_port: int = 53
+    ) -> Optional[str]:
+        """
+        Resolve `query` A (or AAAA for IPv6) record against `resolver`, reached over the same IP
+          version, with a single UDP exchange (`dig +short`-like behavior).
+        Return `None` when resolver could not be reached (or did not answer in time), and an
+          empty string when it answered without any matching address.
+        """
+        addr_family = socket.AF_INET6 if ip_version == 6 else socket.AF_INET
+        record_type = DNS_TYPE_AAAA if ip_version == 6 else DNS_TYPE_A
+
+        try:
+            query_id = random.getrandbits(16)
+            dns_query = cls._build_dns_query(query_id, query, record_type)
+        except UnicodeError:
+            # `query` is not a valid (internationalized) domain name.
+            return None
+
+        deadline = time.monotonic() + timeout
+        try:
+            resolver_address = cls._resolve_resolver(resolver, resolver_port, addr_family, timeout)
+            if resolver_address is None:
+                return None
+
+            with socket.socket(addr_family, socket.SOCK_DGRAM) as dns_socket:
+                dns_socket.connect(resolver_address)
+
+                dns_socket.send(dns_query)
+
+                # Datagrams that are not the answer to our query are simply ignored.
+                while True:  # pylint: disable=while-used
+                    remaining_time = deadline - time.monotonic()
+                    if remaining_time <= 0:
+                        return None
+
+                    if not select([dns_socket], [], [], remaining_time)[0]:
+                        return None
+
+                    ip_addresses = cls._parse_dns_response(
+                        dns_socket.recv(4096), query_id, record_type
+                    )
+                    if ip_addresses is not None:
+                        return ip_addresses[0] if ip_addresses else ""
+        except OSError:
+            return None
+
+    @staticmethod
+    def _resolve_resolver(
+        resolver: str, resolver_port: int, addr_family: int, timeout: float
+    ) -> Optional[tuple]:
+        """
+        Return socket address of `resolver`, or `None` when it could not be resolved in time.
+        IP literals are used as is, whereas host names are resolved by the system, which can't be
+          interrupted: lookup runs in a daemon thread, abandoned once `timeout` is exceeded.
+        """
+        try:
+            return socket.getaddrinfo(
+                resolver, resolver_port, addr_family, socket.SOCK_DGRAM, 0, socket.AI_NUMERICHOST
+            )[0][4]
+        except socket.gaierror:
+            pass
+
+        resolver_addresses: list = []
+
+        def _lookup() -> None:
+            with suppress(OSError, UnicodeError):
+                address_info = socket.getaddrinfo(
+                    resolver, resolver_port, addr_family, socket.SOCK_DGRAM
+                )
+                resolver_addresses.append(address_info[0][4])
+
+        lookup_thread = Thread(target=_lookup, daemon=True)
+        lookup_thread.start()
+        lookup_thread.join(timeout)
+
+        return resolver_addresses[0] if resolver_addresses else None
+
+    @staticmethod
+    def _build_dns_query(query_id: int, query: str, record_type: int) -> bytes:
+        """Build a recursive DNS query (wire format) for `query` name and `record_type`"""
+        qname = b"".join(
+            bytes((len(label),)) + label for label in query.rstrip(".").encode("idna").split(b".")
+        )
+
+        return (
+            DNS_HEADER.pack(query_id, DNS_FLAG_RD, 1, 0, 0, 0)
+            + qname
+            + b"\0"
+            + DNS_QUESTION.pack(record_type, DNS_CLASS_IN)
+        )
+
+    @staticmethod
+    def _skip_dns_name(data: bytes, offset: int) -> int:
+        """Return the offset right after the (possibly compressed) DNS name at `offset`"""
+        while True:  # pylint: disable=while-used
+            label_length = data[offset]
+            if label_length & 0xC0 == 0xC0:
+                # A compression pointer always ends the name.
+                return offset + 2
+            if not label_length:
+                return offset + 1
+
+            offset += 1 + label_length
+
+    @classmethod
+    def _parse_dns_response(
+        cls, data: bytes, query_id: int, record_type: int
+    ) -> Optional[List[str]]:
+        """
+        Return addresses of `record_type` found in the answer section of a DNS response.
+        Return `None` when `data` is not a (valid) response to our query.
+        """
+        try:
+            response_id, flags, qd_count, an_count, _, _ = DNS_HEADER.unpack_from(data)
+            if response_id != query_id or not flags & DNS_FLAG_QR:
+                return None
+
+            offset = DNS_HEADER.size
+            for _ in range(qd_count):
+                offset = cls._skip_dns_name(data, offset) + DNS_QUESTION.size
+
+            addr_family = socket.AF_INET6 if record_type == DNS_TYPE_AAAA else socket.AF_INET
+
+            ip_addresses = []
+            for _ in range(an_count):
+                offset = cls._skip_dns_name(data, offset)
+                rr_type, rr_class, _, rd_length = DNS_RR.unpack_from(data, offset)
+                offset += DNS_RR.size
+
+                # Other records (e.g. CNAME ones) are skipped.
+                if rr_type == record_type and rr_class == DNS_CLASS_IN:
+                    ip_addresses.append(
+                        socket.inet_ntop(addr_family, data[offset : offset + rd_length])
+                    )
+
+                offset += rd_length
+        except (IndexError, ValueError, struct.error):
+            # Truncated or malformed response.
+            return None
+
+        return ip_addresses
+
+    @staticmethod
+    def _iter_rtattrs(data: bytes, offset: int, end: int) -> Iterator[Tuple[int, bytes]]:
+        """Generator yielding `(type, payload)` tuples of `rtattr` structures within `data`"""
+        while offset + RTATTR.size <= end:  # pylint: disable=while-used
+            rta_len, rta_type = RTATTR.unpack_from(data, offset)
+            if rta_len < RTATTR.size:
+                return
+
+            yield rta_type, data[offset + RTATTR.size : offset + rta_len]
+            offset += _nlmsg_align(rta_len)
+
+    @classmethod
+    def _parse_rtm_newaddr_messages(
+        cls,
+        data: bytes,
+        interfaces_addresses: Dict[int, List[Tuple[int, bytes]]],
+        interfaces_labels: Dict[int, str],
+    ) -> bool:
+        """
+        Parse a datagram of `RTM_NEWADDR` netlink messages, populating passed dictionaries.
+        Return `True` when the dump is over.
+        """
+        offset = 0
+        while offset + NLMSGHDR.size <= len(data):  # pylint: disable=while-used
+            msg_len, msg_type, _, _, _ = NLMSGHDR.unpack_from(data, offset)
+            if msg_len < NLMSGHDR.size:
+                # Malformed message, stop here.
+                return True
+
+            if msg_type == NLMSG_DONE:
+                return True
+
+            if msg_type == NLMSG_ERROR:
+                # An error message embeds a (negative) `errno` value right after the header.
+                (error,) = struct.unpack_from("=i", data, offset + NLMSGHDR.size)
+                if error:
+                    raise OSError(-error, "rtnetlink RTM_GETADDR request failed")
+                return True
+
+            if msg_type == RTM_NEWADDR:
+                ifa_family, _, _, _, ifa_index = IFADDRMSG.unpack_from(data, offset + NLMSGHDR.size)
+
+                attributes = dict(
+                    cls._iter_rtattrs(
+                        data,
+                        offset + NLMSGHDR.size + _nlmsg_align(IFADDRMSG.size),
+                        offset + msg_len,
+                    )
+                )
+
+                # For point-to-point IPv4 interfaces, `IFA_ADDRESS` is the peer address.
+                # `IFA_LOCAL` (when set) is always the local one.
+                address = attributes.get(IFA_LOCAL) or attributes.get(IFA_ADDRESS)
+                if address is not None:
+                    interfaces_addresses.setdefault(ifa_index, []).append((ifa_family, address))
+
+                if IFA_LABEL in attributes:
+                    with suppress(UnicodeDecodeError):
+                        interfaces_labels[ifa_index] = (
+                            attributes[IFA_LABEL].rstrip(b"\0").decode().split(":")[0]
+                        )
+
+            offset += _nlmsg_align(msg_len)
+
+        return False
@@ -3,19 +3,22 @@ Output class file.
 It supports entries lazy-insertion, logo detection, and final printing.
 """
 
+import json
 import os
 import sys
 from shutil import get_terminal_size
-from textwrap import TextWrapper
-from typing import cast
+from typing import Optional, Sequence, Tuple, cast
 
+from archey._version import __version__
 from archey.api import API
-from archey.colors import ANSI_ECMA_REGEXP, Colors, Style
+from archey.cache import Cache
+from archey.colors import Colors, Style
 from archey.configuration import Configuration
 from archey.distributions import Distributions
 from archey.entry import Entry
 from archey.exceptions import ArcheyException
-from archey.logos import get_logo_width, lazy_load_logo_module
+from archey.logos import load_logo, render_logo
+from archey.text_layout import truncate_line
 
 
 class Output:  # pylint: disable=too-many-instance-attributes
@@ -35,6 +38,14 @@ class Output:  # pylint: disable=too-many-instance-attributes
             kwargs.get("preferred_logo_style") or self.configuration.get("logo_style") or ""
         ).upper()
 
+        # If `os-release`'s `ANSI_COLOR` option is set, honor it.
+        ansi_color = Distributions.get_ansi_color()
+        if not self.configuration.get("honor_ansi_color"):
+            ansi_color = None
+
+        # Ready-to-print logo lines and width, when already known.
+        self._rendered_logo: Optional[Tuple[Sequence[str], int]] = None
+
         # If logo shouldn't be displayed, don't load any module and reset right padding
         if preferred_logo_style == "NONE":
             self._logo, self._colors = [], []
@@ -47,21 +58,32 @@ class Output:  # pylint: disable=too-many-instance-attributes
                 # If not (or unknown), run distribution detection.
                 distribution = Distributions.get_local()
 
-            # Retrieve distribution's logo module before copying and DRY-ing its attributes.
-            logo_module = lazy_load_logo_module(distribution.value)
-
-            # If set and available, fetch an alternative logo style from module.
-            if preferred_logo_style and hasattr(logo_module, f"LOGO_{preferred_logo_style}"):
-                self._logo = getattr(logo_module, f"LOGO_{preferred_logo_style}").copy()
-                self._colors = getattr(logo_module, f"COLORS_{preferred_logo_style}").copy()
+            # When enabled, rendered logos are persisted across runs, so logo module won't even be
+            #  loaded next time.
+            logo_cache = Cache("logos") if kwargs.get("logo_cache") else None
+            logo_cache_key = json.dumps(
+                [distribution.value, preferred_logo_style, ansi_color, Style.should_color_output()]
+            )
+            cached_logo = (
+                logo_cache.get(logo_cache_key, fingerprint=__version__) if logo_cache else None
+            )
+            if isinstance(cached_logo, dict):
+                self._logo, self._colors = cached_logo["logo"], cached_logo["colors"]
+                self._rendered_logo = (cached_logo["logo"], cached_logo["width"])
             else:
-                self._logo, self._colors = logo_module.LOGO.copy(), logo_module.COLORS.copy()
-
-        # If `os-release`'s `ANSI_COLOR` option is set, honor it.
-        ansi_color = Distributions.get_ansi_color()
-        if ansi_color and self.configuration.get("honor_ansi_color"):
-            # Replace each Archey integrated colors by `ANSI_COLOR`.
-            self._colors = len(self._colors) * [Style.escape_code_from_attrs(ansi_color)]
+                self._load_logo(distribution, preferred_logo_style, ansi_color)
+
+                if logo_cache is not None:
+                    rendered_logo, logo_width = self._render_logo()
+                    logo_cache.set(
+                        logo_cache_key,
+                        {
+                            "logo": rendered_logo,
+                            "colors": list(map(str, self._colors)),
+                            "width": logo_width,
+                        },
+                        fingerprint=__version__,
+                    )
 
         entries_color = self.configuration.get("entries_color")
         if entries_color:
@@ -76,6 +98,31 @@ class Output:  # pylint: disable=too-many-instance-attributes
         # Each class output will be added in the list below afterwards
         self._results = []
 
+    def _load_logo(
+        self, distribution: Distributions, preferred_logo_style: str, ansi_color: Optional[str]
+    ) -> None:
+        """Load `distribution` logo (and its colors) from its module"""
+        # Retrieve distribution's logo (module) before copying and DRY-ing its attributes.
+        logo_module = load_logo(distribution.value)
+
+        # If set and available, fetch an alternative logo style from module.
+        if preferred_logo_style and hasattr(logo_module, f"LOGO_{preferred_logo_style}"):
+            self._logo = getattr(logo_module, f"LOGO_{preferred_logo_style}").copy()
+            self._colors = getattr(logo_module, f"COLORS_{preferred_logo_style}").copy()
+        else:
+            self._logo, self._colors = logo_module.LOGO.copy(), logo_module.COLORS.copy()
+
+        if ansi_color:
+            # Replace each Archey integrated colors by `ANSI_COLOR`.
+            self._colors = len(self._colors) * [Style.escape_code_from_attrs(ansi_color)]
+
+    def _render_logo(self) -> Tuple[Sequence[str], int]:
+        """Return (and remember) ready-to-print logo lines, along with logo width"""
+        if self._rendered_logo is None:
+            self._rendered_logo = render_logo(tuple(self._logo), tuple(map(str, self._colors)))
+
+        return self._rendered_logo
+
     def add_entry(self, entry: Entry) -> None:
         """Append an entry to the list of entries to output"""
         self._entries.append(entry)
@@ -111,77 +158,35 @@ class Output:  # pylint: disable=too-many-instance-attributes
         Finally render the output entries.
         It handles text centering additionally to value and colors replacing.
         """
-        # Compute the effective logo "width" from the loaded ASCII art.
-        logo_width = get_logo_width(self._logo, len(self._colors))
+        # Fetch ready-to-print logo lines (and effective "width") from the loaded ASCII art.
+        rendered_logo, logo_width = self._render_logo()
+        logo = list(rendered_logo)
 
         # Let's center the entries and the logo (handles odd numbers)
-        height_diff = len(self._logo) - len(self._results)
+        height_diff = len(logo) - len(self._results)
         if height_diff >= 0:
             self._results[0:0] = [""] * (height_diff // 2)
-            self._results.extend([""] * (len(self._logo) - len(self._results)))
+            self._results.extend([""] * (len(logo) - len(self._results)))
         else:
             colored_empty_line = [(str(self._colors[0]) if self._colors else "") + " " * logo_width]
-            self._logo[0:0] = colored_empty_line * (-height_diff // 2)
-            self._logo.extend(colored_empty_line * (len(self._results) - len(self._logo)))
+            logo[0:0] = colored_empty_line * (-height_diff // 2)
+            logo.extend(colored_empty_line * (len(self._results) - len(logo)))
 
-        # When writing to a pipe (for instance), prevent `TextWrapper` from truncating output.
-        if not sys.stdout.isatty():
-            text_width = cast(int, float("inf"))
-        else:
+        # When writing to a pipe (for instance), don't truncate output.
+        if sys.stdout.isatty():
             text_width = get_terminal_size().columns - logo_width - len(self.__logo_right_padding)
-
-        text_wrapper = TextWrapper(
-            width=text_width,
-            expand_tabs=False,
-            replace_whitespace=False,
-            drop_whitespace=False,
-            break_on_hyphens=False,
-            max_lines=1,
-            placeholder="...",
-        )
-        placeholder_length = len(text_wrapper.placeholder)
-
-        # Using `TextWrapper`, shortens each entry to remove any line overlapping
-        for i, entry in enumerate(self._results):
-            # Shortens the entry according to the terminal width.
-            # We have to remove any ANSI color, or the result would be skewed.
-            wrapped_entry = text_wrapper.fill(Style.remove_colors(entry))
-            placeholder_offset = (
-                placeholder_length if wrapped_entry.endswith(text_wrapper.placeholder) else 0
-            )
-
-            # By using previous positions, re-inserts ANSI colors back in the wrapped string.
-            for color_match in ANSI_ECMA_REGEXP.finditer(entry):
-                match_index = color_match.start()
-                if match_index <= len(wrapped_entry) - placeholder_offset:
-                    wrapped_entry = (
-                        wrapped_entry[:match_index]
-                        + color_match.group()
-                        + wrapped_entry[match_index:]
-                    )
-
-            # Add a color reset character before the placeholder (if any).
-            # Rationale :
-            # We cannot set `Colors.CLEAR` in the placeholder as it would skew its internals.
-            if placeholder_offset:
-                wrapped_entry = (
-                    wrapped_entry[:-placeholder_length]
-                    + str(Colors.CLEAR)
-                    + wrapped_entry[-placeholder_length:]
-                )
-
-            self._results[i] = wrapped_entry
+            self._results = [truncate_line(entry, text_width) for entry in self._results]
 
         # Merge entry results to the distribution logo.
         logo_with_entries = os.linesep.join(
             [
                 f"{logo_part}{self.__logo_right_padding}{entry_part}"
-                for logo_part, entry_part in zip(self._logo, self._results)
+                for logo_part, entry_part in zip(logo, self._results)
             ]
         )
 
         try:
-            print(logo_with_entries.format(c=self._colors) + str(Colors.CLEAR))
+            print(logo_with_entries + str(Colors.CLEAR))
         except UnicodeError as unicode_error:
             raise ArcheyException("""\
 Your locale or TTY does not seem to support UTF-8 encoding.
@@ -2,8 +2,9 @@
 
 import logging
 import typing
-from subprocess import PIPE, CalledProcessError, check_output
+from subprocess import PIPE, CalledProcessError, TimeoutExpired
 
+from archey.command import check_output
 from archey.singleton import Singleton
 
 
@@ -15,7 +16,7 @@ class Processes(metaclass=Singleton):
 
         try:
             ps_output = check_output(["ps", "-eo", "comm"], stderr=PIPE, universal_newlines=True)
-        except OSError as os_error:
+        except (OSError, TimeoutExpired) as os_error:
             self._processes = []
             logging.warning("`ps` failed or `procps`/`procps-ng` isn't installed : %s", os_error)
         except CalledProcessError as process_error:
@@ -0,0 +1,48 @@
+"""
+Simple class (acting as a singleton) sharing (pseudo-)files content across entries.
+Some kernel-provided files are surprisingly expensive to read (e.g. `/proc/cpuinfo` queries every
+core frequency), so they are read at most once per run, whatever the number of consumers.
+"""
+
+import typing
+from threading import Lock
+
+from archey.singleton import Singleton
+
+
+class PseudoFiles(metaclass=Singleton):
+    """
+    Read-once and thread-safe snapshots of commonly read (pseudo-)files.
+    Reading errors are snapshotted too, and re-raised to each consumer.
+    """
+
+    def __init__(self):
+        self._contents: typing.Dict[str, typing.Union[str, OSError]] = {}
+
+        # A global lock protects per-path locks creation, so different paths may be read in
+        #  parallel whereas concurrent readers of the same path wait for a single read.
+        self._lock = Lock()
+        self._path_locks: typing.Dict[str, Lock] = {}
+
+    def read(self, path: str) -> str:
+        """
+        Return `path` content, reading it from disk only on first call.
+        Raise `OSError` (as `open` would) when file could not be read.
+        """
+        with self._lock:
+            path_lock = self._path_locks.setdefault(path, Lock())
+
+        with path_lock:
+            if path not in self._contents:
+                try:
+                    with open(path, encoding="UTF-8") as f_pseudo_file:
+                        self._contents[path] = f_pseudo_file.read()
+                except OSError as os_error:
+                    self._contents[path] = os_error
+
+        content = self._contents[path]
+        if isinstance(content, OSError):
+            # Reset traceback so it does not grow across re-raises.
+            raise content.with_traceback(None)
+
+        return content
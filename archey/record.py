@@ -0,0 +1,82 @@
+"""Lightweight records for entries values"""
+
+import typing
+from typing import Dict, Iterator, Tuple, Type, TypeVar
+
+RecordT = TypeVar("RecordT", bound="Record")
+
+
+class Record:
+    """
+    Base class of entries values records.
+    Fields are declared (and ordered) by `__slots__`, and typed by class annotations : instances
+      don't carry any `__dict__`, and are serialized (or validated on load) without introspection.
+    """
+
+    __slots__: Tuple[str, ...] = ()
+
+    # Fields accepted types, computed once per record class from its annotations.
+    _FIELDS_TYPES: Dict[str, Tuple[type, ...]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        fields_types: Dict[str, Tuple[type, ...]] = {}
+        for field, field_type in typing.get_type_hints(cls).items():
+            if field not in cls.__slots__:
+                continue
+
+            # `Optional` fields also accept `None`.
+            if getattr(field_type, "__origin__", None) is typing.Union:
+                field_types = tuple(field_type.__args__)
+            else:
+                field_types = (field_type,)
+
+            # JSON does not distinguish integers from floats.
+            if float in field_types:
+                field_types += (int,)
+
+            fields_types[field] = field_types
+        cls._FIELDS_TYPES = fields_types
+
+    def __init__(self, *args, **kwargs):
+        if len(args) > len(self.__slots__):
+            raise TypeError(f"{self.__class__.__name__} expects {len(self.__slots__)} fields")
+
+        kwargs.update(zip(self.__slots__, args))
+        for field in self.__slots__:
+            setattr(self, field, kwargs.pop(field))
+
+        if kwargs:
+            raise TypeError(f"Unknown {self.__class__.__name__} fields : {', '.join(kwargs)}")
+
+    def __iter__(self) -> Iterator:
+        """Iterate over fields values (in declaration order)"""
+        return (getattr(self, field) for field in self.__slots__)
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return tuple(self) == tuple(other)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{field}={getattr(self, field)!r}" for field in self.__slots__)
+        return f"{self.__class__.__name__}({fields})"
+
+    def as_dict(self) -> dict:
+        """Return record as a (JSON-serializable) dictionary"""
+        return dict(zip(self.__slots__, self))
+
+    @classmethod
+    def from_dict(cls: Type[RecordT], data: dict) -> RecordT:
+        """
+        Build a record out of `data` (e.g. a previous JSON serialization), whose fields are
+          validated against declared schema. Raise `KeyError` or `TypeError` on mismatch.
+        """
+        record = cls(**data)
+        for field, field_types in cls._FIELDS_TYPES.items():
+            if not isinstance(getattr(record, field), field_types):
+                raise TypeError(f"{cls.__name__}.{field} must be of type {field_types[0].__name__}")
+
+        return record
@@ -0,0 +1,163 @@
+"""
+Batch rendering of previously captured JSON documents (see `archey.api`).
+Entries are rebuilt out of their serialized values (no detection is run), so many hosts may be
+  rendered through the regular text output, in a single process.
+"""
+
+import json
+import logging
+import re
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple, Type
+
+from archey.configuration import Configuration
+from archey.distributions import Distributions
+from archey.entry import Entry
+from archey.output import Output
+from archey.scheduler import Entries, plan_entries
+
+# Whitespaces that may separate JSON documents (e.g. newlines of NDJSON streams).
+DOCUMENTS_SEPARATOR_REGEXP = re.compile(r"\s*")
+
+
+class _GenericEntry(Entry):
+    """Entry whose type is unknown, its value is output as is"""
+
+    def __init__(self, *args, **kwargs):  # pylint: disable=useless-parent-delegation
+        super().__init__(*args, **kwargs)
+
+
+def _iter_values(stream: TextIO) -> Iterator[Any]:
+    """
+    Yield JSON values read from `stream` as soon as they are complete (i.e. without waiting for the
+      end of the stream).
+    Raise `ValueError` on malformed content.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    for line in stream:
+        buffer += line
+        index = DOCUMENTS_SEPARATOR_REGEXP.match(buffer).end()  # type: ignore[union-attr]
+        while index < len(buffer):  # pylint: disable=while-used
+            try:
+                value, index = decoder.raw_decode(buffer, index)
+            except ValueError:
+                # Value is (so far) incomplete, wait for next lines.
+                break
+
+            yield value
+            index = DOCUMENTS_SEPARATOR_REGEXP.match(buffer, index).end()  # type: ignore[union-attr]
+
+        buffer = buffer[index:]
+
+    if buffer:
+        # Remaining content is either malformed or truncated, let decoder report it.
+        decoder.raw_decode(buffer)
+
+
+def iter_documents(stream: TextIO) -> Iterator[dict]:
+    """
+    Yield JSON documents read from `stream`, which may contain a single (indented) document or
+      several of them, as soon as they are complete.
+    NDJSON entries lines (see `--format ndjson`) are grouped, up to their meta-data line, into a
+      single document. As they come in completion order, they are put back in configured order
+      (lines without any index are kept last, in arrival order).
+    Raise `ValueError` on malformed content.
+    """
+    entries_lines: Optional[List[dict]] = None
+    for value in _iter_values(stream):
+        if not isinstance(value, dict):
+            continue
+
+        if "data" not in value and "entry" in value:
+            if entries_lines is None:
+                entries_lines = []
+            entries_lines.append(value)
+        elif "data" not in value and "meta" in value:
+            yield {"data": _group_entries_lines(entries_lines or []), "meta": value["meta"]}
+            entries_lines = None
+        else:
+            yield value
+
+    # NDJSON stream may have been interrupted before its meta-data line.
+    if entries_lines is not None:
+        yield {"data": _group_entries_lines(entries_lines)}
+
+
+def _group_entries_lines(entries_lines: List[dict]) -> dict:
+    """Return entries data of NDJSON `entries_lines`, in their configured order"""
+    # `sorted` is stable, so arrival order is kept among lines without any (valid) index.
+    entries_lines = sorted(
+        entries_lines,
+        key=lambda entry_line: (
+            entry_line["index"] if isinstance(entry_line.get("index"), int) else float("inf")
+        ),
+    )
+
+    return {entry_line["entry"]: entry_line.get("value") for entry_line in entries_lines}
+
+
+class Renderer:
+    """
+    Render captured documents as regular Archey output.
+    Serialized entries names are mapped back to entry classes (and their configured options), so
+      each entry may be output the way it would have been on its host.
+    Configuration and logos are loaded only once, whatever the number of rendered documents.
+    """
+
+    def __init__(
+        self,
+        preferred_logo_style: Optional[str] = None,
+        preferred_distribution: Optional[str] = None,
+    ):
+        self._preferred_logo_style = preferred_logo_style
+        self._preferred_distribution = preferred_distribution
+
+        self._entries_types = self._get_entries_types()
+
+    @staticmethod
+    def _get_entries_types() -> Dict[str, Tuple[Type[Entry], dict]]:
+        """Map displayed entries names to their classes and options"""
+        entries_types: Dict[str, Tuple[Type[Entry], dict]] = {}
+
+        # Default names first, so configured ones (along with their options) take precedence.
+        for entry_type in Entries:
+            entry_class = entry_type.entry_class
+            entries_types[entry_class.get_display_name()] = (entry_class, {})
+
+        planned_entries, _ = plan_entries(Configuration().get("entries") or [])
+        for entry_type, entry in planned_entries:
+            entry_class = entry_type.entry_class
+            name = entry.pop("name", None)
+            entries_types[entry_class.get_display_name(name, entry)] = (entry_class, entry)
+
+        return entries_types
+
+    def render(self, document: dict) -> None:
+        """Render one captured `document`, with the logo of the distribution it comes from"""
+        data = document.get("data")
+        if not isinstance(data, dict):
+            logging.warning("Document misses a `data` mapping, skipping it.")
+            return
+
+        distribution = self._preferred_distribution
+        if distribution is None:
+            distribution = (document.get("meta") or {}).get("distro")
+            # Unknown distributions fall back on the generic logo (not on local distribution one).
+            if distribution not in Distributions.get_identifiers():
+                distribution = Distributions.LINUX.value
+
+        output = Output(
+            preferred_logo_style=self._preferred_logo_style,
+            preferred_distribution=distribution,
+        )
+
+        for name, value in data.items():
+            entry_class, options = self._entries_types.get(name, (_GenericEntry, {}))
+            try:
+                output.add_entry(entry_class.from_value(name, value, options.copy()))
+            except (AttributeError, KeyError, TypeError, ValueError):
+                # Serialized value does not match entry type, output it as is.
+                logging.warning("Entry %s value could not be rebuilt, output it as is.", name)
+                output.add_entry(_GenericEntry.from_value(name, value))
+
+        output.output()
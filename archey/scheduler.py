@@ -0,0 +1,340 @@
+"""
+Entries planning and scheduling.
+Configured entries are planned upfront (so disabled ones are never imported), then instantiated
+  along with the shared work they depend on, slowest ones first.
+"""
+
+import logging
+import time
+from concurrent.futures import Executor, Future, as_completed
+from contextlib import suppress
+from enum import Enum
+from importlib import import_module
+from typing import Callable, Dict, List, Optional, Set, Tuple, Type
+
+from archey.cache import Cache
+from archey.distributions import Distributions
+from archey.entry import Entry
+from archey.processes import Processes
+from archey.pseudo_files import PseudoFiles
+from archey.static_facts import StaticFacts
+
+# Prerequisites entries may declare, besides pseudo-files paths (snapshotted by `PseudoFiles`).
+PROCESSES_PREREQUISITE = "processes"
+DISTRIBUTION_PREREQUISITE = "distribution"
+
+
+class Entries(Enum):
+    """
+    An enumeration to store and declare each one of our entries.
+    The string representation of keys will act as entries names.
+    Values declare entry module and class names (so only enabled entries are imported), the
+      shared work (see `warm_up`) they depend on, a cost hint (expected duration, in seconds)
+      used to schedule them until actual durations have been recorded and whether their values
+      are static facts (i.e. can't change until next boot, see `archey.static_facts`).
+    """
+
+    # pylint: disable=invalid-name
+    User = ("user", "User")
+    Hostname = ("hostname", "Hostname", (), 0, True)
+    Model = ("model", "Model", (DISTRIBUTION_PREREQUISITE, "/proc/cpuinfo"), 0, True)
+    Distro = ("distro", "Distro", (), 0, True)
+    Kernel = ("kernel", "Kernel", (), 0.05)
+    Uptime = ("uptime", "Uptime", ("/proc/uptime",))
+    LoadAverage = ("load_average", "LoadAverage")
+    Processes = ("processes", "Processes", (PROCESSES_PREREQUISITE,))
+    WindowManager = ("window_manager", "WindowManager", (PROCESSES_PREREQUISITE,))
+    DesktopEnvironment = ("desktop_environment", "DesktopEnvironment", (PROCESSES_PREREQUISITE,))
+    Shell = ("shell", "Shell")
+    Terminal = ("terminal", "Terminal")
+    Packages = ("packages", "Packages", (DISTRIBUTION_PREREQUISITE,), 0.5)
+    Temperature = ("temperature", "Temperature", (), 0.1)
+    CPU = ("cpu", "CPU", (DISTRIBUTION_PREREQUISITE, "/proc/cpuinfo"), 0, True)
+    GPU = ("gpu", "GPU", (), 0.1, True)
+    RAM = ("ram", "RAM", ("/proc/meminfo",))
+    Disk = ("disk", "Disk", (), 0.05)
+    LAN_IP = ("lan_ip", "LanIP")
+    WAN_IP = ("wan_ip", "WanIP", (), 0.5)
+    Custom = ("custom", "Custom", (), 0.05)
+
+    def __init__(
+        self,
+        module_name: str,
+        class_name: str,
+        prerequisites: Tuple[str, ...] = (),
+        cost_hint: float = 0,
+        static_fact: bool = False,
+    ):
+        self.module_name = module_name
+        self.class_name = class_name
+        self.prerequisites = prerequisites
+        self.cost_hint = cost_hint
+        self.static_fact = static_fact
+
+    @property
+    def entry_class(self) -> Type[Entry]:
+        """Import (on first access) and return the `Entry` class of this member"""
+        return getattr(import_module(f"archey.entries.{self.module_name}"), self.class_name)
+
+
+def plan_entries(available_entries: List[dict]) -> Tuple[List[Tuple[Entries, dict]], Set[str]]:
+    """
+    Walk user-configured entries (without importing any of them) and return enabled ones (along
+      with their options), and the set of prerequisites they need.
+    Disabled and invalid entries are dropped here, so they don't cost anything afterwards.
+    """
+    planned_entries = []
+    prerequisites: Set[str] = set()
+
+    for entry in available_entries:
+        # Configuration is left untouched, as it may be snapshotted.
+        entry = entry.copy()
+
+        if entry.pop("disabled", False):
+            continue
+
+        # Based on **required** `type` field, resolve the corresponding `Entries` member.
+        try:
+            entry_type = Entries[entry.pop("type")]
+        except KeyError as key_error:
+            logging.warning("One entry (misses or) uses an invalid `type` field (%s).", key_error)
+            continue
+
+        planned_entries.append((entry_type, entry))
+        prerequisites.update(entry_type.prerequisites)
+
+    return planned_entries, prerequisites
+
+
+def warm_up(prerequisite: str) -> None:
+    """Run (once and for all) the shared work behind `prerequisite`"""
+    if prerequisite == PROCESSES_PREREQUISITE:
+        Processes()
+    elif prerequisite == DISTRIBUTION_PREREQUISITE:
+        Distributions.get_local()
+    else:
+        # Reading errors are snapshotted too, and will be handled by consumers.
+        with suppress(OSError):
+            PseudoFiles().read(prerequisite)
+
+
+def instantiate_entry(entry_type: Entries, entry: dict) -> Tuple[Optional[Entry], float]:
+    """
+    Instantiate `entry_type` with `entry` options, and return it along with its duration.
+    This function may run in worker processes (see `executor` entry option).
+    """
+    # This hint is not an option of the entry itself.
+    entry.pop("executor", None)
+
+    # Entry module is imported beforehand, so its import cost is not accounted.
+    entry_class = entry_type.entry_class
+
+    start_time = time.monotonic()
+    entry_instance = entry_class(
+        name=entry.pop("name", None),  # `name` is fully-optional.
+        options=entry,  # Remaining fields should be propagated as options.
+    )
+
+    return entry_instance, time.monotonic() - start_time
+
+
+def rebuild_entry(entry_type: Entries, entry: dict, value) -> Tuple[Entry, float]:
+    """
+    Rebuild `entry_type` with `entry` options out of its (snapshotted) `value`, and return it along
+      with its duration.
+    """
+    entry_class = entry_type.entry_class
+
+    start_time = time.monotonic()
+    options = {key: option for key, option in entry.items() if key not in ("name", "executor")}
+    entry_instance = entry_class.from_value(
+        entry_class.get_display_name(entry.get("name"), options), value, options
+    )
+
+    return entry_instance, time.monotonic() - start_time
+
+
+def get_fact_key(entry_type: Entries, entry: dict) -> Optional[str]:
+    """Return static fact key of `entry_type` configured with `entry`, if it is a static fact"""
+    if not entry_type.static_fact:
+        return None
+
+    # Execution hint does not alter entry value.
+    return StaticFacts.get_key(
+        entry_type.name, {key: option for key, option in entry.items() if key != "executor"}
+    )
+
+
+def rebuild_static_facts(
+    static_facts: StaticFacts,
+    planned_entries: List[Tuple[Entries, dict]],
+    facts_keys: List[Optional[str]],
+    on_entry_completed: Optional[Callable[[int, Entry, float], None]] = None,
+) -> Dict[int, Tuple[Entry, float]]:
+    """
+    Rebuild planned entries whose values have been snapshotted, and return them (along with their
+      durations) by planned index. See `run_entries` for `on_entry_completed`.
+    """
+    results = {}
+    for index, fact_key in enumerate(facts_keys):
+        fact = static_facts.get(fact_key) if fact_key is not None else None
+        if fact is None:
+            continue
+
+        try:
+            results[index] = rebuild_entry(*planned_entries[index], fact)
+        except (AttributeError, KeyError, TypeError, ValueError):
+            # Snapshotted value does not match entry type (anymore), detection will run instead.
+            continue
+
+        if on_entry_completed is not None:
+            on_entry_completed(index, *results[index])
+
+    return results
+
+
+def snapshot_static_facts(
+    static_facts: StaticFacts,
+    facts_keys: List[Optional[str]],
+    entries_instances: List[Optional[Entry]],
+) -> None:
+    """Snapshot (and store) planned entries values which are static facts"""
+    for fact_key, entry_instance in zip(facts_keys, entries_instances):
+        # Undetected values are not snapshotted, so they may be detected during next runs.
+        if fact_key is not None and isinstance(entry_instance, Entry) and entry_instance:
+            static_facts.set(fact_key, entry_instance.value)
+
+    static_facts.save()
+
+
+def run_entries(  # pylint: disable=too-many-locals
+    planned_entries: List[Tuple[Entries, dict]],
+    prerequisites: Set[str],
+    executor: Optional[Executor] = None,
+    process_executor: Optional[Executor] = None,
+    on_entry_completed: Optional[Callable[[int, Entry, float], None]] = None,
+) -> List[Optional[Entry]]:
+    """
+    Instantiate planned entries (once their prerequisites have been warmed up) and return them in
+      planned order.
+    When an `executor` is passed, prerequisites are warmed up concurrently and entries expected to
+      last the longest (based on durations recorded during previous runs, or on their cost hints)
+      are started first, so they don't end up delaying the whole run.
+    Entries hinted with `"executor": "process"` are dispatched to `process_executor` (if any), so
+      their CPU-bound work is not serialized by the GIL.
+    When set, `on_entry_completed` is called (from the calling thread) with each entry planned
+      index, the entry itself and its duration, as soon as it has been instantiated (i.e. in
+      completion order).
+    Static facts snapshotted during current boot are rebuilt as is, so neither their detection nor
+      the shared work it depends on is run again.
+    """
+    cache = Cache("entries")
+    durations = cache.get("durations")
+    if not isinstance(durations, dict):
+        durations = {}
+    durations = {
+        duration_key: duration
+        for duration_key, duration in durations.items()
+        if isinstance(duration, (int, float))
+    }
+
+    # Entries may be configured multiple times (e.g. `Custom`), so names are part of the keys.
+    duration_keys = [
+        f"{entry_type.name}:{entry.get('name') or ''}" for entry_type, entry in planned_entries
+    ]
+
+    static_facts = StaticFacts()
+    facts_keys = [get_fact_key(*planned_entry) for planned_entry in planned_entries]
+    rebuilt_results = rebuild_static_facts(
+        static_facts, planned_entries, facts_keys, on_entry_completed
+    )
+
+    results: Dict[int, Tuple[Optional[Entry], float]] = dict(rebuilt_results)
+    pending_indices = [index for index in range(len(planned_entries)) if index not in results]
+    prerequisites = {
+        prerequisite
+        for prerequisite in prerequisites
+        if any(prerequisite in planned_entries[index][0].prerequisites for index in pending_indices)
+    }
+
+    if executor is None:
+        for prerequisite in sorted(prerequisites):
+            warm_up(prerequisite)
+
+        for index in pending_indices:
+            entry_instance, duration = instantiate_entry(*planned_entries[index])
+            if on_entry_completed is not None and entry_instance is not None:
+                on_entry_completed(index, entry_instance, duration)
+
+            results[index] = (entry_instance, duration)
+    else:
+        prerequisites_futures = {
+            prerequisite: executor.submit(warm_up, prerequisite)
+            for prerequisite in sorted(prerequisites)
+        }
+
+        # Prerequisites are submitted first, so waiting on them from a worker can't starve the pool.
+        def _scheduled_entry_instantiator(
+            entry_type: Entries, entry: dict
+        ) -> Tuple[Optional[Entry], float]:
+            for prerequisite in entry_type.prerequisites:
+                prerequisites_futures[prerequisite].result()
+
+            return instantiate_entry(entry_type, entry)
+
+        entries_futures: Dict[int, Future] = {}
+        for index in sorted(
+            pending_indices,
+            key=lambda index: durations.get(
+                duration_keys[index], planned_entries[index][0].cost_hint
+            ),
+            reverse=True,
+        ):
+            # Worker processes don't share our (warmed up) prerequisites, they do their own work.
+            if process_executor is not None and planned_entries[index][1].get("executor") == (
+                "process"
+            ):
+                entries_futures[index] = process_executor.submit(
+                    instantiate_entry, *planned_entries[index]
+                )
+            else:
+                entries_futures[index] = executor.submit(
+                    _scheduled_entry_instantiator, *planned_entries[index]
+                )
+
+        if on_entry_completed is not None:
+            futures_indices = {
+                entry_future: index for index, entry_future in entries_futures.items()
+            }
+            for entry_future in as_completed(futures_indices):
+                entry_instance, duration = entry_future.result()
+                if entry_instance is not None:
+                    on_entry_completed(futures_indices[entry_future], entry_instance, duration)
+
+        results.update(
+            {index: entry_future.result() for index, entry_future in entries_futures.items()}
+        )
+
+    # Smooth recorded durations, so a single unusual run doesn't mess up future scheduling.
+    # Rebuilt entries don't tell anything about their detection duration, previous ones are kept.
+    recorded_durations = {
+        duration_keys[index]: durations[duration_keys[index]]
+        for index in rebuilt_results
+        if duration_keys[index] in durations
+    }
+    recorded_durations.update(
+        {
+            duration_keys[index]: (
+                (durations[duration_keys[index]] + results[index][1]) / 2
+                if duration_keys[index] in durations
+                else results[index][1]
+            )
+            for index in pending_indices
+        }
+    )
+    cache.set("durations", recorded_durations)
+
+    entries_instances = [results[index][0] for index in range(len(planned_entries))]
+    snapshot_static_facts(static_facts, facts_keys, entries_instances)
+
+    return entries_instances
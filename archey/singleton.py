@@ -1,6 +1,7 @@
 """Simple singleton meta-class definition"""
 
 from abc import ABCMeta as AbstractBaseMetaClass
+from threading import RLock
 from typing import Dict
 
 
@@ -15,7 +16,13 @@ class Singleton(AbstractBaseMetaClass):
 
     _instances: Dict["Singleton", object] = {}
 
+    # Entries may be loaded in parallel, so instantiation has to be thread-safe.
+    # A re-entrant lock is required as singletons may depend on each other at initialization.
+    _instances_lock = RLock()
+
     def __call__(cls, *args, **kwargs):
         if cls not in cls._instances:
-            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
+            with cls._instances_lock:
+                if cls not in cls._instances:
+                    cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
         return cls._instances[cls]
@@ -0,0 +1,71 @@
+"""
+Boot-scoped snapshot of static facts.
+Some entries values can't change until next boot (e.g. CPU model or distribution), so they are
+  detected once per boot and then read back from a single snapshot file.
+"""
+
+import json
+import platform
+from typing import Any, Dict, Optional
+
+from archey.cache import Cache
+from archey.configuration import Configuration
+from archey.record import Record
+
+# Random identifier generated by the (Linux) kernel on each boot.
+BOOT_ID_PATH = "/proc/sys/kernel/random/boot_id"
+
+
+class StaticFacts:
+    """
+    Persistent (JSON-serializable) facts, loaded with a single read and stored with a single write.
+    Snapshot is bound to current boot identifier and kernel release, so a reboot (or a kernel
+      update) invalidates it as a whole. When boot identifier is not available (e.g. on non-Linux
+      systems), nothing is ever loaded nor stored.
+    """
+
+    def __init__(self):
+        self._cache = Cache("static_facts")
+        self._fingerprint = self._get_fingerprint()
+        self._updated = False
+
+        facts = None
+        if self._fingerprint is not None:
+            facts = self._cache.get("facts", fingerprint=self._fingerprint)
+        self._facts: Dict[str, Any] = facts if isinstance(facts, dict) else {}
+
+    @staticmethod
+    def _get_fingerprint() -> Optional[list]:
+        try:
+            with open(BOOT_ID_PATH, encoding="ASCII") as f_boot_id:
+                boot_id = f_boot_id.read().strip()
+        except OSError:
+            return None
+
+        # Some values embed default strings (e.g. `Model`), so configured ones are bound too.
+        return [boot_id, platform.release(), Configuration().get("default_strings")]
+
+    @staticmethod
+    def get_key(entry_type_name: str, entry: dict) -> str:
+        """Return fact key of entry `entry_type_name` configured with `entry` (name and options)"""
+        return f"{entry_type_name}:{json.dumps(entry, sort_keys=True, default=str)}"
+
+    def get(self, key: str) -> Any:
+        """Return fact snapshotted under `key` during current boot, or `None`"""
+        return self._facts.get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        """Snapshot (JSON-serializable) `value` under `key`, see `save`"""
+        # Records are stored as dictionaries, and validated when rebuilt (see `Entry.from_value`).
+        if isinstance(value, Record):
+            value = value.as_dict()
+
+        if self._facts.get(key) != value:
+            self._facts[key] = value
+            self._updated = True
+
+    def save(self) -> None:
+        """Store snapshot (only when it has been updated)"""
+        if self._fingerprint is not None and self._updated:
+            self._cache.set("facts", self._facts, fingerprint=self._fingerprint)
+            self._updated = False
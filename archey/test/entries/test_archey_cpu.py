@@ -1,7 +1,7 @@
 """Test module for Archey's CPU detection module"""
 
 import unittest
-from unittest.mock import MagicMock, call, mock_open, patch
+from unittest.mock import MagicMock, Mock, call, patch
 
 from archey.configuration import DEFAULT_CONFIG
 from archey.entries.cpu import CPU
@@ -11,13 +11,13 @@ from archey.test.entries import HelperMethods
 
 class TestCPUEntry(unittest.TestCase, CustomAssertions):
     """
-    Here, we mock the `open` call on `/proc/cpuinfo` with fake content.
+    Here, we mock the `/proc/cpuinfo` (shared) read with fake content.
     In some cases, `lscpu` output is being mocked too.
     """
 
     @patch(
-        "archey.entries.cpu.open",
-        mock_open(read_data="""\
+        "archey.entries.cpu.PseudoFiles.read",
+        Mock(return_value="""\
 processor\t: 0
 vendor_id\t: CPU-VENDOR-NAME
 cpu family\t: X
@@ -34,8 +34,8 @@ physical id\t: 0
         )
 
     @patch(
-        "archey.entries.cpu.open",
-        mock_open(read_data="""\
+        "archey.entries.cpu.PseudoFiles.read",
+        Mock(return_value="""\
 processor\t: 0
 vendor_id\t: CPU-VENDOR-NAME
 cpu family\t: X
@@ -66,8 +66,8 @@ physical id\t: 1
         )
 
     @patch(
-        "archey.entries.cpu.open",
-        mock_open(read_data="""\
+        "archey.entries.cpu.PseudoFiles.read",
+        Mock(return_value="""\
 processor\t: 0
 vendor_id\t: CPU-VENDOR-NAME
 cpu family\t: X
@@ -105,8 +105,8 @@ physical id\t: 1
         )
 
     @patch(
-        "archey.entries.cpu.open",
-        mock_open(read_data="""\
+        "archey.entries.cpu.PseudoFiles.read",
+        Mock(return_value="""\
 processor\t: 0
 vendor_id\t: CPU-VENDOR-NAME
 cpu family\t: X
@@ -149,7 +149,7 @@ physical id\t: 1
             ],
         )
 
-    @patch("archey.entries.cpu.open", side_effect=PermissionError())
+    @patch("archey.entries.cpu.PseudoFiles.read", side_effect=PermissionError())
     def test_parse_proc_cpuinfo_unreadable_file(self, _):
         """Check behavior when `/proc/cpuinfo` could not be read from disk"""
         self.assertListEmpty(CPU._parse_proc_cpuinfo())  # pylint: disable=protected-access
@@ -3,6 +3,7 @@
 import os
 import stat
 import unittest
+from tempfile import TemporaryDirectory
 from unittest.mock import MagicMock, call, patch
 
 from archey.configuration import DEFAULT_CONFIG, Configuration
@@ -62,6 +63,43 @@ class TestCustomEntry(unittest.TestCase):
         )
         self.assertIsNone(custom.value, None)
 
+    def test_command_timeout(self) -> None:
+        """Check command is killed (and entry not detected) on timeout"""
+        custom = Custom(
+            options={
+                "command": ["sleep", "5"],
+                "timeout": 0.1,
+            }
+        )
+        self.assertIsNone(custom.value)
+
+    def test_cached_command_output(self) -> None:
+        """Check command output caching, and its invalidation on key files modification"""
+        with TemporaryDirectory() as temp_dir, patch.dict(
+            "os.environ", {"XDG_CACHE_HOME": temp_dir}
+        ):
+            counter_file = os.path.join(temp_dir, "counter")
+            key_file = os.path.join(temp_dir, "key_file")
+            options = {
+                "shell": True,
+                "command": f"echo x >> {counter_file}; grep -c x {counter_file}",
+                "cache_ttl": 60,
+                "cache_key_files": [key_file],
+            }
+
+            self.assertListEqual(Custom(options=options).value, ["1"])
+            self.assertListEqual(Custom(options=options).value, ["1"])
+
+            with self.subTest("Key file created."):
+                with open(key_file, "w", encoding="UTF-8") as f_key_file:
+                    f_key_file.write("modified")
+                self.assertListEqual(Custom(options=options).value, ["2"])
+                self.assertListEqual(Custom(options=options).value, ["2"])
+
+            with self.subTest("Cache disabled."):
+                options["cache_ttl"] = None
+                self.assertListEqual(Custom(options=options).value, ["3"])
+
     def test_multiple_lines_command_output(self) -> None:
         """Check multiple lines command output"""
         custom = Custom(
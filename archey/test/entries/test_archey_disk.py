@@ -1,6 +1,8 @@
 """Test module for Archey's disks usage detection module"""
 
+import logging
 import unittest
+from subprocess import TimeoutExpired
 from unittest.mock import MagicMock, call, patch
 
 from archey.colors import Colors
@@ -332,7 +334,9 @@ class TestDiskEntry(unittest.TestCase):
                 ]
             )
             self.assertDictEqual(
-                Disk._get_df_output_dict(),  # pylint: disable=protected-access
+                Disk._get_df_output_dict(  # pylint: disable=protected-access
+                    self.disk_instance_mock
+                ),
                 {
                     "/": {
                         "device_path": "/dev/nvme0n1p2",
@@ -353,9 +357,18 @@ class TestDiskEntry(unittest.TestCase):
                 },
             )
 
-        with self.subTest("`df` missing from system."):
-            run_mock.side_effect = FileNotFoundError()
-            self.assertDictEqual(Disk._get_df_output_dict(), {})  # pylint: disable=protected-access
+        for error in (FileNotFoundError(), TimeoutExpired("df", 10)):
+            with self.subTest("`df` failed.", error=error), patch(
+                "archey.entries.disk.run", side_effect=error
+            ), patch.object(logging.getLogger("archey.entries.disk"), "warning") as warning_mock:
+                self.assertDictEqual(
+                    Disk._get_df_output_dict(  # pylint: disable=protected-access
+                        self.disk_instance_mock
+                    ),
+                    {},
+                )
+                # `df` timeouts are reported.
+                self.assertEqual(warning_mock.called, isinstance(error, TimeoutExpired))
 
     def test_disk_blocks_to_human_readable(self):
         """Test method to convert 1024-byte blocks to a human readable format."""
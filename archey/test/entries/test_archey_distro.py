@@ -4,7 +4,7 @@ import unittest
 from unittest.mock import MagicMock, patch
 
 from archey.configuration import DEFAULT_CONFIG
-from archey.entries.distro import Distro
+from archey.entries.distro import Distro, DistroValue
 from archey.test.entries import HelperMethods
 
 
@@ -50,10 +50,7 @@ class TestDistroEntry(unittest.TestCase):
         distro_intance_mock = HelperMethods.entry_mock(Distro)
         output_mock = MagicMock()
 
-        distro_intance_mock.value = {
-            "name": None,
-            "arch": "ARCHITECTURE",
-        }
+        distro_intance_mock.value = DistroValue(None, "ARCHITECTURE")
 
         Distro.output(distro_intance_mock, output_mock)
         self.assertEqual(
@@ -1,10 +1,12 @@
 """Test module for Archey's kernel information detection module"""
 
+import time
 import unittest
+from tempfile import TemporaryDirectory
 from unittest.mock import MagicMock, Mock, patch
 
 from archey.configuration import DEFAULT_CONFIG
-from archey.entries.kernel import Kernel
+from archey.entries.kernel import KERNEL_RELEASES_URL, Kernel
 from archey.test.entries import HelperMethods
 
 
@@ -24,13 +26,17 @@ class TestKernelEntry(unittest.TestCase):
     )
     def test_fetch_kernel_release(self, _, __):
         """Verify `platform` module mocking"""
-        self.assertEqual(Kernel().value["name"], "Linux")
-        self.assertEqual(Kernel().value["release"], "X.Y.Z-R-arch")
+        self.assertEqual(Kernel().value.name, "Linux")
+        self.assertEqual(Kernel().value.release, "X.Y.Z-R-arch")
 
-    @patch("archey.entries.kernel.urlopen")
-    def test_fetch_latest_linux_release(self, urlopen_mock):
+    @patch("archey.entries.kernel.HTTPClient")
+    def test_fetch_latest_linux_release(self, http_client_mock):
         """Check proper JSON decoding and value gathering"""
-        urlopen_mock.return_value.__enter__.return_value.read.return_value = b"""\
+        http_response_mock = (
+            http_client_mock.return_value.request.return_value.__enter__.return_value
+        )
+        http_response_mock.status = 200
+        http_response_mock.read.return_value = b"""\
 {
     "latest_stable": {
         "version": "5.10.1"
@@ -74,8 +80,103 @@ class TestKernelEntry(unittest.TestCase):
         }
     ]
 }"""
+        http_response_mock.headers = {"ETag": '"5fd7c8ea-2d4f"'}
+
+        self.assertDictEqual(
+            Kernel._request_latest_linux_release(1, {}),  # pylint: disable=protected-access
+            {"version": "5.10.1", "etag": '"5fd7c8ea-2d4f"', "last_modified": None},
+        )
+
+        # Document has been streamed, until `latest_stable` object could be read.
+        http_response_mock.read.assert_called_once_with(4096)
+        http_client_mock.return_value.request.assert_called_once_with(KERNEL_RELEASES_URL, 1, {})
+
+    @patch("archey.entries.kernel.HTTPClient")
+    def test_fetch_latest_linux_release_chunked(self, http_client_mock):
+        """Check `latest_stable` object may be split across received chunks"""
+        http_response_mock = (
+            http_client_mock.return_value.request.return_value.__enter__.return_value
+        )
+        http_response_mock.status = 200
+        http_response_mock.read.side_effect = [
+            b'{"latest_st',
+            b'able": {"vers',
+            b'ion": "6.11.4"}, "releases": [',
+            b"",
+        ]
+
         self.assertEqual(
-            Kernel._fetch_latest_linux_release(), "5.10.1"  # pylint: disable=protected-access
+            Kernel._request_latest_linux_release(1, {}).get(  # pylint: disable=protected-access
+                "version"
+            ),
+            "6.11.4",
+        )
+        self.assertEqual(http_response_mock.read.call_count, 3)
+
+        http_response_mock.read.side_effect = [b"<html>", b""]
+        self.assertDictEqual(
+            Kernel._request_latest_linux_release(1, {}),  # pylint: disable=protected-access
+            {},
+        )
+
+    def test_latest_linux_release_cache(self):
+        """Check latest release caching and conditional revalidation"""
+        with TemporaryDirectory() as temp_dir, patch.dict(
+            "os.environ", {"XDG_CACHE_HOME": temp_dir}
+        ), patch(
+            "archey.entries.kernel.Kernel._request_latest_linux_release",
+            return_value={"version": "6.11.4", "etag": '"abc"', "last_modified": None},
+        ) as request_mock:
+            # First run fetches and caches release.
+            self.assertEqual(
+                Kernel._fetch_latest_linux_release(1, 60),  # pylint: disable=protected-access
+                "6.11.4",
+            )
+            request_mock.assert_called_once_with(1, {})
+
+            # Second run does not make any request.
+            self.assertEqual(
+                Kernel._fetch_latest_linux_release(1, 60),  # pylint: disable=protected-access
+                "6.11.4",
+            )
+            request_mock.assert_called_once()
+
+            with patch("archey.cache.time.time", return_value=time.time() + 3600):
+                # Once expired, cached release is revalidated (here, upstream is unreachable).
+                request_mock.return_value = {}
+                self.assertEqual(
+                    Kernel._fetch_latest_linux_release(1, 60),  # pylint: disable=protected-access
+                    "6.11.4",
+                )
+                request_mock.assert_called_with(
+                    1, {"version": "6.11.4", "etag": '"abc"', "last_modified": None}
+                )
+
+            # Cache disabled.
+            request_mock.return_value = {"version": "6.11.5"}
+            self.assertEqual(
+                Kernel._fetch_latest_linux_release(1, False),  # pylint: disable=protected-access
+                "6.11.5",
+            )
+            request_mock.assert_called_with(1, {})
+
+    @patch("archey.entries.kernel.HTTPClient")
+    def test_latest_linux_release_revalidation(self, http_client_mock):
+        """Check conditional request and `304 Not Modified` handling"""
+        http_client_mock.return_value.request.return_value.__enter__.return_value.status = 304
+
+        cached_release = {"version": "6.11.4", "etag": '"abc"', "last_modified": "Sat, 1 Jan"}
+        self.assertDictEqual(
+            Kernel._request_latest_linux_release(  # pylint: disable=protected-access
+                1, cached_release
+            ),
+            cached_release,
+        )
+
+        http_client_mock.return_value.request.assert_called_once_with(
+            KERNEL_RELEASES_URL,
+            1,
+            {"If-None-Match": '"abc"', "If-Modified-Since": "Sat, 1 Jan"},
         )
 
     @patch(
@@ -94,8 +195,8 @@ class TestKernelEntry(unittest.TestCase):
         """Check behavior on non-Linux platforms"""
         kernel = Kernel(options={"check_version": True})
 
-        self.assertIsNone(kernel.value["latest"])
-        self.assertIsNone(kernel.value["is_outdated"])
+        self.assertIsNone(kernel.value.latest)
+        self.assertIsNone(kernel.value.is_outdated)
 
     @patch(
         "archey.entries.kernel.platform.release",
@@ -109,8 +210,8 @@ class TestKernelEntry(unittest.TestCase):
         """Check `DO_NOT_TRACK` is correctly honored"""
         kernel = Kernel(options={"check_version": True})
 
-        self.assertIsNone(kernel.value["latest"])
-        self.assertIsNone(kernel.value["is_outdated"])
+        self.assertIsNone(kernel.value.latest)
+        self.assertIsNone(kernel.value.is_outdated)
 
     @patch(
         "archey.entries.kernel.platform.release",
@@ -142,8 +243,8 @@ class TestKernelEntry(unittest.TestCase):
         kernel = Kernel(options={"check_version": True})
         kernel.output(output_mock)
 
-        self.assertTrue(kernel.value["latest"])
-        self.assertIs(kernel.value["is_outdated"], False)
+        self.assertTrue(kernel.value.latest)
+        self.assertIs(kernel.value.is_outdated, False)
         self.assertEqual(
             output_mock.append.call_args[0][1],
             f"Linux 1.2.3-4-arch ({DEFAULT_CONFIG['default_strings']['latest']})",
@@ -153,8 +254,8 @@ class TestKernelEntry(unittest.TestCase):
         kernel = Kernel(options={"check_version": True})
         kernel.output(output_mock)
 
-        self.assertTrue(kernel.value["latest"])
-        self.assertIs(kernel.value["is_outdated"], True)
+        self.assertTrue(kernel.value.latest)
+        self.assertIs(kernel.value.is_outdated, True)
         self.assertEqual(
             output_mock.append.call_args[0][1],
             f"Linux 1.2.3-4-arch (1.3.2 {DEFAULT_CONFIG['default_strings']['available']})",
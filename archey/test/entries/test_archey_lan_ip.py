@@ -1,7 +1,8 @@
 """Test module for Archey's LAN IP addresses detection module"""
 
+import socket
 import unittest
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import MagicMock, Mock, call, patch
 
 from netifaces import AF_INET, AF_INET6, AF_LINK
 
@@ -11,9 +12,104 @@ from archey.test import CustomAssertions
 from archey.test.entries import HelperMethods
 
 
+# rtnetlink is made unavailable by default, so `netifaces` fallback is being tested.
+@patch(
+    "archey.entries.lan_ip.Network.get_interfaces_addresses",
+    Mock(side_effect=OSError()),
+)
+@patch(
+    "archey.entries.lan_ip.Network.get_default_route_interfaces",
+    Mock(return_value=[]),
+)
 class TestLanIPEntry(unittest.TestCase, CustomAssertions):
     """Here, we mock the `netifaces` usages (interfaces and addresses detection calls)"""
 
+    def test_rtnetlink(self):
+        """Test rtnetlink (GNU/Linux) interfaces addresses enumeration"""
+        with patch(
+            "archey.entries.lan_ip.Network.get_interfaces_addresses",
+            return_value={
+                "lo": [
+                    (socket.AF_INET, socket.inet_pton(socket.AF_INET, "127.0.0.1")),
+                    (socket.AF_INET6, socket.inet_pton(socket.AF_INET6, "::1")),
+                ],
+                "en0": [
+                    (
+                        socket.AF_INET6,
+                        socket.inet_pton(socket.AF_INET6, "fe80::abcd:ef0:abef:dead"),
+                    ),
+                    (socket.AF_INET6, socket.inet_pton(socket.AF_INET6, "2a02::45:6789:abcd:123")),
+                    (socket.AF_INET, socket.inet_pton(socket.AF_INET, "192.168.1.55")),
+                    (socket.AF_INET, socket.inet_pton(socket.AF_INET, "100.64.1.2")),
+                    (socket.AF_INET, socket.inet_pton(socket.AF_INET, "8.8.8.8")),
+                ],
+            },
+        ), patch("archey.entries.lan_ip.netifaces") as netifaces_mock:
+            self.assertListEqual(
+                LanIP(options={"max_count": False}).value,
+                ["192.168.1.55", "100.64.1.2", "fe80::abcd:ef0:abef:dead"],
+            )
+            self.assertListEqual(
+                LanIP(options={"max_count": False, "show_global": True}).value,
+                [
+                    "192.168.1.55",
+                    "100.64.1.2",
+                    "8.8.8.8",
+                    "fe80::abcd:ef0:abef:dead",
+                    "2a02::45:6789:abcd:123",
+                ],
+            )
+
+            # `netifaces` is not used at all.
+            netifaces_mock.interfaces.assert_not_called()
+
+    def test_interfaces_selection(self):
+        """Test interfaces filtering and default route interface ordering"""
+        with patch(
+            "archey.entries.lan_ip.Network.get_interfaces_addresses",
+            return_value={
+                "lo": [(socket.AF_INET, socket.inet_pton(socket.AF_INET, "127.0.0.1"))],
+                "docker0": [(socket.AF_INET, socket.inet_pton(socket.AF_INET, "172.17.0.1"))],
+                "veth1234": [
+                    (socket.AF_INET6, socket.inet_pton(socket.AF_INET6, "fe80::1234")),
+                ],
+                "en0": [(socket.AF_INET, socket.inet_pton(socket.AF_INET, "10.0.0.2"))],
+                "wlo1": [(socket.AF_INET, socket.inet_pton(socket.AF_INET, "192.168.1.55"))],
+            },
+        ), patch(
+            "archey.entries.lan_ip.Network.get_default_route_interfaces",
+            return_value=["wlo1"],
+        ):
+            with self.subTest("Default route interface first."):
+                self.assertListEqual(
+                    LanIP(options={"max_count": 1}).value,
+                    ["192.168.1.55"],
+                )
+                self.assertListEqual(
+                    LanIP(options={"max_count": False}).value,
+                    ["192.168.1.55", "172.17.0.1", "fe80::1234", "10.0.0.2"],
+                )
+
+            with self.subTest("Excluded interfaces."):
+                self.assertListEqual(
+                    LanIP(
+                        options={"max_count": False, "interface_exclude": ["docker*", "veth*"]}
+                    ).value,
+                    ["192.168.1.55", "10.0.0.2"],
+                )
+
+            with self.subTest("Included (and excluded) interfaces."):
+                self.assertListEqual(
+                    LanIP(
+                        options={
+                            "max_count": False,
+                            "interface_include": ["en*", "docker*"],
+                            "interface_exclude": ["docker*"],
+                        }
+                    ).value,
+                    ["10.0.0.2"],
+                )
+
     @patch(
         "archey.entries.lan_ip.netifaces.interfaces",
         return_value=["lo", "en0", "wlo1"],
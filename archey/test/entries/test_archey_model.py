@@ -215,40 +215,44 @@ class TestModelEntry(unittest.TestCase):
 
     def test_fetch_raspberry_pi_revision(self):
         """Test `_fetch_raspberry_pi_revision` static method"""
-        with patch("archey.entries.model.open", mock_open()) as mock:
-            mock.return_value.read.side_effect = [
-                "Raspberry Pi 3 Model B Plus Rev 1.3\n",
-            ]
+        with patch(
+            "archey.entries.model.open",
+            mock_open(read_data="Raspberry Pi 3 Model B Plus Rev 1.3\n"),
+        ), patch("archey.entries.model.PseudoFiles.read") as pseudo_files_read_mock:
             self.assertEqual(
                 Model._fetch_raspberry_pi_revision(),  # pylint: disable=protected-access
                 "Raspberry Pi 3 Model B Plus Rev 1.3",
             )
-
-            mock.return_value.read.side_effect = [
-                FileNotFoundError(),  # /proc/device-tree/model doesn't exist
-                "Revision\t: REV\nSerial\t: SERIAL\nModel\t: HARDWARE Model MODEL Rev REVISION\n",
-            ]
-            self.assertEqual(
-                Model._fetch_raspberry_pi_revision(),  # pylint: disable=protected-access
-                "HARDWARE Model MODEL Rev REVISION",
-            )
-
-            mock.return_value.read.side_effect = [
-                FileNotFoundError(),  # /proc/device-tree/model doesn't exist
-                "Hardware\t: HARDWARE\nRevision\t: REVISION\n",
-            ]
-            self.assertEqual(
-                Model._fetch_raspberry_pi_revision(),  # pylint: disable=protected-access
-                "Raspberry Pi HARDWARE (Rev. REVISION)",
-            )
-
-            mock.return_value.read.side_effect = [
-                FileNotFoundError(),  # /proc/device-tree/model doesn't exist
-                "processor   : 0\ncpu family  : X\n",
-            ]
-            self.assertIsNone(
-                Model._fetch_raspberry_pi_revision()  # pylint: disable=protected-access
-            )
+            pseudo_files_read_mock.assert_not_called()
+
+        # /proc/device-tree/model doesn't exist from now on.
+        with patch("archey.entries.model.open", side_effect=FileNotFoundError()):
+            for cpu_info, expected_revision in (
+                (
+                    "Revision\t: REV\nSerial\t: SERIAL\n"
+                    "Model\t: HARDWARE Model MODEL Rev REVISION\n",
+                    "HARDWARE Model MODEL Rev REVISION",
+                ),
+                (
+                    "Hardware\t: HARDWARE\nRevision\t: REVISION\n",
+                    "Raspberry Pi HARDWARE (Rev. REVISION)",
+                ),
+                ("processor   : 0\ncpu family  : X\n", None),
+            ):
+                with self.subTest(cpu_info=cpu_info), patch(
+                    "archey.entries.model.PseudoFiles.read", return_value=cpu_info
+                ):
+                    self.assertEqual(
+                        Model._fetch_raspberry_pi_revision(),  # pylint: disable=protected-access
+                        expected_revision,
+                    )
+
+            with self.subTest("Unreadable /proc/cpuinfo."), patch(
+                "archey.entries.model.PseudoFiles.read", side_effect=PermissionError()
+            ):
+                self.assertIsNone(
+                    Model._fetch_raspberry_pi_revision()  # pylint: disable=protected-access
+                )
 
     @patch(
         "archey.entries.model.check_output",
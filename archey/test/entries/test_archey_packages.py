@@ -1,19 +1,20 @@
 """Test module for Archey's installed system packages detection module"""
 
+import logging
 import unittest
-from unittest.mock import DEFAULT as DEFAULT_SENTINEL
+from subprocess import TimeoutExpired
 from unittest.mock import MagicMock, call, patch
 
 from archey.configuration import DEFAULT_CONFIG
 from archey.distributions import Distributions
-from archey.entries.packages import Packages
+from archey.entries.packages import PACKAGES_TOOLS_TIMEOUT, Packages
 from archey.test.entries import HelperMethods
 
 
 class TestPackagesEntry(unittest.TestCase):
     """
-    Here, we mock the `check_output` calls and check afterwards
-      that the outputs are correct.
+    Here, we mock the `count_output` calls (with packages tools outputs) and check afterwards
+      that the counts are correct.
     Sorry for the code style, mocking this class is pretty boring.
 
     Note: Due to the presence of trailing spaces, we may have to manually
@@ -25,7 +26,7 @@ class TestPackagesEntry(unittest.TestCase):
         Distributions.get_local.cache_clear()
 
     @patch(
-        "archey.entries.packages.check_output",
+        "archey.entries.packages.count_output",
         return_value="""\
 sqlite-libs-3.30.1-r1 x86_64 {{sqlite}} (Public-Domain) [installed]
 musl-1.1.24-r2 x86_64 {{musl}} (MIT) [installed]
@@ -37,14 +38,14 @@ apk-tools-2.10.4-r3 x86_64 {{apk}-tools} (GPL2) [installed]
 readline-8.0.1-r0 x86_64 {{readline}} (GPL-2.0-or-later) [installed]
 """,
     )
-    def test_match_with_apk(self, check_output_mock):
+    def test_match_with_apk(self, count_output_mock):
         """Simple test for the APK packages manager"""
-        check_output_mock.side_effect = self._check_output_side_effect("apk")
+        count_output_mock.side_effect = self._count_output_side_effect(count_output_mock, "apk")
 
         self.assertDictEqual(Packages().value, {"apk": 8})
 
     @patch(
-        "archey.entries.packages.check_output",
+        "archey.entries.packages.count_output",
         return_value="""\
 Installed Packages
 GConf2.x86_64                  3.2.6-17.fc26           @@commandline
@@ -53,14 +54,14 @@ GeoIP-GeoLite-data.noarch      2017.07-1.fc26          @@commandline
 GraphicsMagick.x86_64          1.3.26-3.fc26           @@commandline
 """,
     )
-    def test_match_with_dnf(self, check_output_mock):
+    def test_match_with_dnf(self, count_output_mock):
         """Simple test for the DNF packages manager"""
-        check_output_mock.side_effect = self._check_output_side_effect("dnf")
+        count_output_mock.side_effect = self._count_output_side_effect(count_output_mock, "dnf")
 
         self.assertDictEqual(Packages().value, {"dnf": 4})
 
     @patch(
-        "archey.entries.packages.check_output",
+        "archey.entries.packages.count_output",
         return_value="""\
 accountsservice         install
 acl                     install
@@ -71,14 +72,14 @@ albatross-gtk-theme     deinstall
 alien                   install
 """,
     )
-    def test_match_with_dpkg(self, check_output_mock):
+    def test_match_with_dpkg(self, count_output_mock):
         """Simple test for the DPKG packages manager"""
-        check_output_mock.side_effect = self._check_output_side_effect("dpkg")
+        count_output_mock.side_effect = self._count_output_side_effect(count_output_mock, "dpkg")
 
         self.assertDictEqual(Packages().value, {"dpkg": 6})
 
     @patch(
-        "archey.entries.packages.check_output",
+        "archey.entries.packages.count_output",
         return_value="""\
 
 These are the packages that would be merged, in order:
@@ -93,14 +94,14 @@ USE="pam -static-libs" ABI_X86="(64) -32 (-x32)" \n\
 
 """,
     )
-    def test_match_with_emerge(self, check_output_mock):
+    def test_match_with_emerge(self, count_output_mock):
         """Simple test for the Emerge packages manager"""
-        check_output_mock.side_effect = self._check_output_side_effect("emerge")
+        count_output_mock.side_effect = self._count_output_side_effect(count_output_mock, "emerge")
 
         self.assertDictEqual(Packages().value, {"emerge": 5})
 
     @patch(
-        "archey.entries.packages.check_output",
+        "archey.entries.packages.count_output",
         return_value="""\
 Name                                                    Application ID                                                  Version                  Branch                  Origin                    Installation
 Discord                                                 com.discordapp.Discord                                          0.0.35                   stable                  flathub                   system
@@ -109,14 +110,14 @@ draw.io                                                 com.jgraph.drawio.deskto
 Extension Manager                                       com.mattjakeman.ExtensionManager                                0.4.2                    stable                  flathub                   system
 """,
     )
-    def test_match_with_flatpak(self, check_output_mock):
+    def test_match_with_flatpak(self, count_output_mock):
         """Simple test for the Flatpak packages manager"""
-        check_output_mock.side_effect = self._check_output_side_effect("flatpak")
+        count_output_mock.side_effect = self._count_output_side_effect(count_output_mock, "flatpak")
 
         self.assertDictEqual(Packages().value, {"flatpak": 4})
 
     @patch(
-        "archey.entries.packages.check_output",
+        "archey.entries.packages.count_output",
         return_value="""\
 nix-2.3.4
 nss-cacert-3.49.2
@@ -124,14 +125,14 @@ python3-3.8.2
 python3.8-pip-20.1
 """,
     )
-    def test_match_with_nix_env(self, check_output_mock):
+    def test_match_with_nix_env(self, count_output_mock):
         """Simple test for the Emerge packages manager"""
-        check_output_mock.side_effect = self._check_output_side_effect("nix-env")
+        count_output_mock.side_effect = self._count_output_side_effect(count_output_mock, "nix-env")
 
         self.assertDictEqual(Packages().value, {"nix-env": 4})
 
     @patch(
-        "archey.entries.packages.check_output",
+        "archey.entries.packages.count_output",
         return_value="""\
 acl 2.2.52-4
 archey4 v4.3.3-1
@@ -139,14 +140,14 @@ archlinux-keyring 20180108-1
 argon2 20171227-3
 """,
     )
-    def test_match_with_pacman(self, check_output_mock):
+    def test_match_with_pacman(self, count_output_mock):
         """Simple test for the Pacman packages manager"""
-        check_output_mock.side_effect = self._check_output_side_effect("pacman")
+        count_output_mock.side_effect = self._count_output_side_effect(count_output_mock, "pacman")
 
         self.assertDictEqual(Packages().value, {"pacman": 4})
 
     @patch(
-        "archey.entries.packages.check_output",
+        "archey.entries.packages.count_output",
         return_value="""\
 bzip2-1.0.8         block-sorting file compressor, unencumbered
 gettext-runtime-0.20.1p0 GNU gettext runtime libraries and programs
@@ -159,15 +160,17 @@ sqlite3-3.29.0      embedded SQL implementation
 xz-5.2.4            LZMA compression and decompression tools
 """,
     )
-    def test_match_with_pkg_info(self, check_output_mock):
+    def test_match_with_pkg_info(self, count_output_mock):
         """Simple test for the OpenBSD `pkg_*` package manager"""
-        check_output_mock.side_effect = self._check_output_side_effect("pkg_info")
+        count_output_mock.side_effect = self._count_output_side_effect(
+            count_output_mock, "pkg_info"
+        )
 
         self.assertDictEqual(Packages().value, {"pkg_info": 9})
 
     @patch("archey.entries.packages.Distributions.get_local", return_value=Distributions.FREEBSD)
     @patch(
-        "archey.entries.packages.check_output",
+        "archey.entries.packages.count_output",
         return_value="""\
 gettext-runtime-0.20.1         GNU gettext runtime libraries and programs
 indexinfo-0.3.1                Utility to regenerate the GNU info page index
@@ -179,14 +182,14 @@ python37-3.7.7                 Interpreted object-oriented programming language
 readline-8.0.4                 Library for editing command lines as they are typed
 """,
     )
-    def test_match_with_pkg(self, check_output_mock, _):
+    def test_match_with_pkg(self, count_output_mock, _):
         """Simple test for the FreeBSD `pkg` package manager"""
-        check_output_mock.side_effect = self._check_output_side_effect("pkg")
+        count_output_mock.side_effect = self._count_output_side_effect(count_output_mock, "pkg")
 
         self.assertDictEqual(Packages().value, {"pkg": 8})
 
     @patch(
-        "archey.entries.packages.check_output",
+        "archey.entries.packages.count_output",
         return_value="""\
 desktop-file-utils-0.26 Utilities to manage desktop entries
 glib2-2.68.2         Some useful routines for C programming (glib2)
@@ -203,14 +206,14 @@ pkg_install-20210410 Package management and administration tools for pkgsrc
 pkgin-20.12.1nb1     Apt / yum like tool for managing pkgsrc binary packages
 """,
     )
-    def test_match_with_pkgin(self, check_output_mock):
+    def test_match_with_pkgin(self, count_output_mock):
         """Simple test for the (NetBSD) `pkgin` package manager"""
-        check_output_mock.side_effect = self._check_output_side_effect("pkgin")
+        count_output_mock.side_effect = self._count_output_side_effect(count_output_mock, "pkgin")
 
         self.assertDictEqual(Packages().value, {"pkgin": 13})
 
     @patch(
-        "archey.entries.packages.check_output",
+        "archey.entries.packages.count_output",
         return_value="""\
 The following ports are currently installed:
   a52dec @0.7.4_0 (active)
@@ -229,14 +232,14 @@ The following ports are currently installed:
   zlib @1.2.8_0 (active)
 """,
     )
-    def test_match_with_macports(self, check_output_mock):
+    def test_match_with_macports(self, count_output_mock):
         """Simple test for the MacPorts CLI client (`port`) package manager"""
-        check_output_mock.side_effect = self._check_output_side_effect("port")
+        count_output_mock.side_effect = self._count_output_side_effect(count_output_mock, "port")
 
         self.assertDictEqual(Packages().value, {"port": 14})
 
     @patch(
-        "archey.entries.packages.check_output",
+        "archey.entries.packages.count_output",
         return_value="""\
 cdrecord-2.01-10.7.el5
 bluez-libs-3.7-1.1
@@ -244,14 +247,14 @@ setarch-2.0-1.1
 MySQL-client-3.23.57-1
 """,
     )
-    def test_match_with_rpm(self, check_output_mock):
+    def test_match_with_rpm(self, count_output_mock):
         """Simple test for the RPM packages manager"""
-        check_output_mock.side_effect = self._check_output_side_effect("rpm")
+        count_output_mock.side_effect = self._count_output_side_effect(count_output_mock, "rpm")
 
         self.assertDictEqual(Packages().value, {"rpm": 4})
 
     @patch(
-        "archey.entries.packages.check_output",
+        "archey.entries.packages.count_output",
         return_value="""\
 Loaded plugins: fastestmirror, langpacks
 Installed Packages
@@ -261,14 +264,14 @@ ModemManager.x86_64             1.6.0-2.el7         @base            \n\
 ModemManager-glib.x86_64        1.6.0-2.el7         @base            \n\
 """,
     )
-    def test_match_with_yum(self, check_output_mock):
+    def test_match_with_yum(self, count_output_mock):
         """Simple test for the Yum packages manager"""
-        check_output_mock.side_effect = self._check_output_side_effect("yum")
+        count_output_mock.side_effect = self._count_output_side_effect(count_output_mock, "yum")
 
         self.assertDictEqual(Packages().value, {"yum": 4})
 
     @patch(
-        "archey.entries.packages.check_output",
+        "archey.entries.packages.count_output",
         return_value="""\
 Loading repository data...
 Reading installed packages...
@@ -282,9 +285,9 @@ i  | GNOME Nibbles | Guide a worm around a maze          | application
 i  | at            | A Job Manager                       | package    \n\
 """,
     )
-    def test_match_with_zypper(self, check_output_mock):
+    def test_match_with_zypper(self, count_output_mock):
         """Simple test for the Zypper packages manager"""
-        check_output_mock.side_effect = self._check_output_side_effect("zypper")
+        count_output_mock.side_effect = self._count_output_side_effect(count_output_mock, "zypper")
 
         self.assertDictEqual(Packages().value, {"zypper": 5})
 
@@ -295,25 +298,43 @@ i  | at            | A Job Manager                       | package    \n\
             {"cmd": ("pkg_tool_2",), "skew": 2},
         ),
     )
-    @patch(
-        "archey.entries.packages.check_output",
-        side_effect=[
-            """\
+    @patch("archey.entries.packages.count_output")
+    def test_multiple_package_managers(self, count_output_mock):
+        """Simple test for multiple packages managers"""
+        outputs = {
+            "pkg_tool_1": """\
 sample_package_1_1
 sample_package_1_2
 """,
-            """\
+            "pkg_tool_2": """\
   Incredible list of installed packages:
 sample_package_2_1
 sample_package_2_2
 
 """,
-        ],
-    )
-    def test_multiple_package_managers(self, _):
-        """Simple test for multiple packages managers"""
+        }
+        count_output_mock.side_effect = lambda args, patterns, **_: [
+            outputs[args[0]].encode().count(pattern) for pattern in patterns
+        ]
+
         self.assertDictEqual(Packages().value, {"acae_loot_42": 2, "pkg_tool_2": 2})
 
+    @patch(
+        "archey.entries.packages.PACKAGES_TOOLS",
+        new=({"cmd": ("pkg_tool_1",)},),
+    )
+    @patch(
+        "archey.entries.packages.count_output",
+        side_effect=TimeoutExpired("pkg_tool_1", 300),
+    )
+    def test_timed_out_package_manager(self, count_output_mock):
+        """Check timed out packages managers are reported, and bounded by a generous timeout"""
+        with patch.object(logging.getLogger("archey.entries.packages"), "warning") as warning_mock:
+            self.assertDictEqual(Packages().value, {})
+        warning_mock.assert_called_once()
+
+        self.assertEqual(count_output_mock.call_args[1]["timeout"], PACKAGES_TOOLS_TIMEOUT)
+
     @HelperMethods.patch_clean_configuration
     def test_various_output_configuration(self):
         """Test `output` overloading based on user preferences combination"""
@@ -376,21 +397,23 @@ sample_package_2_2
             )
 
     @staticmethod
-    def _check_output_side_effect(pkg_manager_cmd=None):
-        """Internal helper method to facilitate `check_output` mocking"""
+    def _count_output_side_effect(count_output_mock, pkg_manager_cmd=None):
+        """Internal helper method to facilitate `count_output` mocking"""
 
-        def _check_output(args, stderr, env, universal_newlines):  # pylint: disable=unused-argument
+        def _count_output(args, patterns, **_):
             """
-            This closure is a drop-replacement for our `check_output` call.
-            If the _called_ program is `pkg_manager_cmd`, patched `return_value` will be returned.
+            This closure is a drop-replacement for our `count_output` call.
+            If the _called_ program is `pkg_manager_cmd`, `patterns` occurrences in patched
+              `return_value` (i.e. tool output) will be returned.
             If not, `FileNotFoundError` would be raised.
             """
             if args[0] == pkg_manager_cmd:
-                return DEFAULT_SENTINEL
+                output = count_output_mock.return_value.encode()
+                return [output.count(pattern) for pattern in patterns]
 
             raise FileNotFoundError
 
-        return _check_output
+        return _count_output
 
 
 if __name__ == "__main__":
@@ -1,18 +1,18 @@
 """Test module for Archey's RAM usage detection module"""
 
 import unittest
-from unittest.mock import MagicMock, mock_open, patch
+from unittest.mock import MagicMock, Mock, patch
 
 from archey.colors import Colors
 from archey.configuration import DEFAULT_CONFIG
-from archey.entries.ram import RAM
+from archey.entries.ram import RAM, RAMValue
 from archey.test.entries import HelperMethods
 
 
 class TestRAMEntry(unittest.TestCase):
     """
     Here, we mock the `check_output` call to `free` using all three levels of available ram.
-    In the last test, mock with `/proc/meminfo` file opening during the manual way.
+    In the last test, mock the `/proc/meminfo` (shared) read during the manual way.
     """
 
     @patch(
@@ -31,8 +31,8 @@ Swap:          4095          39        4056
         )
 
     @patch(
-        "archey.entries.ram.open",
-        mock_open(read_data="""\
+        "archey.entries.ram.PseudoFiles.read",
+        Mock(return_value="""\
 MemTotal:        7581000 kB
 MemFree:          716668 kB
 MemAvailable:    3632244 kB
@@ -139,11 +139,7 @@ Swapouts:                               3456015.
         output_mock.reset_mock()
 
         with self.subTest('"Normal" output (green).'):
-            ram_instance_mock.value = {
-                "used": 2043.0,
-                "total": 15658.0,
-                "unit": "MiB",
-            }
+            ram_instance_mock.value = RAMValue(used=2043.0, total=15658.0, unit="MiB")
             ram_instance_mock.options = {
                 "warning_use_percent": 33.3,
                 "danger_use_percent": 66.7,
@@ -158,11 +154,7 @@ Swapouts:                               3456015.
         output_mock.reset_mock()
 
         with self.subTest('"Danger" output (red).'):
-            ram_instance_mock.value = {
-                "used": 7830.0,
-                "total": 15658.0,
-                "unit": "MiB",
-            }
+            ram_instance_mock.value = RAMValue(used=7830.0, total=15658.0, unit="MiB")
             ram_instance_mock.options = {
                 "warning_use_percent": 25,
                 "danger_use_percent": 50,
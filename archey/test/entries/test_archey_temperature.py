@@ -17,7 +17,12 @@ class TestTemperatureEntry(unittest.TestCase, CustomAssertions):
 
     def setUp(self):
         self.temperature_mock = HelperMethods.entry_mock(Temperature)
-        self.temperature_mock._temps = []  # pylint: disable=protected-access
+        # pylint: disable=protected-access
+        self.temperature_mock._temps = []
+        self.temperature_mock._sysfs_sensors = {}
+        self.temperature_mock._samples = {}
+        self.temperature_mock._sources_count = 0
+        # pylint: enable=protected-access
 
     @patch("archey.entries.temperature.run")  # Mock the `sensors` call.
     def test_run_sensors_ok(self, run_mock):
@@ -195,6 +200,175 @@ class TestTemperatureEntry(unittest.TestCase, CustomAssertions):
         self.assertListEmpty(self.temperature_mock._temps)
         # pylint: enable=protected-access
 
+    def test_poll_hwmon_sysfs(self):
+        """Test hwmon sysfs interface walking (with chips and subfeatures filtering)"""
+        with tempfile.TemporaryDirectory() as hwmon_sys_path:
+            # Mock a `/sys/class/hwmon` hierarchy with three chips.
+            for hwmon_name, hwmon_attributes in (
+                (
+                    "hwmon0",
+                    {
+                        "name": "k10temp",
+                        "temp1_input": "42000",
+                        "temp1_label": "Tctl",
+                        "temp2_input": "32000",
+                        "temp2_label": "Tdie",
+                    },
+                ),
+                (
+                    "hwmon1",
+                    {
+                        "name": "acpitz",
+                        "temp1_input": "0",
+                        "temp2_input": "38500",
+                    },
+                ),
+                (
+                    "hwmon2",
+                    {
+                        "name": "nct6775",
+                        "fan1_input": "3386",
+                    },
+                ),
+            ):
+                os.mkdir(os.path.join(hwmon_sys_path, hwmon_name))
+                for attribute_name, attribute_value in hwmon_attributes.items():
+                    with open(
+                        os.path.join(hwmon_sys_path, hwmon_name, attribute_name),
+                        "w",
+                        encoding="ASCII",
+                    ) as f_attribute:
+                        f_attribute.write(attribute_value + "\n")
+
+            # pylint: disable=protected-access
+            with patch("archey.entries.temperature.LINUX_HWMON_SYS_PATH", hwmon_sys_path):
+                with self.subTest("All chips and subfeatures."):
+                    Temperature._poll_hwmon_sysfs(self.temperature_mock)
+                    self.assertListEqual(sorted(self.temperature_mock._temps), [32.0, 38.5, 42.0])
+
+                self.temperature_mock._temps = []
+
+                with self.subTest("Whitelisted chips (exact names)."):
+                    Temperature._poll_hwmon_sysfs(self.temperature_mock, ["k10temp", "nct6775"])
+                    self.assertListEqual(sorted(self.temperature_mock._temps), [32.0, 42.0])
+
+                self.temperature_mock._temps = []
+
+                with self.subTest(
+                    "Whitelisted chips (neither prefixes nor LM-Sensors identifiers)."
+                ):
+                    Temperature._poll_hwmon_sysfs(
+                        self.temperature_mock, ["k10", "k10temp-pci-00c3", "acpitz-acpi-0"]
+                    )
+                    self.assertListEmpty(self.temperature_mock._temps)
+
+                self.temperature_mock._temps = []
+
+                with self.subTest("Whitelisted chips (glob patterns)."):
+                    Temperature._poll_hwmon_sysfs(self.temperature_mock, ["acpi*"])
+                    self.assertListEqual(self.temperature_mock._temps, [38.5])
+
+                self.temperature_mock._temps = []
+
+                with self.subTest("Excluded subfeatures (labels and default names)."):
+                    Temperature._poll_hwmon_sysfs(
+                        self.temperature_mock, excluded_subfeatures=["Tctl", "temp2"]
+                    )
+                    self.assertListEqual(self.temperature_mock._temps, [32.0])
+            # pylint: enable=protected-access
+
+    def test_sampling(self):
+        """Test sysfs sensors sampling, and windowed (per-sensor) values computation"""
+        with tempfile.TemporaryDirectory() as sensors_dir:
+            cpu_sensor_path = os.path.join(sensors_dir, "temp1_input")
+            gpu_sensor_path = os.path.join(sensors_dir, "temp2_input")
+
+            # pylint: disable=protected-access
+            self.temperature_mock._sysfs_sensors = {
+                "coretemp/Package id 0": cpu_sensor_path,
+                "amdgpu/edge": gpu_sensor_path,
+            }
+            self.temperature_mock._samples = {
+                "coretemp/Package id 0": [50.0],
+                "amdgpu/edge": [40.0],
+            }
+            self.temperature_mock._temps = [50.0, 40.0]
+
+            for sensor_path, temp in ((cpu_sensor_path, "60000"), (gpu_sensor_path, "0")):
+                with open(sensor_path, "w", encoding="ASCII") as f_sensor:
+                    f_sensor.write(temp + "\n")
+
+            with patch("archey.entries.temperature.time.sleep") as sleep_mock:
+                Temperature._sample_sysfs_sensors(self.temperature_mock, 2, 0.5)
+
+            sleep_mock.assert_called_with(0.5)
+            self.assertEqual(sleep_mock.call_count, 2)
+
+            # Null temperatures are ignored.
+            self.assertDictEqual(
+                self.temperature_mock._samples,
+                {
+                    "coretemp/Package id 0": [50.0, 60.0, 60.0],
+                    "amdgpu/edge": [40.0],
+                },
+            )
+
+            self.temperature_mock.options = {"sample_count": 3}
+            self.assertEqual(
+                Temperature._compute_value(self.temperature_mock),
+                {
+                    "temperature": 52.5,
+                    "max_temperature": 60.0,
+                    "char_before_unit": " ",
+                    "unit": "C",
+                    "sensors": {
+                        "coretemp/Package id 0": {
+                            "temperature": 56.7,
+                            "max_temperature": 60.0,
+                        },
+                        "amdgpu/edge": {
+                            "temperature": 40.0,
+                            "max_temperature": 40.0,
+                        },
+                    },
+                },
+            )
+            # pylint: enable=protected-access
+
+    @patch("archey.entries.temperature.platform.system", return_value="Linux")
+    @patch("archey.entries.temperature.Temperature._run_vcgencmd")
+    @patch("archey.entries.temperature.Temperature._run_sensors")
+    def test_sampling_in_background(self, _, __, ___):
+        """Check sampling is run in background, and only waited for on `value` access"""
+        with tempfile.TemporaryDirectory() as hwmon_sys_path:
+            os.mkdir(os.path.join(hwmon_sys_path, "hwmon0"))
+            for attribute_name, attribute_value in (("name", "acpitz"), ("temp1_input", "42000")):
+                with open(
+                    os.path.join(hwmon_sys_path, "hwmon0", attribute_name), "w", encoding="ASCII"
+                ) as f_attribute:
+                    f_attribute.write(attribute_value + "\n")
+
+            with patch("archey.entries.temperature.LINUX_HWMON_SYS_PATH", hwmon_sys_path):
+                temperature = Temperature(options={"sample_count": 3, "sample_interval": 0})
+
+                self.assertEqual(
+                    temperature.value,
+                    {
+                        "temperature": 42.0,
+                        "max_temperature": 42.0,
+                        "char_before_unit": " ",
+                        "unit": "C",
+                        "sensors": {
+                            "acpitz/temp1": {"temperature": 42.0, "max_temperature": 42.0},
+                        },
+                    },
+                )
+                self.assertListEqual(
+                    temperature._temps, [42.0, 42.0, 42.0]  # pylint: disable=protected-access
+                )
+                # Samples don't count as input sources.
+                self.assertEqual(temperature._sources_count, 1)  # pylint: disable=protected-access
+
     @patch("archey.entries.temperature.iglob")
     def test_poll_thermal_zones(self, iglob_mock):
         """Tests sensor files handling"""
@@ -347,6 +521,7 @@ class TestTemperatureEntry(unittest.TestCase, CustomAssertions):
 
         # Values --> normal behavior.
         self.temperature_mock._temps = [50.0, 40.0, 50.0]  # pylint: disable=protected-access
+        self.temperature_mock._sources_count = 3  # pylint: disable=protected-access
         self.temperature_mock.value = {
             "temperature": 46.7,
             "max_temperature": 50.0,
@@ -358,6 +533,7 @@ class TestTemperatureEntry(unittest.TestCase, CustomAssertions):
 
         # Only one value --> no maximum.
         self.temperature_mock._temps = [42.8]  # pylint: disable=protected-access
+        self.temperature_mock._sources_count = 1  # pylint: disable=protected-access
         self.temperature_mock.value = {
             "temperature": 42.8,
             "max_temperature": 42.8,
@@ -367,6 +543,17 @@ class TestTemperatureEntry(unittest.TestCase, CustomAssertions):
         Temperature.output(self.temperature_mock, output_mock)
         self.assertEqual(output_mock.append.call_args[0][1], "42.8 C")
 
+        # Several samples of a single sensor --> no maximum either.
+        self.temperature_mock._temps = [42.0, 43.0, 44.0]  # pylint: disable=protected-access
+        self.temperature_mock.value = {
+            "temperature": 43.0,
+            "max_temperature": 44.0,
+            "char_before_unit": " ",
+            "unit": "C",
+        }
+        Temperature.output(self.temperature_mock, output_mock)
+        self.assertEqual(output_mock.append.call_args[0][1], "43.0 C")
+
     def test_convert_to_fahrenheit(self):
         """Simple tests for the `_convert_to_fahrenheit` static method"""
         test_conversion_cases = (
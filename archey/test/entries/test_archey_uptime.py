@@ -3,9 +3,9 @@
 import unittest
 from datetime import timedelta
 from itertools import product
-from unittest.mock import MagicMock, mock_open, patch
+from unittest.mock import MagicMock, Mock, patch
 
-from archey.entries.uptime import Uptime
+from archey.entries.uptime import Uptime, UptimeValue
 from archey.exceptions import ArcheyException
 from archey.test.entries import HelperMethods
 
@@ -14,8 +14,8 @@ class TestUptimeEntry(unittest.TestCase):
     """Test cases for `Uptime` entry module"""
 
     @patch(
-        "archey.entries.uptime.open",
-        mock_open(read_data="90120.75 XXXX.XX\n"),
+        "archey.entries.uptime.PseudoFiles.read",
+        Mock(return_value="90120.75 XXXX.XX\n"),
     )
     def test_proc_file_uptime(self):
         """Test `_proc_file_uptime` static method"""
@@ -194,48 +194,28 @@ class TestUptimeEntry(unittest.TestCase):
         output_mock = MagicMock()
 
         with self.subTest("Output in case of hours and minutes."):
-            uptime_instance_mock.value = {
-                "days": 0,
-                "hours": 2,
-                "minutes": 1,
-                "seconds": 0,
-            }
+            uptime_instance_mock.value = UptimeValue(days=0, hours=2, minutes=1, seconds=0)
             Uptime.output(uptime_instance_mock, output_mock)
             self.assertEqual(output_mock.append.call_args[0][1], "2 hours and 1 minute")
 
         output_mock.reset_mock()
 
         with self.subTest("Output in case of days, hours and minutes."):
-            uptime_instance_mock.value = {
-                "days": 1,
-                "hours": 1,
-                "minutes": 2,
-                "seconds": 0,
-            }
+            uptime_instance_mock.value = UptimeValue(days=1, hours=1, minutes=2, seconds=0)
             Uptime.output(uptime_instance_mock, output_mock)
             self.assertEqual(output_mock.append.call_args[0][1], "1 day, 1 hour and 2 minutes")
 
         output_mock.reset_mock()
 
         with self.subTest("Output in case of days and minutes."):
-            uptime_instance_mock.value = {
-                "days": 3,
-                "hours": 0,
-                "minutes": 3,
-                "seconds": 0,
-            }
+            uptime_instance_mock.value = UptimeValue(days=3, hours=0, minutes=3, seconds=0)
             Uptime.output(uptime_instance_mock, output_mock)
             self.assertEqual(output_mock.append.call_args[0][1], "3 days and 3 minutes")
 
         output_mock.reset_mock()
 
         with self.subTest("Output in case of very early execution."):
-            uptime_instance_mock.value = {
-                "days": 0,
-                "hours": 0,
-                "minutes": 0,
-                "seconds": 0,
-            }
+            uptime_instance_mock.value = UptimeValue(days=0, hours=0, minutes=0, seconds=0)
             Uptime.output(uptime_instance_mock, output_mock)
             self.assertEqual(output_mock.append.call_args[0][1], "< 1 minute")
 
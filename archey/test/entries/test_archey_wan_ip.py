@@ -1,10 +1,14 @@
 """Test module for Archey's public IP address detection module"""
 
+import socket
+import time
 import unittest
 from socket import timeout as SocketTimeoutError
-from subprocess import CalledProcessError, TimeoutExpired
+from tempfile import TemporaryDirectory
+from typing import Optional
 from unittest.mock import MagicMock, Mock, call, patch
 
+from archey.cache import Cache
 from archey.configuration import DEFAULT_CONFIG
 from archey.entries.wan_ip import WanIP
 from archey.test import CustomAssertions
@@ -15,9 +19,13 @@ from archey.test.entries import HelperMethods
     "archey.entries.wan_ip.Environment",
     Mock(DO_NOT_TRACK=False),  # By default, entry won't be disabled.
 )
+@patch(
+    "archey.entries.wan_ip.Cache",
+    Mock(return_value=Mock(get=Mock(return_value=None))),  # By default, cache always misses.
+)
 class TestWanIPEntry(unittest.TestCase, CustomAssertions):
     """
-    Here, we end up mocking calls to `dig` or `urlopen`.
+    Here, we end up mocking DNS queries or HTTP requests.
     """
 
     def setUp(self):
@@ -26,17 +34,20 @@ class TestWanIPEntry(unittest.TestCase, CustomAssertions):
         self.output_mock = MagicMock()
 
     @patch(
-        "archey.entries.wan_ip.check_output",
+        "archey.entries.wan_ip.Network.run_dns_query",
         side_effect=[
-            TimeoutExpired("dig", 1),  # `check_output` call will hard-fail.
-            "0123::4567:89a:dead:beef\n",  # `check_output` will work.
+            None,  # DNS query will hard-fail (timeout).
+            "0123::4567:89a:dead:beef",  # DNS query will work.
         ],
     )
-    @patch("archey.entries.wan_ip.urlopen")
-    def test_ipv4_ko_and_ipv6_ok(self, urlopen_mock, _):
+    @patch("archey.entries.wan_ip.HTTPClient")
+    def test_ipv4_ko_and_ipv6_ok(self, http_client_mock, _):
         """Test fallback on HTTP method only when DNS lookup failed"""
-        # `urlopen` will hard-fail.
-        urlopen_mock.return_value.__enter__.return_value.read.side_effect = SocketTimeoutError(0)
+        # HTTP request will hard-fail.
+        http_response_mock = (
+            http_client_mock.return_value.request.return_value.__enter__.return_value
+        )
+        http_response_mock.read.side_effect = SocketTimeoutError(0)
 
         # IPv4 retrieval failed.
         self.assertFalse(
@@ -50,37 +61,150 @@ class TestWanIPEntry(unittest.TestCase, CustomAssertions):
         )
 
     @patch(
-        "archey.entries.wan_ip.check_output",
+        "archey.entries.wan_ip.Network.run_dns_query",
         side_effect=[
-            "\n",  # `check_output` call will soft-fail.
-            FileNotFoundError("dig"),  # `check_output` call will hard-fail (missing `dig`)
-            CalledProcessError(
-                cmd="dig", returncode=9
-            ),  # `check_output` call will hard-fail (DNS connection error)
+            "",  # DNS query will soft-fail (resolver answered without any address).
+            None,  # DNS query will hard-fail (resolver could not be resolved).
+            None,  # DNS query will hard-fail (DNS connection error).
         ],
     )
-    @patch("archey.entries.wan_ip.urlopen")
-    def test_proper_http_fallback(self, urlopen_mock, _):
+    @patch("archey.entries.wan_ip.HTTPClient")
+    def test_proper_http_fallback(self, http_client_mock, _):
         """Test fallback on HTTP method only when DNS lookup failed"""
-        urlopen_mock.return_value.__enter__.return_value.read.return_value = b"XXX.YY.ZZ.TTT\n"
+        http_response_mock = (
+            http_client_mock.return_value.request.return_value.__enter__.return_value
+        )
+        http_response_mock.status = 200
+        http_response_mock.read.return_value = b"XXX.YY.ZZ.TTT\n"
 
         # HTTP back-end was not called, we trust DNS lookup tool which failed.
         self.assertFalse(
             WanIP._retrieve_ip_address(self.wan_ip_mock, 4),  # pylint: disable=protected-access
         )
 
-        # HTTP method has been called with `dig` missing.
+        # HTTP method has been called with resolver missing.
         self.assertEqual(
             WanIP._retrieve_ip_address(self.wan_ip_mock, 4),  # pylint: disable=protected-access
             "XXX.YY.ZZ.TTT",
         )
 
-        # HTTP method has been called with `dig` unable to connect!
+        # HTTP method has been called with resolver unreachable!
         self.assertEqual(
             WanIP._retrieve_ip_address(self.wan_ip_mock, 4),  # pylint: disable=protected-access
             "XXX.YY.ZZ.TTT",
         )
 
+    def test_both_ip_versions(self):
+        """Check both IPv4 and IPv6 addresses are retrieved (and kept in order)"""
+        with patch.object(
+            WanIP,
+            "_retrieve_ip_address",
+            side_effect=lambda ip_version, _: {4: "XXX.YY.ZZ.TTT", 6: None}[ip_version],
+        ) as retrieve_ip_address_mock:
+            self.assertListEqual(WanIP().value, ["XXX.YY.ZZ.TTT"])
+
+        self.assertSetEqual(
+            {call_args[0][0] for call_args in retrieve_ip_address_mock.call_args_list}, {4, 6}
+        )
+
+    def test_shared_deadline(self):
+        """Check retrievals are bounded by the entry-level deadline"""
+
+        def _retrieve_ip_address(ip_version: int, _) -> Optional[str]:
+            if ip_version == 6:
+                # IPv6 retrieval hangs.
+                time.sleep(5)
+                return "0123::4567:89a:dead:beef"
+
+            return "XXX.YY.ZZ.TTT"
+
+        with patch.object(WanIP, "_retrieve_ip_address", side_effect=_retrieve_ip_address):
+            start_time = time.monotonic()
+            self.assertListEqual(WanIP(options={"timeout": 0.1}).value, ["XXX.YY.ZZ.TTT"])
+            self.assertLess(time.monotonic() - start_time, 1)
+
+    @patch("archey.entries.wan_ip.Network.run_dns_query", return_value=None)
+    @patch("archey.entries.wan_ip.WanIP._run_http_request")
+    def test_capped_timeouts(self, run_http_request_mock, run_dns_query_mock):
+        """Check back-ends timeouts are capped by the deadline"""
+        self.wan_ip_mock.options = {"ipv4": {"dns_timeout": 3, "http_timeout": 3}}
+
+        # Deadline is already over, HTTP request is not even attempted.
+        self.assertIsNone(
+            WanIP._retrieve_ip_address(  # pylint: disable=protected-access
+                self.wan_ip_mock, 4, time.monotonic()
+            )
+        )
+        self.assertLessEqual(run_dns_query_mock.call_args[0][3], 0)
+        run_http_request_mock.assert_not_called()
+
+        WanIP._retrieve_ip_address(  # pylint: disable=protected-access
+            self.wan_ip_mock, 4, time.monotonic() + 2
+        )
+        self.assertLessEqual(run_dns_query_mock.call_args[0][3], 2)
+        self.assertLessEqual(run_http_request_mock.call_args[0][1], 2)
+
+    def test_cache(self):
+        """Check public addresses caching, and its invalidation on network context changes"""
+        default_routes = [("en0", "192.168.1.1")]
+        interfaces_addresses = {
+            "en0": [(socket.AF_INET, socket.inet_pton(socket.AF_INET, "192.168.1.55"))],
+        }
+
+        with TemporaryDirectory() as temp_dir, patch.dict(
+            "os.environ", {"XDG_CACHE_HOME": temp_dir}
+        ), patch("archey.entries.wan_ip.Cache", Cache), patch(
+            "archey.entries.wan_ip.Network.get_default_routes", return_value=default_routes
+        ), patch(
+            "archey.entries.wan_ip.Network.get_interfaces_addresses",
+            return_value=interfaces_addresses,
+        ), patch.object(
+            WanIP, "_retrieve_ip_addresses", return_value=["XXX.YY.ZZ.TTT"]
+        ) as retrieve_ip_addresses_mock:
+            self.assertListEqual(WanIP().value, ["XXX.YY.ZZ.TTT"])
+            self.assertListEqual(WanIP().value, ["XXX.YY.ZZ.TTT"])
+            retrieve_ip_addresses_mock.assert_called_once()
+
+            with self.subTest("Default gateway changed."):
+                default_routes[0] = ("en0", "10.0.0.1")
+                self.assertListEqual(WanIP().value, ["XXX.YY.ZZ.TTT"])
+                self.assertEqual(retrieve_ip_addresses_mock.call_count, 2)
+
+            with self.subTest("Default route interface addresses changed."):
+                interfaces_addresses["en0"].append(
+                    (socket.AF_INET6, socket.inet_pton(socket.AF_INET6, "2001:db8::42"))
+                )
+                self.assertListEqual(WanIP().value, ["XXX.YY.ZZ.TTT"])
+                self.assertEqual(retrieve_ip_addresses_mock.call_count, 3)
+
+            with self.subTest("Cache expired."):
+                self.assertListEqual(WanIP(options={"cache_ttl": 1e-9}).value, ["XXX.YY.ZZ.TTT"])
+                self.assertEqual(retrieve_ip_addresses_mock.call_count, 4)
+
+            with self.subTest("Cache disabled."):
+                self.assertListEqual(WanIP(options={"cache_ttl": False}).value, ["XXX.YY.ZZ.TTT"])
+                self.assertEqual(retrieve_ip_addresses_mock.call_count, 5)
+
+            with self.subTest("Failures are not cached."):
+                retrieve_ip_addresses_mock.return_value = []
+                interfaces_addresses.clear()
+                self.assertListEmpty(WanIP().value)
+                self.assertListEmpty(WanIP().value)
+                self.assertEqual(retrieve_ip_addresses_mock.call_count, 7)
+
+    @patch("archey.entries.wan_ip.HTTPClient")
+    def test_http_error_status(self, http_client_mock):
+        """Check HTTP error responses bodies are not considered as addresses"""
+        http_response_mock = (
+            http_client_mock.return_value.request.return_value.__enter__.return_value
+        )
+        http_response_mock.status = 503
+        http_response_mock.read.return_value = b"Service Unavailable"
+
+        self.assertIsNone(
+            WanIP._run_http_request("https://4.ident.me/", 1)  # pylint: disable=protected-access
+        )
+
     def test_retrieval_disabled(self):
         """Test behavior when both IPv4 and IPv6 retrievals are purposely disabled"""
         self.wan_ip_mock.options = {
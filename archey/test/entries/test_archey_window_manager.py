@@ -30,7 +30,7 @@ Window manager's "showing the desktop" mode: OFF
     )
     def test_wmctrl(self, _, __):
         """Test `wmctrl` output parsing"""
-        self.assertEqual(WindowManager().value["name"], "WINDOW MANAGER")
+        self.assertEqual(WindowManager().value.name, "WINDOW MANAGER")
 
     @patch(
         "archey.entries.window_manager.check_output",
@@ -53,8 +53,8 @@ Window manager's "showing the desktop" mode: OFF
     def test_no_wmctrl_match(self, _, __, ___):
         """Test basic detection based on a (fake) processes list"""
         window_manager = WindowManager()
-        self.assertEqual(window_manager.value["name"], "Awesome")
-        self.assertEqual(window_manager.value["display_server_protocol"], "Wayland")
+        self.assertEqual(window_manager.value.name, "Awesome")
+        self.assertEqual(window_manager.value.display_server_protocol, "Wayland")
 
     @patch(
         "archey.entries.window_manager.check_output",
@@ -78,7 +78,7 @@ Window manager's "showing the desktop" mode: OFF
         output_mock = MagicMock()
         window_manager.output(output_mock)
 
-        self.assertIsNone(window_manager.value["name"])
+        self.assertIsNone(window_manager.value.name)
         self.assertEqual(
             output_mock.append.call_args[0][1], DEFAULT_CONFIG["default_strings"]["not_detected"]
         )
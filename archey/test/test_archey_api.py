@@ -3,9 +3,13 @@
 import json
 import unittest
 from datetime import datetime
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from archey.api import API
+from archey.entries.disk import Disk
+from archey.entries.model import Model
+from archey.entries.ram import RAM, RAMValue
+from archey.entries.temperature import Temperature
 
 
 class TestApi(unittest.TestCase):
@@ -77,3 +81,120 @@ class TestApi(unittest.TestCase):
         )
         # Check the `count` meta-data attribute.
         self.assertEqual(output_json_document["meta"]["count"], 4)
+
+    def test_ndjson_serialization(self):
+        """Check NDJSON entry lines and closing meta-data line"""
+        mocked_entry = Mock(value=RAMValue(used=42, total=64, unit="MiB"))
+        mocked_entry.name = "RAM"
+
+        # Values records are serialized as objects.
+        self.assertDictEqual(
+            json.loads(API.ndjson_entry_serialization(mocked_entry, 0.0123456, 3)),
+            {
+                "entry": "RAM",
+                "value": {"used": 42, "total": 64, "unit": "MiB"},
+                "elapsed_ms": 12.346,
+                "index": 3,
+            },
+        )
+
+        meta_line = API([mocked_entry]).ndjson_meta_serialization()
+        self.assertNotIn("\n", meta_line)
+        meta_document = json.loads(meta_line)
+        self.assertListEqual(list(meta_document), ["meta"])
+        self.assertEqual(meta_document["meta"]["count"], 1)
+
+    def test_msgpack_serialization(self):
+        """Check MessagePack encoding of (streamed) documents"""
+        mocked_entries = [Mock(value=None), Mock(value={"used": 1024, "load": [0.5, -33]})]
+        mocked_record_entry = Mock(value=RAMValue(used=1, total=2, unit="B"))
+        mocked_record_entry.name = "x"
+        mocked_entries[0].name = "Model"
+        mocked_entries[1].name = "RAM"
+
+        with patch.object(API, "_get_meta", return_value={"count": 2}):
+            chunks = list(API(mocked_entries).msgpack_serialization())
+
+        # Document is streamed as multiple chunks.
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(
+            b"".join(chunks),
+            b"\x82"  # map of 2 items
+            b"\xa4data\x82"  # "data" : map of 2 items
+            b"\xa5Model\xc0"  # "Model" : nil
+            b"\xa3RAM\x82"  # "RAM" : map of 2 items
+            b"\xa4used\xcd\x04\x00"  # "used" : uint16
+            b"\xa4load\x92\xcb?\xe0\x00\x00\x00\x00\x00\x00\xd0\xdf"  # "load" : [float64, int8]
+            b"\xa4meta\x81\xa5count\x02",  # "meta" : {"count" : fixint}
+        )
+
+        with self.subTest("Values records."):
+            self.assertIn(
+                b"\xa1x\x83\xa4used\x01\xa5total\x02\xa4unit\xa1B",
+                b"".join(API([mocked_record_entry]).msgpack_serialization()),
+            )
+
+        with self.subTest("Lengths and integers formats."):
+            for value, encoded_value in (
+                ("a" * 32, b"\xd9\x20" + b"a" * 32),
+                (list(range(16)), b"\xdc\x00\x10" + bytes(range(16))),
+                (-32, b"\xe0"),
+                (2**32, b"\xcf\x00\x00\x00\x01\x00\x00\x00\x00"),
+                (-(2**31) - 1, b"\xd3\xff\xff\xff\xff\x7f\xff\xff\xff"),
+            ):
+                mocked_entry = Mock(value=value)
+                mocked_entry.name = "x"
+                self.assertIn(
+                    b"\xa1x" + encoded_value + b"\xa4meta",
+                    b"".join(API([mocked_entry]).msgpack_serialization()),
+                )
+
+    def test_prometheus_serialization(self):
+        """Check numeric entries values are exposed as Prometheus gauges"""
+        ram_entry = Mock(spec=RAM, value=RAMValue(used=512.0, total=1024.0, unit="MiB"))
+        disk_entry = Mock(
+            spec=Disk,
+            value={
+                '/mnt/"data"': {"device_path": "/dev/sdb1", "used_blocks": 1, "total_blocks": 2}
+            },
+        )
+        temperature_entry = Mock(
+            spec=Temperature,
+            value={
+                "temperature": 122.0,
+                "max_temperature": 122.0,
+                "char_before_unit": " ",
+                "unit": "F",
+            },
+        )
+        model_entry = Mock(spec=Model, value="Model")
+        for entry in (ram_entry, disk_entry, temperature_entry, model_entry):
+            entry.name = entry.__class__.__name__
+
+        self.assertEqual(
+            "".join(
+                API(
+                    [model_entry, disk_entry, ram_entry, temperature_entry]
+                ).prometheus_serialization()
+            ),
+            """\
+# HELP archey_ram_used_bytes Used RAM.
+# TYPE archey_ram_used_bytes gauge
+archey_ram_used_bytes{entry="RAM"} 536870912.0
+# HELP archey_ram_total_bytes Total RAM.
+# TYPE archey_ram_total_bytes gauge
+archey_ram_total_bytes{entry="RAM"} 1073741824.0
+# HELP archey_disk_used_bytes Used filesystem space.
+# TYPE archey_disk_used_bytes gauge
+archey_disk_used_bytes{entry="Disk",mountpoint="/mnt/\\"data\\"",device="/dev/sdb1"} 1024
+# HELP archey_disk_total_bytes Filesystem size.
+# TYPE archey_disk_total_bytes gauge
+archey_disk_total_bytes{entry="Disk",mountpoint="/mnt/\\"data\\"",device="/dev/sdb1"} 2048
+# HELP archey_temperature_celsius Average temperature.
+# TYPE archey_temperature_celsius gauge
+archey_temperature_celsius{entry="Temperature"} 50.0
+# HELP archey_temperature_max_celsius Maximum temperature.
+# TYPE archey_temperature_max_celsius gauge
+archey_temperature_max_celsius{entry="Temperature"} 50.0
+""",
+        )
@@ -0,0 +1,80 @@
+"""Test module for `archey.cache`"""
+
+import os
+import unittest
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from archey.cache import Cache
+
+
+class TestCache(unittest.TestCase):
+    """Test cases for the `Cache` (persistent key-value store) class"""
+
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self._temp_dir.cleanup)
+
+        xdg_cache_home_patch = patch.dict("os.environ", {"XDG_CACHE_HOME": self._temp_dir.name})
+        xdg_cache_home_patch.start()
+        self.addCleanup(xdg_cache_home_patch.stop)
+
+    def test_get_set(self):
+        """Check values are persisted (across instances), and bound to their fingerprint"""
+        self.assertIsNone(Cache("test").get("key"))
+
+        Cache("test").set("key", {"answer": 42}, fingerprint=["context", 1])
+        self.assertTrue(os.path.isfile(os.path.join(self._temp_dir.name, "archey4", "test.json")))
+
+        self.assertDictEqual(Cache("test").get("key", fingerprint=["context", 1]), {"answer": 42})
+        self.assertIsNone(Cache("test").get("key", fingerprint=["context", 2]))
+        self.assertIsNone(Cache("test").get("key"))
+
+        # Other stores are independent.
+        self.assertIsNone(Cache("other").get("key", fingerprint=["context", 1]))
+
+    def test_ttl(self):
+        """Check values expire"""
+        Cache("test").set("key", "value")
+
+        self.assertEqual(Cache("test").get("key", ttl=60), "value")
+        with patch("archey.cache.time.time", return_value=0):
+            # Clock went backward, value is considered stale too.
+            self.assertIsNone(Cache("test").get("key", ttl=60))
+        self.assertIsNone(Cache("test").get("key", ttl=0))
+
+    def test_corrupted(self):
+        """Check corrupted (or unwritable) stores are considered empty"""
+        os.makedirs(os.path.join(self._temp_dir.name, "archey4"))
+        with open(
+            os.path.join(self._temp_dir.name, "archey4", "test.json"), "w", encoding="UTF-8"
+        ) as f_cache:
+            f_cache.write("{not JSON")
+
+        self.assertIsNone(Cache("test").get("key"))
+
+        # Value is stored anyway (corrupted document is replaced).
+        Cache("test").set("key", "value")
+        self.assertEqual(Cache("test").get("key"), "value")
+
+        with patch("archey.cache.os.replace", side_effect=PermissionError()):
+            Cache("test").set("key", "new value")
+        self.assertEqual(Cache("test").get("key"), "value")
+
+    def test_write_file(self):
+        """Check files are atomically written, and temporary ones never left behind"""
+        file_path = os.path.join(self._temp_dir.name, "archey4", "sub", "file")
+
+        Cache.write_file(file_path, b"content")
+        with open(file_path, "rb") as f_file:
+            self.assertEqual(f_file.read(), b"content")
+
+        with patch("archey.cache.os.replace", side_effect=PermissionError()):
+            Cache.write_file(file_path, b"new content")
+        self.assertListEqual(os.listdir(os.path.dirname(file_path)), ["file"])
+        with open(file_path, "rb") as f_file:
+            self.assertEqual(f_file.read(), b"content")
+
+
+if __name__ == "__main__":
+    unittest.main()
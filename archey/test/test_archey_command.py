@@ -0,0 +1,131 @@
+"""Test module for `archey.command`"""
+
+import sys
+import unittest
+from subprocess import PIPE, CalledProcessError, TimeoutExpired
+from unittest.mock import patch
+
+from archey import command
+
+
+class TestCommand(unittest.TestCase):
+    """Test cases for the shared sub-processes runner"""
+
+    def test_c_locale_env(self):
+        """Check commands run within the C locale environment, only when told to"""
+        with patch.dict("os.environ", {"LANG": "fr_FR.UTF-8", "ARCHEY_TEST": "1"}):
+            command.get_c_locale_env.cache_clear()
+            try:
+                output = command.check_output(
+                    [sys.executable, "-c", "import os; print(os.environ['LANG'])"],
+                    universal_newlines=True,
+                    c_locale=True,
+                )
+                self.assertEqual(output, "C\n")
+                self.assertEqual(command.get_c_locale_env()["ARCHEY_TEST"], "1")
+                # Other locale settings are left untouched.
+                self.assertNotIn("LC_ALL", command.get_c_locale_env())
+
+                output = command.check_output(
+                    [sys.executable, "-c", "import os; print(os.environ['LANG'])"],
+                    universal_newlines=True,
+                )
+                self.assertEqual(output, "fr_FR.UTF-8\n")
+            finally:
+                command.get_c_locale_env.cache_clear()
+
+    def test_timeout(self):
+        """Check hung commands are killed once timed out"""
+        with self.assertRaises(TimeoutExpired) as context:
+            command.run(
+                [sys.executable, "-c", "import time; time.sleep(30)"],
+                stdout=PIPE,
+                timeout=0.5,
+            )
+
+        self.assertEqual(context.exception.timeout, 0.5)
+        self.assertLess(command.get_commands_metrics()[-1].elapsed, 10)
+        self.assertNotEqual(command.get_commands_metrics()[-1].returncode, 0)
+
+    @patch("archey.command.logging.getLogger")
+    def test_max_output_size(self, get_logger_mock):
+        """Check captured outputs are capped (but entirely drained)"""
+        process = command.run(
+            [sys.executable, "-c", "print('x' * 100000)"],
+            stdout=PIPE,
+            max_output_size=10,
+        )
+
+        self.assertEqual(process.returncode, 0)
+        self.assertEqual(process.stdout, b"x" * 10)
+        self.assertEqual(command.get_commands_metrics()[-1].stdout_size, 100001)
+        get_logger_mock.return_value.warning.assert_called_once()
+
+    @patch("archey.command.Popen")
+    def test_missing_program(self, popen_mock):
+        """Check missing programs are reported without even forking"""
+        with self.assertRaises(FileNotFoundError):
+            command.check_output(["archey-definitely-not-a-program", "--version"])
+
+        popen_mock.assert_not_called()
+
+    def test_check(self):
+        """Check failing commands raise `CalledProcessError` when checked"""
+        failing_command = [sys.executable, "-c", "import sys; sys.exit(3)"]
+
+        self.assertEqual(command.run(failing_command).returncode, 3)
+
+        with self.assertRaises(CalledProcessError) as context:
+            command.check_output(failing_command)
+        self.assertEqual(context.exception.returncode, 3)
+
+    def test_metrics(self):
+        """Check each command run is accounted"""
+        command.check_output(
+            [sys.executable, "-c", "import sys; print('out'); print('error', file=sys.stderr)"],
+            stderr=PIPE,
+        )
+
+        metrics = command.get_commands_metrics()[-1]
+        self.assertIn(sys.executable, metrics.command)
+        self.assertEqual(metrics.returncode, 0)
+        self.assertEqual(metrics.stdout_size, 4)
+        self.assertEqual(metrics.stderr_size, 6)
+        self.assertGreaterEqual(metrics.elapsed, 0)
+
+    def test_universal_newlines(self):
+        """Check outputs are decoded (with newlines translated) on demand"""
+        self.assertEqual(
+            command.check_output(
+                [sys.executable, "-c", "import sys; sys.stdout.buffer.write(b'a\\r\\nb\\rc')"],
+                universal_newlines=True,
+            ),
+            "a\nb\nc",
+        )
+
+    def test_count_output(self):
+        """Check outputs are counted as streams, whatever their size"""
+        self.assertListEqual(
+            command.count_output(
+                [
+                    sys.executable,
+                    "-c",
+                    "print('package install\\n' * 100000 + 'package deinstall\\n' * 10, end='')",
+                ],
+                (b"\n", b"deinstall"),
+                max_output_size=10,
+            ),
+            [100010, 10],
+        )
+
+        # Occurrences spanning two chunks are counted too.
+        patterns_counter = command._PatternsCounter(  # pylint: disable=protected-access
+            (b"\n", b"deinstall")
+        )
+        for chunk in (b"a dein", b"st", b"all\nb de", b"install\n", b"i"):
+            patterns_counter(chunk)
+        self.assertListEqual(patterns_counter.counts, [2, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -202,6 +202,55 @@ class TestConfiguration(unittest.TestCase):
             self.assertEqual(configuration.get("ip_settings")["lan_ip_max_count"], 4)
             self.assertTrue(configuration.get("temperature")["use_fahrenheit"])
 
+    def test_compiled_cache(self):
+        """Test compiled configuration snapshot reuse, and its invalidation"""
+        with tempfile.TemporaryDirectory() as temp_dir, patch.dict(
+            "os.environ", {"XDG_CACHE_HOME": temp_dir}
+        ):
+            config_file = os.path.join(temp_dir, "config.json")
+            with open(config_file, mode="w", encoding="UTF-8") as f_config:
+                f_config.write('{"entries_color": "0;31"}')
+
+            configuration = Configuration(config_path=config_file, compiled_cache=True)
+            self.assertEqual(configuration.get("entries_color"), "0;31")
+            self.assertTrue(os.path.isfile(os.path.join(temp_dir, "archey4", "config.marshal")))
+
+            with self.subTest("Snapshot reused."), patch.dict(
+                "archey.singleton.Singleton._instances", clear=True
+            ), patch.object(
+                Configuration, "_load_configuration"
+            ) as load_configuration_mock, patch.object(
+                Configuration, "_validate_configuration"
+            ) as validate_configuration_mock:
+                configuration = Configuration(config_path=config_file, compiled_cache=True)
+
+                load_configuration_mock.assert_not_called()
+                validate_configuration_mock.assert_not_called()
+                self.assertEqual(configuration.get("entries_color"), "0;31")
+                self.assertListEqual(list(configuration.get_config_files_info()), [config_file])
+
+            with self.subTest("Source file modified."), patch.dict(
+                "archey.singleton.Singleton._instances", clear=True
+            ):
+                with open(config_file, mode="w", encoding="UTF-8") as f_config:
+                    f_config.write('{"entries_color": "0;32;1"}')
+
+                configuration = Configuration(config_path=config_file, compiled_cache=True)
+                self.assertEqual(configuration.get("entries_color"), "0;32;1")
+
+            with self.subTest("Invalid configuration is not snapshotted."):
+                with open(config_file, mode="w", encoding="UTF-8") as f_config:
+                    f_config.write('{"entries_color": "invalid"}')
+
+                for _ in range(2):
+                    with patch.dict("archey.singleton.Singleton._instances", clear=True), patch(
+                        "archey.configuration.logging.warning"
+                    ) as warning_mock:
+                        Configuration(config_path=config_file, compiled_cache=True)
+
+                    # Validation warning is emitted each time.
+                    warning_mock.assert_called_once()
+
     def test__iter__(self):
         """Very simple method checking our `__iter__` implementation"""
         configuration = Configuration()
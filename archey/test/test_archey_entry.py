@@ -1,9 +1,11 @@
 """Test module for `archey.entry`"""
 
+import pickle
 import typing
 import unittest
 from abc import ABC
 
+from archey.entries.ram import RAM, RAMValue
 from archey.entry import Entry
 
 
@@ -56,6 +58,25 @@ class TestEntry(unittest.TestCase):
         self.assertEqual(simple_entry.value, "est")
         self.assertTrue(simple_entry)
 
+    def test_entry_pickling(self):
+        """Check entries may be pickled (as plain data) and restored"""
+        simple_entry = pickle.loads(pickle.dumps(_SimpleEntry("T", "est", {"foo": "bar"})))
+        self.assertEqual(simple_entry.name, "T")
+        self.assertEqual(simple_entry.value, "est")
+        self.assertDictEqual(simple_entry.options, {"foo": "bar"})
+        self.assertEqual(simple_entry._logger.name, __name__)  # pylint: disable=protected-access
+
+    def test_entry_from_value(self):
+        """Check entries rebuilt from values, which are validated against their record schema"""
+        simple_entry = _SimpleEntry.from_value("T", "est")
+        self.assertEqual(simple_entry.name, "T")
+        self.assertEqual(simple_entry.value, "est")
+
+        ram_entry = RAM.from_value("RAM", {"used": 1, "total": 2.0, "unit": "MiB"})
+        self.assertEqual(ram_entry.value, RAMValue(used=1, total=2.0, unit="MiB"))
+
+        self.assertRaises(TypeError, RAM.from_value, "RAM", {"used": "1", "total": 2, "unit": ""})
+
     def test_entry_output_overriding(self):
         """Check `Entry.output` public method overriding"""
         simple_entry = _SimpleEntry("is this", "ordered")
@@ -0,0 +1,136 @@
+"""Test module for `archey.http_client`"""
+
+import gzip
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from unittest.mock import Mock, patch
+
+from archey.http_client import HTTPClient
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Serve a few (test) endpoints"""
+        self.server.client_addresses.add(self.client_address)  # type: ignore[attr-defined]
+
+        if self.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "/ip")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        if self.path == "/not-modified" and self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("ETag", '"v1"')
+            self.end_headers()
+            return
+
+        if self.path == "/close":
+            # Server closes connection, without telling client it would.
+            self.close_connection = True
+
+        body = b"203.0.113.42\n"
+        self.send_response(200)
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_, **__):
+        pass
+
+
+# To avoid edge-case issues due to singleton, we automatically reset internal `_instances`.
+@patch.dict(
+    "archey.singleton.Singleton._instances",
+    clear=True,
+)
+@patch("archey.http_client.getproxies", Mock(return_value={}))
+class TestHTTPClient(unittest.TestCase):
+    """Test cases for the `HTTPClient` (singleton) class, against a local HTTP server"""
+
+    def setUp(self):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _RequestHandler)
+        self._server.client_addresses = set()  # type: ignore[attr-defined]
+        Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+        ).start()
+        self.addCleanup(self._server.server_close)
+        self.addCleanup(self._server.shutdown)
+
+        self._base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def test_keep_alive_and_gzip(self):
+        """Check connection is reused across requests, and responses are decompressed"""
+        for _ in range(3):
+            with HTTPClient().request(f"{self._base_url}/ip", 1) as http_response:
+                self.assertEqual(http_response.status, 200)
+                self.assertEqual(http_response.read(), b"203.0.113.42\n")
+
+        # A single connection has been established.
+        self.assertEqual(len(self._server.client_addresses), 1)  # type: ignore[attr-defined]
+
+    def test_chunked_read(self):
+        """Check gzip-compressed responses may be read by chunks"""
+        with HTTPClient().request(f"{self._base_url}/ip", 1) as http_response:
+            self.assertEqual(b"".join(iter(lambda: http_response.read(4), b"")), b"203.0.113.42\n")
+
+    def test_redirect(self):
+        """Check redirections are followed (on the same connection)"""
+        with HTTPClient().request(f"{self._base_url}/redirect", 1) as http_response:
+            self.assertEqual(http_response.status, 200)
+            self.assertEqual(http_response.read(), b"203.0.113.42\n")
+
+        self.assertEqual(len(self._server.client_addresses), 1)  # type: ignore[attr-defined]
+
+    def test_conditional_request(self):
+        """Check custom headers are sent, and non-2xx responses yielded"""
+        with HTTPClient().request(
+            f"{self._base_url}/not-modified", 1, {"If-None-Match": '"v1"'}
+        ) as http_response:
+            self.assertEqual(http_response.status, 304)
+            self.assertEqual(http_response.headers.get("ETag"), '"v1"')
+
+        # Connection is reused even if the (empty) body has not been read.
+        with HTTPClient().request(f"{self._base_url}/ip", 1) as http_response:
+            self.assertEqual(http_response.read(), b"203.0.113.42\n")
+
+        self.assertEqual(len(self._server.client_addresses), 1)  # type: ignore[attr-defined]
+
+    def test_server_closed_connection(self):
+        """Check request is retried on a new connection when an idle one has been closed"""
+        with HTTPClient().request(f"{self._base_url}/close", 1) as http_response:
+            http_response.read()
+
+        with HTTPClient().request(f"{self._base_url}/ip", 1) as http_response:
+            self.assertEqual(http_response.read(), b"203.0.113.42\n")
+
+        self.assertEqual(len(self._server.client_addresses), 2)  # type: ignore[attr-defined]
+
+    def test_proxied_request(self):
+        """Check requests going through a proxy are delegated to `urllib`"""
+        with patch(
+            "archey.http_client.getproxies", return_value={"http": "http://proxy:3128"}
+        ), patch("archey.http_client.urlopen") as urlopen_mock:
+            urlopen_mock.return_value.__enter__.return_value = urlopen_mock.return_value
+            urlopen_mock.return_value.code = 200
+            urlopen_mock.return_value.headers = {}
+            urlopen_mock.return_value.read.return_value = b"203.0.113.42\n"
+
+            with HTTPClient().request(f"{self._base_url}/ip", 1) as http_response:
+                self.assertEqual(http_response.status, 200)
+                self.assertEqual(http_response.read(), b"203.0.113.42\n")
+
+        self.assertEqual(urlopen_mock.call_args[1]["timeout"], 1)
+        self.assertFalse(self._server.client_addresses)  # type: ignore[attr-defined]
+
+
+if __name__ == "__main__":
+    unittest.main()
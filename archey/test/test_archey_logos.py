@@ -1,12 +1,22 @@
 """Test module for `archey.logos`"""
 
+import os
 import pkgutil
 import unittest
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 from archey import logos
 from archey.colors import Style
 from archey.distributions import Distributions
-from archey.logos import get_logo_width, lazy_load_logo_module
+from archey.logos import (
+    LOGOS_BUNDLE_PATH,
+    get_logo_width,
+    lazy_load_logo_module,
+    load_logo,
+    pack_logos,
+    render_logo,
+)
 
 
 class TestLogos(unittest.TestCase):
@@ -106,3 +116,50 @@ class TestLogos(unittest.TestCase):
             ),
             11,
         )
+
+    def test_render_logo(self):
+        """Test `logos.render_logo` behavior"""
+        self.assertTupleEqual(
+            render_logo(("{c[0]}  {{ {c[1]}", "{c[1]}    {c[0]}"), ("<0>", "<1>")),
+            (("<0>  { <1>", "<1>    <0>"), 4),
+        )
+
+    def test_logos_bundle_sync(self):
+        """Check logos bundle is up to date with logos modules (see `logos.pack_logos`)"""
+        with TemporaryDirectory() as temp_dir:
+            bundle_path = os.path.join(temp_dir, "logos.bundle")
+            pack_logos(bundle_path)
+
+            with open(bundle_path, "rb") as f_bundle, open(LOGOS_BUNDLE_PATH, "rb") as f_expected:
+                self.assertEqual(
+                    f_bundle.read(),
+                    f_expected.read(),
+                    msg="Logos bundle is outdated, please run `logos.pack_logos`",
+                )
+
+    def test_load_logo(self):
+        """Check logos read from bundle expose the same attributes as their modules"""
+        for logo_module_info in pkgutil.iter_modules(logos.__path__):
+            logo_module = lazy_load_logo_module(logo_module_info.name)
+            logo = load_logo(logo_module_info.name)
+
+            for attribute in dir(logo_module):
+                if attribute.startswith("LOGO"):
+                    self.assertListEqual(
+                        getattr(logo, attribute),
+                        getattr(logo_module, attribute),
+                        msg=f"[{logo_module_info.name}] `{attribute}` differs",
+                    )
+                elif attribute.startswith("COLORS"):
+                    # `Colors8Bit` objects don't compare, but their values do.
+                    self.assertListEqual(
+                        [(type(color), color.value) for color in getattr(logo, attribute)],
+                        [(type(color), color.value) for color in getattr(logo_module, attribute)],
+                        msg=f"[{logo_module_info.name}] `{attribute}` differs",
+                    )
+
+        # Logo module is loaded when bundle is missing.
+        load_logo.cache_clear()
+        with patch("archey.logos.LOGOS_BUNDLE_PATH", os.devnull + ".missing"):
+            self.assertIs(load_logo("debian"), lazy_load_logo_module("debian"))
+        load_logo.cache_clear()
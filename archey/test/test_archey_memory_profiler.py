@@ -0,0 +1,56 @@
+"""Test module for `archey.memory_profiler`"""
+
+import tracemalloc
+import unittest
+from io import StringIO
+from unittest.mock import MagicMock, Mock, patch
+
+from archey.memory_profiler import MemoryProfiler
+
+
+class TestMemoryProfiler(unittest.TestCase):
+    """Test cases for the entries memory profiler"""
+
+    def tearDown(self):
+        tracemalloc.stop()
+
+    def test_report(self):
+        """Check allocations are reported per completed entry"""
+        on_entry_completed_mock = Mock()
+
+        memory_profiler = MemoryProfiler()
+        on_entry_completed = memory_profiler.track(on_entry_completed_mock)
+
+        entry = MagicMock()
+        entry.name = "Allocator"
+        entry.value = [bytearray(1024) for _ in range(64)]
+        on_entry_completed(0, entry, 0.5)
+
+        on_entry_completed_mock.assert_called_once_with(0, entry, 0.5)
+
+        stream = StringIO()
+        memory_profiler.report(stream)
+        self.assertFalse(tracemalloc.is_tracing())
+
+        report = stream.getvalue()
+        self.assertIn("Peak traced memory:", report)
+        self.assertIn("Peak RSS:", report)
+        self.assertIn("Allocator: +", report)
+        self.assertIn("test_archey_memory_profiler.py", report)
+
+    def test_get_peak_rss(self):
+        """Check peak resident set sizes are expressed in bytes"""
+        with patch("archey.memory_profiler.resource") as resource_mock, patch(
+            "archey.memory_profiler.platform.system", return_value="Linux"
+        ):
+            resource_mock.getrusage.return_value.ru_maxrss = 2048
+            self.assertTupleEqual(
+                MemoryProfiler.get_peak_rss(), (2048 * 1024, 2048 * 1024)  # type: ignore[arg-type]
+            )
+
+        with patch("archey.memory_profiler.resource", None):
+            self.assertIsNone(MemoryProfiler.get_peak_rss())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,259 @@
+"""Test module for `archey.network`"""
+
+import socket
+import struct
+import time
+import unittest
+from contextlib import contextmanager
+from threading import Event, Thread
+from typing import Callable, Iterator, List
+from unittest.mock import MagicMock, patch
+
+from archey.network import (
+    DNS_CLASS_IN,
+    DNS_FLAG_QR,
+    DNS_HEADER,
+    DNS_QUESTION,
+    DNS_RR,
+    DNS_TYPE_A,
+    IFA_ADDRESS,
+    IFA_LABEL,
+    IFA_LOCAL,
+    IFADDRMSG,
+    NLMSG_DONE,
+    NLMSG_ERROR,
+    NLMSGHDR,
+    RTATTR,
+    RTM_NEWADDR,
+    Network,
+)
+from archey.test import CustomAssertions
+
+
+def _rtattr(rta_type: int, payload: bytes) -> bytes:
+    rtattr = RTATTR.pack(RTATTR.size + len(payload), rta_type) + payload
+    # Pad attribute on 4 bytes.
+    return rtattr + b"\0" * (-len(rtattr) % 4)
+
+
+def _nlmsg(msg_type: int, payload: bytes) -> bytes:
+    return NLMSGHDR.pack(NLMSGHDR.size + len(payload), msg_type, 0x2, 1, 0) + payload
+
+
+def _rtm_newaddr(family: int, if_index: int, *rtattrs: bytes) -> bytes:
+    return _nlmsg(RTM_NEWADDR, IFADDRMSG.pack(family, 24, 0, 0, if_index) + b"".join(rtattrs))
+
+
+@contextmanager
+def _dns_stub_server(responder: Callable[[bytes], List[bytes]]) -> Iterator[int]:
+    """Run a local (one-shot) UDP DNS server answering with `responder` datagrams"""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as server_socket:
+        server_socket.bind(("127.0.0.1", 0))
+
+        def _serve() -> None:
+            query, client_address = server_socket.recvfrom(512)
+            for datagram in responder(query):
+                server_socket.sendto(datagram, client_address)
+
+        server_thread = Thread(target=_serve, daemon=True)
+        server_thread.start()
+
+        yield server_socket.getsockname()[1]
+
+
+def _dns_response(query: bytes, *answers: bytes, query_id=None) -> bytes:
+    """Build a DNS response to `query`, with (pre-built) answer records"""
+    (original_id,) = struct.unpack_from("!H", query)
+    return (
+        DNS_HEADER.pack(
+            original_id if query_id is None else query_id, DNS_FLAG_QR, 1, len(answers), 0, 0
+        )
+        + query[DNS_HEADER.size :]
+        + b"".join(answers)
+    )
+
+
+class TestNetwork(unittest.TestCase, CustomAssertions):
+    """Test cases for `Network` (rtnetlink) logic"""
+
+    def _mock_netlink_socket(self, socket_mock: MagicMock, *datagrams: bytes) -> MagicMock:
+        netlink_socket_mock = socket_mock.return_value.__enter__.return_value
+        netlink_socket_mock.recv.side_effect = list(datagrams)
+        return netlink_socket_mock
+
+    @patch("archey.network.socket.if_indextoname", return_value="eth0")
+    @patch("archey.network.socket.socket")
+    def test_get_interfaces_addresses(self, socket_mock, if_indextoname_mock):
+        """Check RTM_GETADDR dump parsing, across multiple datagrams"""
+        netlink_socket_mock = self._mock_netlink_socket(
+            socket_mock,
+            # First datagram (IPv4).
+            _rtm_newaddr(
+                socket.AF_INET,
+                2,
+                _rtattr(IFA_ADDRESS, socket.inet_pton(socket.AF_INET, "10.8.0.1")),
+                _rtattr(IFA_LOCAL, socket.inet_pton(socket.AF_INET, "10.8.0.2")),
+                _rtattr(IFA_LABEL, b"tun0\0"),
+            )
+            + _rtm_newaddr(
+                socket.AF_INET,
+                1,
+                _rtattr(IFA_ADDRESS, socket.inet_pton(socket.AF_INET, "127.0.0.1")),
+                _rtattr(IFA_LABEL, b"lo\0"),
+            ),
+            # Second datagram (IPv6, without labels) and end of dump.
+            _rtm_newaddr(
+                socket.AF_INET6,
+                3,
+                _rtattr(IFA_ADDRESS, socket.inet_pton(socket.AF_INET6, "fe80::1")),
+            )
+            + _nlmsg(NLMSG_DONE, struct.pack("=i", 0)),
+        )
+
+        self.assertDictEqual(
+            Network.get_interfaces_addresses(),
+            {
+                "lo": [(socket.AF_INET, socket.inet_pton(socket.AF_INET, "127.0.0.1"))],
+                # Local address is preferred over peer one.
+                "tun0": [(socket.AF_INET, socket.inet_pton(socket.AF_INET, "10.8.0.2"))],
+                "eth0": [(socket.AF_INET6, socket.inet_pton(socket.AF_INET6, "fe80::1"))],
+            },
+        )
+
+        # A single request has been sent, and only unlabelled interface name has been resolved.
+        netlink_socket_mock.sendall.assert_called_once()
+        if_indextoname_mock.assert_called_once_with(3)
+
+    @patch("archey.network.socket.socket")
+    def test_get_interfaces_addresses_error(self, socket_mock):
+        """Check rtnetlink errors are propagated as `OSError`"""
+        self._mock_netlink_socket(socket_mock, _nlmsg(NLMSG_ERROR, struct.pack("=i", -13)))
+
+        with self.assertRaises(OSError) as os_error:
+            Network.get_interfaces_addresses()
+
+        self.assertEqual(os_error.exception.errno, 13)
+
+    @patch("archey.network.socket")
+    def test_get_interfaces_addresses_unavailable(self, socket_mock):
+        """Check `OSError` is raised when rtnetlink is not available"""
+        del socket_mock.AF_NETLINK
+
+        self.assertRaises(OSError, Network.get_interfaces_addresses)
+        socket_mock.socket.assert_not_called()
+
+    @patch(
+        "archey.network.PseudoFiles.read",
+        side_effect={
+            "/proc/net/route": """\
+Iface\tDestination\tGateway \tFlags\tRefCnt\tUse\tMetric\tMask\t\tMTU\tWindow\tIRTT
+wlo1\t00000000\t0101A8C0\t0003\t0\t0\t600\t00000000\t0\t0\t0
+en0\t00000000\t0100000A\t0003\t0\t0\t100\t00000000\t0\t0\t0
+en0\t0000000A\t00000000\t0001\t0\t0\t100\t00FFFFFF\t0\t0\t0
+""",
+            "/proc/net/ipv6_route": """\
+fe800000000000000000000000000000 40 00000000000000000000000000000000 00 \
+00000000000000000000000000000000 00000100 00000001 00000000 00000001     en0
+00000000000000000000000000000000 00 00000000000000000000000000000000 00 \
+fe800000000000000000000000000001 00000400 00000001 00000000 00000003     wg0
+00000000000000000000000000000000 00 00000000000000000000000000000000 00 \
+00000000000000000000000000000000 ffffffff 00000001 00000000 00200200       lo
+""",
+        }.get,
+    )
+    def test_get_default_routes(self, _):
+        """Check default routes parsing (IPv4 first, by ascending metric)"""
+        self.assertListEqual(
+            Network.get_default_routes(),
+            [("en0", "10.0.0.1"), ("wlo1", "192.168.1.1"), ("wg0", "fe80::1")],
+        )
+        self.assertListEqual(Network.get_default_route_interfaces(), ["en0", "wlo1", "wg0"])
+
+    @patch("archey.network.PseudoFiles.read", side_effect=FileNotFoundError())
+    def test_get_default_route_interfaces_unavailable(self, _):
+        """Check an empty list is returned when kernel routing tables are not available"""
+        self.assertListEmpty(Network.get_default_route_interfaces())
+
+    def test_run_dns_query(self):
+        """Check in-process DNS resolution against a local stub server"""
+
+        def _responder(query: bytes) -> List[bytes]:
+            # Check the question section of our query.
+            self.assertTrue(query[DNS_HEADER.size :].startswith(b"\x04myip\x07opendns\x03com\x00"))
+            self.assertEqual(
+                DNS_QUESTION.unpack_from(query, len(query) - DNS_QUESTION.size),
+                (DNS_TYPE_A, DNS_CLASS_IN),
+            )
+
+            return [
+                # This one is not an answer to our query (ID mismatch), and will be ignored.
+                _dns_response(
+                    query,
+                    b"\xc0\x0c" + DNS_RR.pack(DNS_TYPE_A, DNS_CLASS_IN, 0, 4) + bytes(4),
+                    query_id=(struct.unpack_from("!H", query)[0] + 1) & 0xFFFF,
+                ),
+                # A CNAME record (skipped), followed by the expected address (compressed names).
+                _dns_response(
+                    query,
+                    b"\xc0\x0c" + DNS_RR.pack(5, DNS_CLASS_IN, 0, 2) + b"\xc0\x0c",
+                    b"\xc0\x0c"
+                    + DNS_RR.pack(DNS_TYPE_A, DNS_CLASS_IN, 0, 4)
+                    + socket.inet_pton(socket.AF_INET, "203.0.113.42"),
+                ),
+            ]
+
+        with _dns_stub_server(_responder) as port:
+            self.assertEqual(
+                Network.run_dns_query("myip.opendns.com", "127.0.0.1", 4, 1, resolver_port=port),
+                "203.0.113.42",
+            )
+
+        with self.subTest("Answer without any address."):
+            with _dns_stub_server(lambda query: [_dns_response(query)]) as port:
+                self.assertEqual(
+                    Network.run_dns_query(
+                        "myip.opendns.com", "127.0.0.1", 4, 1, resolver_port=port
+                    ),
+                    "",
+                )
+
+        with self.subTest("No answer (timeout)."):
+            with _dns_stub_server(lambda _: []) as port:
+                self.assertIsNone(
+                    Network.run_dns_query(
+                        "myip.opendns.com", "127.0.0.1", 4, 0.1, resolver_port=port
+                    )
+                )
+
+    @patch("archey.network.socket.getaddrinfo", side_effect=socket.gaierror())
+    def test_run_dns_query_unknown_resolver(self, _):
+        """Check DNS query fails when resolver name could not be resolved"""
+        self.assertIsNone(Network.run_dns_query("myip.opendns.com", "resolver.invalid", 6, 1))
+
+    def test_run_dns_query_slow_resolver_lookup(self):
+        """Check resolver name lookup is bound by DNS query timeout"""
+        lookup_event = Event()
+
+        def _getaddrinfo(*args):
+            # Only the (blocking) host name lookup hangs, numeric one fails straight away.
+            if len(args) > 4:
+                raise socket.gaierror()
+            lookup_event.wait(5)
+            return [(socket.AF_INET, socket.SOCK_DGRAM, 0, "", ("127.0.0.1", 53))]
+
+        with patch("archey.network.socket.getaddrinfo", side_effect=_getaddrinfo):
+            start = time.monotonic()
+            self.assertIsNone(Network.run_dns_query("myip.opendns.com", "resolver.example", 4, 0.1))
+            self.assertLess(time.monotonic() - start, 2)
+        lookup_event.set()
+
+    @patch("archey.network.socket.socket")
+    def test_run_dns_query_invalid_name(self, socket_mock):
+        """Check invalid query names are rejected before any exchange"""
+        self.assertIsNone(Network.run_dns_query(f"{'a' * 64}.example", "127.0.0.1", 4, 1))
+        self.assertIsNone(Network.run_dns_query("a..example", "127.0.0.1", 4, 1))
+        socket_mock.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
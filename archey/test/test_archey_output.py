@@ -3,6 +3,7 @@
 import json
 import unittest
 from collections import namedtuple
+from tempfile import TemporaryDirectory
 from unittest.mock import Mock, patch
 
 from archey.colors import Colors
@@ -33,7 +34,7 @@ class TestOutput(unittest.TestCase):
         return_value=Distributions.DEBIAN,  # Make Debian being selected.
     )
     @patch(
-        "archey.output.lazy_load_logo_module",
+        "archey.output.load_logo",
         return_value=Mock(COLORS=["COLOR_0"]),
     )
     @HelperMethods.patch_clean_configuration(configuration={"honor_ansi_color": False})
@@ -128,7 +129,7 @@ class TestOutput(unittest.TestCase):
     )
     @patch("archey.output.Distributions.get_ansi_color", return_value=None)
     @patch(
-        "archey.output.lazy_load_logo_module",
+        "archey.output.load_logo",
         return_value=Mock(
             COLORS=["FAKE_COLOR"],
             LOGO=[
@@ -402,7 +403,7 @@ FAKE_COLOR    22\x1b[0m\
     )
     @patch("archey.output.Distributions.get_ansi_color", return_value=None)
     @patch(
-        "archey.output.lazy_load_logo_module",
+        "archey.output.load_logo",
         return_value=Mock(
             COLORS=[Colors.RED_BRIGHT, Colors.RED_NORMAL],
             LOGO=[
@@ -444,15 +445,36 @@ O    \x1b[0;31m\x1b[0m...\x1b[0m\
         # Check that `print` has been called only once.
         self.assertTrue(print_mock.assert_called_once)
 
+    @patch(
+        "archey.output.Distributions.get_local",
+        return_value=Distributions.DEBIAN,  # Make Debian being selected.
+    )
+    @patch("archey.output.Distributions.get_ansi_color", return_value=None)
+    @patch("archey.output.print", return_value=None)  # Let's nastily mute class' outputs.
+    def test_logo_cache(self, print_mock, _, __):
+        """Check rendered logos are persisted, and reused without loading logo module"""
+        with TemporaryDirectory() as temp_dir, patch.dict(
+            "os.environ", {"XDG_CACHE_HOME": temp_dir}
+        ):
+            Output(logo_cache=True).output()
+
+            with patch("archey.output.load_logo") as load_logo_mock:
+                Output(logo_cache=True).output()
+                load_logo_mock.assert_not_called()
+
+        # Both outputs are identical.
+        self.assertEqual(print_mock.call_count, 2)
+        self.assertEqual(print_mock.call_args_list[0], print_mock.call_args_list[1])
+
     @patch("archey.output.Distributions.get_local")
-    @patch("archey.output.lazy_load_logo_module")
+    @patch("archey.output.load_logo")
     @patch("archey.output.Distributions.get_ansi_color", return_value=None)
-    def test_preferred_distribution(self, _, lazy_load_logo_module_mock, get_local_mock):
+    def test_preferred_distribution(self, _, load_logo_mock, get_local_mock):
         """Simple test checking behavior when `preferred_distribution` is passed at instantiation"""
         Output(preferred_distribution="rhel")
 
-        # Check `lazy_load_logo_module` has been called with RHEL distribution.
-        lazy_load_logo_module_mock.assert_called_with(Distributions.RHEL.value)
+        # Check `load_logo` has been called with RHEL distribution.
+        load_logo_mock.assert_called_with(Distributions.RHEL.value)
         # Check `Distributions.get_local` method has not been called at all.
         self.assertFalse(get_local_mock.called)
 
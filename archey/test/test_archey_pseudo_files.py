@@ -0,0 +1,53 @@
+"""Test module for `archey.pseudo_files`"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import mock_open, patch
+
+from archey.pseudo_files import PseudoFiles
+
+
+# To avoid edge-case issues due to singleton, we automatically reset internal `_instances`.
+# This is done at the class-level.
+@patch.dict(
+    "archey.singleton.Singleton._instances",
+    clear=True,
+)
+class TestPseudoFiles(unittest.TestCase):
+    """
+    Test cases for the `PseudoFiles` (singleton) class.
+    To work around the singleton, we reset the internal `_instances` dictionary.
+    """
+
+    def test_read_once(self):
+        """Check files are read from disk only once, whatever the number of consumers"""
+        with patch("archey.pseudo_files.open", mock_open(read_data="cpu info\n")) as open_mock:
+            self.assertEqual(PseudoFiles().read("/proc/cpuinfo"), "cpu info\n")
+            self.assertEqual(PseudoFiles().read("/proc/cpuinfo"), "cpu info\n")
+
+            open_mock.assert_called_once_with("/proc/cpuinfo", encoding="UTF-8")
+
+            # Another path is read independently.
+            self.assertEqual(PseudoFiles().read("/proc/meminfo"), "cpu info\n")
+            self.assertEqual(open_mock.call_count, 2)
+
+    def test_read_once_concurrently(self):
+        """Check concurrent consumers of the same file share a single read"""
+        with patch("archey.pseudo_files.open", mock_open(read_data="42.0 1337.0\n")) as open_mock:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                contents = list(executor.map(PseudoFiles().read, ["/proc/uptime"] * 32))
+
+        self.assertListEqual(contents, ["42.0 1337.0\n"] * 32)
+        open_mock.assert_called_once()
+
+    def test_read_error(self):
+        """Check reading errors are snapshotted and re-raised to each consumer"""
+        with patch("archey.pseudo_files.open", side_effect=PermissionError()) as open_mock:
+            self.assertRaises(PermissionError, PseudoFiles().read, "/proc/cpuinfo")
+            self.assertRaises(PermissionError, PseudoFiles().read, "/proc/cpuinfo")
+
+            open_mock.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
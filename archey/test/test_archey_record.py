@@ -0,0 +1,62 @@
+"""Test module for `archey.record`"""
+
+import pickle
+import unittest
+from typing import Optional
+
+from archey.record import Record
+
+
+class _DummyRecord(Record):
+    """Dummy record, for testing purposes"""
+
+    __slots__ = ("count", "ratio", "label")
+
+    count: int
+    ratio: float
+    label: Optional[str]
+
+
+class TestRecord(unittest.TestCase):
+    """Test cases for entries values records"""
+
+    def test_record(self):
+        """Check records construction, comparison and conversions"""
+        record = _DummyRecord(1, ratio=0.5, label="x")
+
+        self.assertFalse(hasattr(record, "__dict__"))
+        self.assertTupleEqual(tuple(record), (1, 0.5, "x"))
+        self.assertDictEqual(record.as_dict(), {"count": 1, "ratio": 0.5, "label": "x"})
+        self.assertEqual(record, _DummyRecord(1, 0.5, "x"))
+        self.assertNotEqual(record, _DummyRecord(2, 0.5, "x"))
+        self.assertNotEqual(record, (1, 0.5, "x"))
+        self.assertEqual(repr(record), "_DummyRecord(count=1, ratio=0.5, label='x')")
+        self.assertEqual(pickle.loads(pickle.dumps(record)), record)
+
+        self.assertRaises(KeyError, _DummyRecord, 1, 0.5)
+        self.assertRaises(TypeError, _DummyRecord, 1, 0.5, "x", "y")
+        self.assertRaises(TypeError, _DummyRecord, 1, 0.5, "x", unknown=True)
+
+    def test_from_dict(self):
+        """Check records are validated against their schema on load"""
+        self.assertEqual(
+            _DummyRecord.from_dict({"count": 1, "ratio": 1, "label": "x"}),
+            _DummyRecord(1, 1, "x"),
+        )
+
+        self.assertEqual(
+            _DummyRecord.from_dict({"count": 1, "ratio": 1.0, "label": None}),
+            _DummyRecord(1, 1.0, None),
+        )
+
+        self.assertRaises(KeyError, _DummyRecord.from_dict, {"count": 1, "ratio": 1.0})
+        self.assertRaises(
+            TypeError, _DummyRecord.from_dict, {"count": 1, "ratio": None, "label": "x"}
+        )
+        self.assertRaises(
+            TypeError, _DummyRecord.from_dict, {"count": "1", "ratio": 1.0, "label": "x"}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+"""Test module for `archey.render`"""
+
+import unittest
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+from archey.entries.cpu import CPU
+from archey.entries.temperature import Temperature
+from archey.render import Renderer, iter_documents
+from archey.test.entries import HelperMethods
+
+DOCUMENT = {
+    "data": {
+        "Processor": [{"Intel(R) Core(TM) i7-4790K CPU @ 4.00GHz": 8}],
+        "Temperature": {
+            "temperature": 42.5,
+            "max_temperature": 50.0,
+            "char_before_unit": " ",
+            "unit": "C",
+        },
+        "Weather": "Sunny",
+    },
+    "meta": {"version": [4, 15, 0, 0], "count": 3, "distro": "debian"},
+}
+
+
+class TestRender(unittest.TestCase):
+    """Test cases for the batch rendering of captured documents"""
+
+    def test_iter_documents(self):
+        """Check single (indented) documents and NDJSON streams are both read"""
+        self.assertListEqual(
+            list(iter_documents(StringIO('\n{\n  "data": {}\n}\n'))),
+            [{"data": {}}],
+        )
+        self.assertListEqual(
+            list(iter_documents(StringIO('{"data": {"a": 1}}\n{"data": {"b": 2}}\n\n'))),
+            [{"data": {"a": 1}}, {"data": {"b": 2}}],
+        )
+        self.assertListEqual(list(iter_documents(StringIO(""))), [])
+
+        with self.assertRaises(ValueError):
+            list(iter_documents(StringIO('{"data": {}}\n{"data": ')))
+
+        with self.subTest("NDJSON entries lines."):
+            self.assertListEqual(
+                list(
+                    iter_documents(
+                        StringIO(
+                            '{"entry": "A", "value": 1, "elapsed_ms": 0.1}\n'
+                            '{"entry": "B", "value": null, "elapsed_ms": 0.2}\n'
+                            '{"meta": {"distro": "debian"}}\n'
+                            '{"entry": "C", "value": "c", "elapsed_ms": 0.3}\n'
+                        )
+                    )
+                ),
+                [
+                    {"data": {"A": 1, "B": None}, "meta": {"distro": "debian"}},
+                    # Interrupted stream.
+                    {"data": {"C": "c"}},
+                ],
+            )
+
+        with self.subTest("NDJSON entries lines in completion order."):
+            (document,) = iter_documents(
+                StringIO(
+                    '{"entry": "B", "value": 2, "elapsed_ms": 0.1, "index": 1}\n'
+                    '{"entry": "X", "value": 0, "elapsed_ms": 0.1}\n'
+                    '{"entry": "C", "value": 3, "elapsed_ms": 0.2, "index": 2}\n'
+                    '{"entry": "A", "value": 1, "elapsed_ms": 0.3, "index": 0}\n'
+                    '{"meta": {}}\n'
+                )
+            )
+            # Entries are put back in configured order (lines without index last).
+            self.assertListEqual(list(document["data"]), ["A", "B", "C", "X"])
+
+        with self.subTest("Streamed documents."):
+            stream = iter(['{"data": {"a": 1}}\n', "{\n", '  "data": {}\n', "}\n"])
+            documents = iter_documents(stream)  # type: ignore[arg-type]
+            # First document is yielded before the next ones are read.
+            self.assertDictEqual(next(documents), {"data": {"a": 1}})
+            self.assertEqual(next(stream), "{\n")
+
+    @HelperMethods.patch_clean_configuration
+    @patch("archey.render.Output")
+    def test_render(self, output_mock):
+        """Check entries are rebuilt from their values, with their configured options"""
+        with patch(
+            "archey.render.Configuration",
+            return_value=MagicMock(
+                get=MagicMock(
+                    return_value=[
+                        {"type": "CPU", "name": "Processor", "one_line": True},
+                        {"type": "RAM", "disabled": True},
+                    ]
+                )
+            ),
+        ):
+            renderer = Renderer(preferred_logo_style="retro")
+
+        renderer.render(DOCUMENT)
+
+        output_mock.assert_called_once_with(
+            preferred_logo_style="retro", preferred_distribution="debian"
+        )
+        output_mock.return_value.output.assert_called_once()
+
+        cpu, temperature, weather = [
+            call_args[0][0] for call_args in output_mock.return_value.add_entry.call_args_list
+        ]
+
+        self.assertIsInstance(cpu, CPU)
+        self.assertEqual(cpu.name, "Processor")
+        self.assertDictEqual(cpu.options, {"one_line": True})
+        self.assertListEqual(cpu.value, [{"Intel(R) Core(TM) i7-4790K CPU @ 4.00GHz": 8}])
+
+        self.assertIsInstance(temperature, Temperature)
+        temperature_output_mock = MagicMock()
+        temperature.output(temperature_output_mock)
+        temperature_output_mock.append.assert_called_once_with(
+            "Temperature", "42.5 C (Max. 50.0 C)"
+        )
+
+        # Unknown entries are output as is.
+        self.assertEqual(weather.name, "Weather")
+        self.assertEqual(weather.value, "Sunny")
+
+        with self.subTest("Unknown distribution."):
+            output_mock.reset_mock()
+            renderer.render({"data": {}, "meta": {"distro": "unknown-distro"}})
+            output_mock.assert_called_once_with(
+                preferred_logo_style="retro", preferred_distribution="linux"
+            )
+
+        with self.subTest("Document without data."), patch(
+            "archey.render.logging.warning"
+        ) as warning_mock:
+            output_mock.reset_mock()
+            renderer.render({"meta": {"distro": "debian"}})
+            output_mock.assert_not_called()
+            warning_mock.assert_called_once()
+
+        with self.subTest("Preferred distribution."):
+            output_mock.reset_mock()
+            Renderer(preferred_distribution="arch").render(DOCUMENT)
+            output_mock.assert_called_once_with(
+                preferred_logo_style=None, preferred_distribution="arch"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
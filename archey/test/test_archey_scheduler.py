@@ -0,0 +1,253 @@
+"""Test module for `archey.scheduler`"""
+
+import os
+import sys
+import typing
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from tempfile import TemporaryDirectory
+from typing import List
+from unittest.mock import Mock, PropertyMock, mock_open, patch
+
+from archey.entry import Entry
+from archey.scheduler import (
+    DISTRIBUTION_PREREQUISITE,
+    PROCESSES_PREREQUISITE,
+    Entries,
+    instantiate_entry,
+    plan_entries,
+    run_entries,
+)
+
+
+class TestArcheyMain(unittest.TestCase):
+    """Test cases for the entries planning stage"""
+
+    def test_plan_entries(self):
+        """Check disabled and invalid entries are dropped, and prerequisites gathered"""
+        available_entries: List[dict] = [
+            {"type": "User"},
+            {"type": "CPU", "name": "Processor", "one_line": False},
+            {"type": "WindowManager", "disabled": True},
+            {"type": "Unknown"},
+            {"name": "Untyped"},
+            {"type": "RAM", "disabled": False},
+        ]
+
+        with patch("archey.scheduler.logging.warning") as warning_mock:
+            planned_entries, prerequisites = plan_entries(available_entries)
+
+        self.assertListEqual(
+            planned_entries,
+            [
+                (Entries.User, {}),
+                (Entries.CPU, {"name": "Processor", "one_line": False}),
+                (Entries.RAM, {}),
+            ],
+        )
+        self.assertSetEqual(
+            prerequisites, {DISTRIBUTION_PREREQUISITE, "/proc/cpuinfo", "/proc/meminfo"}
+        )
+        self.assertNotIn(PROCESSES_PREREQUISITE, prerequisites)
+        self.assertEqual(warning_mock.call_count, 2)
+
+        # Configuration has been left untouched.
+        self.assertDictEqual(available_entries[2], {"type": "WindowManager", "disabled": True})
+
+    def test_entry_class(self):
+        """Check entry classes are only imported on demand"""
+        with patch.dict(sys.modules):
+            sys.modules.pop("archey.entries.shell", None)
+
+            entry_class = Entries.Shell.entry_class
+            self.assertEqual(entry_class.__name__, "Shell")
+            self.assertIn("archey.entries.shell", sys.modules)
+
+    def test_entries_classes(self):
+        """Check every member resolves to an actual `Entry` class"""
+        for entry_type in Entries:
+            with self.subTest(entry_type.name):
+                self.assertTrue(callable(entry_type.entry_class))
+
+    def test_instantiate_entry(self):
+        """Check entry durations don't account their module import"""
+        clock = [0.0]
+
+        def _import_entry_class():
+            clock[0] += 10
+
+            def _entry_class(name, options):
+                clock[0] += 1
+                return Mock(name=name, options=options)
+
+            return _entry_class
+
+        with patch.object(
+            Entries, "entry_class", new_callable=PropertyMock, side_effect=_import_entry_class
+        ), patch("archey.scheduler.time.monotonic", side_effect=lambda: clock[0]):
+            entry_instance, duration = instantiate_entry(
+                Entries.Shell, {"name": "Shell", "executor": "process"}
+            )
+
+        self.assertIsNotNone(entry_instance)
+        self.assertEqual(duration, 1)
+
+    def test_run_entries(self):
+        """Check slowest entries are started first, whereas planned order is kept"""
+        started_entries = []
+
+        def _entry_class(name, options):
+            started_entries.append(name)
+            self.assertDictEqual(options, {})
+            return name
+
+        with TemporaryDirectory() as temp_dir, patch.dict(
+            "os.environ", {"XDG_CACHE_HOME": temp_dir}
+        ), patch("archey.scheduler.warm_up") as warm_up_mock, patch.object(
+            Entries, "entry_class", new_callable=PropertyMock, return_value=_entry_class
+        ), ThreadPoolExecutor(
+            max_workers=1
+        ) as executor:
+            with self.subTest("Cost hints."):
+                entries_instances = run_entries(
+                    [
+                        (Entries.User, {"name": "user"}),
+                        (Entries.WAN_IP, {"name": "wan_ip"}),
+                        (Entries.CPU, {"name": "cpu"}),
+                    ],
+                    set(Entries.CPU.prerequisites),
+                    executor,
+                )
+                self.assertListEqual(started_entries, ["wan_ip", "user", "cpu"])
+                self.assertListEqual(entries_instances, ["user", "wan_ip", "cpu"])
+                self.assertEqual(warm_up_mock.call_count, len(Entries.CPU.prerequisites))
+                self.assertTrue(os.path.isfile(os.path.join(temp_dir, "archey4", "entries.json")))
+
+            started_entries.clear()
+
+            with self.subTest("Recorded durations."), patch(
+                "archey.scheduler.Cache.get", return_value={"User:user": 2, "WAN_IP:wan_ip": 1}
+            ):
+                run_entries(
+                    [
+                        (Entries.WAN_IP, {"name": "wan_ip"}),
+                        (Entries.User, {"name": "user"}),
+                    ],
+                    set(),
+                    executor,
+                )
+                self.assertListEqual(started_entries, ["user", "wan_ip"])
+
+            started_entries.clear()
+
+            with self.subTest("Completion callback."):
+                on_entry_completed_mock = Mock()
+                run_entries(
+                    [
+                        (Entries.User, {"name": "user"}),
+                        (Entries.WAN_IP, {"name": "wan_ip"}),
+                    ],
+                    set(),
+                    executor,
+                    on_entry_completed=on_entry_completed_mock,
+                )
+                # Entries are notified (once each, along with their planned index) as they complete.
+                self.assertCountEqual(
+                    [call_args[0][:2] for call_args in on_entry_completed_mock.call_args_list],
+                    [(0, "user"), (1, "wan_ip")],
+                )
+                self.assertIsInstance(on_entry_completed_mock.call_args[0][2], float)
+
+            started_entries.clear()
+
+            with self.subTest("Sequential loading."):
+                on_entry_completed_mock = Mock()
+                run_entries(
+                    [
+                        (Entries.User, {"name": "user"}),
+                        (Entries.WAN_IP, {"name": "wan_ip"}),
+                    ],
+                    set(),
+                    on_entry_completed=on_entry_completed_mock,
+                )
+                self.assertListEqual(started_entries, ["user", "wan_ip"])
+                self.assertListEqual(
+                    [call_args[0][:2] for call_args in on_entry_completed_mock.call_args_list],
+                    [(0, "user"), (1, "wan_ip")],
+                )
+
+    def test_process_executor(self):
+        """Check entries hinted to run in worker processes come back as plain entries"""
+        with TemporaryDirectory() as temp_dir, patch.dict(
+            "os.environ", {"XDG_CACHE_HOME": temp_dir}
+        ), ThreadPoolExecutor(max_workers=1) as executor, ProcessPoolExecutor(
+            max_workers=1
+        ) as process_executor:
+            entries_instances = run_entries(
+                [
+                    (Entries.User, {"executor": "process"}),
+                    (Entries.Hostname, {"executor": "thread"}),
+                ],
+                set(),
+                executor,
+                process_executor,
+            )
+
+        user_entry, hostname_entry = typing.cast(List[Entry], entries_instances)
+        self.assertEqual(user_entry.__class__.__name__, "User")
+        self.assertEqual(user_entry.value, Entries.User.entry_class().value)
+        self.assertNotIn("executor", user_entry.options)
+        self.assertEqual(hostname_entry.__class__.__name__, "Hostname")
+
+    def test_static_facts(self):
+        """Check static facts are detected once per boot, along with their prerequisites"""
+        with TemporaryDirectory() as temp_dir, patch.dict(
+            "os.environ", {"XDG_CACHE_HOME": temp_dir}
+        ), patch("archey.static_facts.open", mock_open(read_data="boot-1\n")), patch(
+            "archey.scheduler.warm_up"
+        ) as warm_up_mock:
+            entries_instances = run_entries(
+                [
+                    (Entries.CPU, {"name": "Processor", "one_line": True}),
+                    (Entries.Hostname, {"executor": "thread"}),
+                ],
+                set(Entries.CPU.prerequisites),
+            )
+            self.assertEqual(warm_up_mock.call_count, len(Entries.CPU.prerequisites))
+            cpu_entry, hostname_entry = typing.cast(List[Entry], entries_instances)
+
+            warm_up_mock.reset_mock()
+            on_entry_completed_mock = Mock()
+            with patch.object(
+                Entries.CPU.entry_class, "__init__", side_effect=AssertionError
+            ), patch.object(Entries.Hostname.entry_class, "__init__", side_effect=AssertionError):
+                entries_instances = run_entries(
+                    [
+                        (Entries.CPU, {"name": "Processor", "one_line": True}),
+                        (Entries.Hostname, {}),
+                    ],
+                    set(Entries.CPU.prerequisites),
+                    on_entry_completed=on_entry_completed_mock,
+                )
+            warm_up_mock.assert_not_called()
+            self.assertEqual(on_entry_completed_mock.call_count, 2)
+
+            rebuilt_cpu_entry, rebuilt_hostname_entry = typing.cast(List[Entry], entries_instances)
+            self.assertIsInstance(rebuilt_cpu_entry, Entries.CPU.entry_class)
+            self.assertEqual(rebuilt_cpu_entry.name, cpu_entry.name)
+            self.assertEqual(rebuilt_cpu_entry.value, cpu_entry.value)
+            self.assertDictEqual(rebuilt_cpu_entry.options, {"one_line": True})
+            self.assertEqual(rebuilt_hostname_entry.value, hostname_entry.value)
+
+            with self.subTest("New boot."), patch(
+                "archey.static_facts.open", mock_open(read_data="boot-2\n")
+            ), patch.object(
+                Entries.Hostname.entry_class, "__init__", side_effect=AssertionError
+            ), self.assertRaises(
+                AssertionError
+            ):
+                run_entries([(Entries.Hostname, {})], set())
+
+
+if __name__ == "__main__":
+    unittest.main()
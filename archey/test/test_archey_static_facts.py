@@ -0,0 +1,102 @@
+"""Test module for `archey.static_facts`"""
+
+import os
+import unittest
+from tempfile import TemporaryDirectory
+from unittest.mock import MagicMock, mock_open, patch
+
+from archey.entries.distro import DistroValue
+from archey.static_facts import StaticFacts
+
+
+class TestStaticFacts(unittest.TestCase):
+    """Test cases for the boot-scoped static facts snapshot"""
+
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self._temp_dir.cleanup)
+
+        environ_patcher = patch.dict("os.environ", {"XDG_CACHE_HOME": self._temp_dir.name})
+        environ_patcher.start()
+        self.addCleanup(environ_patcher.stop)
+
+        release_patcher = patch("archey.static_facts.platform.release", return_value="6.1.0")
+        release_patcher.start()
+        self.addCleanup(release_patcher.stop)
+
+        configuration_patcher = patch(
+            "archey.static_facts.Configuration",
+            return_value=MagicMock(get=MagicMock(return_value={"not_detected": "Not detected"})),
+        )
+        configuration_patcher.start()
+        self.addCleanup(configuration_patcher.stop)
+
+    def test_snapshot(self):
+        """Check facts are loaded back during the same boot only"""
+        with patch("archey.static_facts.open", mock_open(read_data="boot-1\n")):
+            static_facts = StaticFacts()
+            self.assertIsNone(static_facts.get("CPU:{}"))
+            static_facts.set("CPU:{}", [{"CPU": 4}])
+            static_facts.save()
+
+        snapshot_path = os.path.join(self._temp_dir.name, "archey4", "static_facts.json")
+        self.assertTrue(os.path.isfile(snapshot_path))
+
+        with self.subTest("Same boot."), patch(
+            "archey.static_facts.open", mock_open(read_data="boot-1\n")
+        ):
+            static_facts = StaticFacts()
+            self.assertListEqual(static_facts.get("CPU:{}"), [{"CPU": 4}])
+
+            # Unchanged snapshot is not written again.
+            with patch("archey.static_facts.Cache.set") as cache_set_mock:
+                static_facts.set("CPU:{}", [{"CPU": 4}])
+                static_facts.save()
+            cache_set_mock.assert_not_called()
+
+        with self.subTest("New boot."), patch(
+            "archey.static_facts.open", mock_open(read_data="boot-2\n")
+        ):
+            self.assertIsNone(StaticFacts().get("CPU:{}"))
+
+        with self.subTest("Kernel update."), patch(
+            "archey.static_facts.open", mock_open(read_data="boot-1\n")
+        ), patch("archey.static_facts.platform.release", return_value="6.1.1"):
+            self.assertIsNone(StaticFacts().get("CPU:{}"))
+
+    def test_record(self):
+        """Check records are snapshotted as dictionaries"""
+        with patch("archey.static_facts.open", mock_open(read_data="boot-1\n")):
+            static_facts = StaticFacts()
+            static_facts.set("Distro:{}", DistroValue("Debian", "x86_64"))
+            static_facts.save()
+
+            self.assertDictEqual(
+                StaticFacts().get("Distro:{}"), {"name": "Debian", "arch": "x86_64"}
+            )
+
+    def test_no_boot_id(self):
+        """Check nothing is loaded nor stored when boot identifier is not available"""
+        with patch("archey.static_facts.open", side_effect=FileNotFoundError()):
+            static_facts = StaticFacts()
+            static_facts.set("CPU:{}", [{"CPU": 4}])
+            static_facts.save()
+
+        self.assertFalse(
+            os.path.exists(os.path.join(self._temp_dir.name, "archey4", "static_facts.json"))
+        )
+
+    def test_get_key(self):
+        """Check keys don't depend on options order"""
+        self.assertEqual(
+            StaticFacts.get_key("GPU", {"one_line": False, "max_count": 2}),
+            StaticFacts.get_key("GPU", {"max_count": 2, "one_line": False}),
+        )
+        self.assertNotEqual(
+            StaticFacts.get_key("GPU", {"max_count": 2}),
+            StaticFacts.get_key("GPU", {"max_count": 3}),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
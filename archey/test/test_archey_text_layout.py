@@ -0,0 +1,53 @@
+"""Test module for `archey.text_layout`"""
+
+import unittest
+from unittest.mock import patch
+
+from archey.text_layout import get_display_width, truncate_line
+
+
+@patch(
+    "archey.colors.Style.should_color_output",
+    return_value=True,  # By default, colors won't be disabled.
+)
+class TestTextLayout(unittest.TestCase):
+    """Test cases for text measurement and truncation"""
+
+    def test_get_display_width(self, _):
+        """Check wide and zero-width characters are properly measured"""
+        self.assertEqual(get_display_width(""), 0)
+        self.assertEqual(get_display_width("Archey"), 6)
+        self.assertEqual(get_display_width("界界"), 4)  # CJK ideographs.
+        self.assertEqual(get_display_width("\U0001f600"), 2)  # Emoji.
+        self.assertEqual(get_display_width("é"), 1)  # Combining acute accent.
+        self.assertEqual(get_display_width("\u200b"), 0)  # Zero-width space.
+        self.assertEqual(get_display_width(" CPU"), 5)  # Nerd Font icon.
+
+    def test_truncate_line(self, _):
+        """Check lines are cut on words boundaries, according to their display width"""
+        self.assertEqual(truncate_line("short", 8), "short")
+        self.assertEqual(truncate_line("adjusted", 8), "adjusted")
+        self.assertEqual(truncate_line("two words", 8), "two\x1b[0m...")
+        self.assertEqual(truncate_line("looooooong", 8), "\x1b[0m...")
+        self.assertEqual(truncate_line("a looooooong", 8), "a\x1b[0m...")
+        self.assertEqual(truncate_line("界界 界界", 8), "界界\x1b[0m...")
+        self.assertEqual(truncate_line("界界界界", 7), "\x1b[0m...")
+
+    def test_truncate_line_colors(self, _):
+        """Check color escape codes are kept (only) before the cut"""
+        self.assertEqual(
+            truncate_line("\x1b[0;31mshort\x1b[0m", 8),
+            "\x1b[0;31mshort\x1b[0m",
+        )
+        self.assertEqual(
+            truncate_line("\x1b[0;31mtwo\x1b[0m \x1b[0;32mwords\x1b[0m", 8),
+            "\x1b[0;31mtwo\x1b[0m\x1b[0m...",
+        )
+        self.assertEqual(
+            truncate_line("\x1b[0;31mlooooooong\x1b[0m", 8),
+            "\x1b[0;31m\x1b[0m...",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+Text layout utilities.
+Lines are measured in terminal columns (and not in code points), so wide characters (e.g. East
+  Asian ideographs or emojis) and zero-width ones (e.g. combining marks) don't skew truncation.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import List, Tuple
+
+from archey.colors import ANSI_ECMA_REGEXP, Colors
+
+# Same separators as `textwrap` (when hyphens are not considered as word boundaries).
+CHUNKS_SEPARATOR_REGEXP = re.compile(r"([\t\n\x0b\x0c\r ]+)")
+
+
+@lru_cache(maxsize=None)
+def get_char_width(char: str) -> int:
+    """
+    Return the number of terminal columns taken by `char`.
+    Nerd Font icons live in Unicode Private Use Areas, whose (ambiguous) width is considered as a
+      single column, as most terminals render them.
+    """
+    if unicodedata.category(char) in ("Mn", "Me", "Cf"):
+        return 0
+
+    if unicodedata.east_asian_width(char) in ("W", "F"):
+        return 2
+
+    return 1
+
+
+def get_display_width(text: str) -> int:
+    """Return the number of terminal columns taken by `text` (which must not contain escapes)"""
+    # ASCII fast path (`str.isascii` is not available before Python 3.7).
+    try:
+        text.encode("ascii")
+    except UnicodeEncodeError:
+        return sum(map(get_char_width, text))
+
+    return len(text)
+
+
+def _get_kept_length(text: str, width: int, placeholder_width: int) -> int:
+    """
+    Return the number of `text` characters to keep before a placeholder, so the result fits into
+      `width` columns. As `textwrap.shorten` (or `TextWrapper` with a single line) would, text is
+      cut on word boundaries, unless a word is too long to fit on its own.
+    """
+    # Kept chunks, as (length, width, is_word) tuples.
+    kept_chunks: List[Tuple[int, int, bool]] = []
+    kept_width = 0
+
+    for chunk in filter(None, CHUNKS_SEPARATOR_REGEXP.split(text)):
+        chunk_width = get_display_width(chunk)
+        if kept_width + chunk_width <= width:
+            kept_chunks.append((len(chunk), chunk_width, bool(chunk.strip())))
+            kept_width += chunk_width
+            continue
+
+        # Too long chunk is broken on its own.
+        if chunk_width > width:
+            partial_length, partial_width = 0, 0
+            for char in chunk:
+                char_width = get_char_width(char)
+                if kept_width + partial_width + char_width > width:
+                    break
+                partial_length += 1
+                partial_width += char_width
+
+            kept_chunks.append(
+                (partial_length, partial_width, bool(chunk[:partial_length].strip()))
+            )
+            kept_width += partial_width
+
+        break
+
+    # Make room for the placeholder, which must follow a word.
+    while kept_chunks:  # pylint: disable=while-used
+        _, chunk_width, is_word = kept_chunks[-1]
+        if is_word and kept_width + placeholder_width <= width:
+            break
+
+        kept_chunks.pop()
+        kept_width -= chunk_width
+
+    return sum(chunk_length for chunk_length, _, _ in kept_chunks)
+
+
+def truncate_line(line: str, width: int, placeholder: str = "...") -> str:
+    """
+    Return `line` shortened with `placeholder` when it doesn't fit into `width` terminal columns.
+    `line` is tokenized once into text and ANSI/ECMA-48 color escape codes, so colors preceding
+      the cut are preserved. Colors are reset before `placeholder`.
+    """
+    # Plain text parts and escape codes (along with their offsets in plain text).
+    text_parts = []
+    escape_codes: List[Tuple[int, str]] = []
+    text_length = 0
+    last_index = 0
+    for color_match in ANSI_ECMA_REGEXP.finditer(line):
+        text_part = line[last_index : color_match.start()]
+        text_parts.append(text_part)
+        text_length += len(text_part)
+        escape_codes.append((text_length, color_match.group()))
+        last_index = color_match.end()
+    text_parts.append(line[last_index:])
+
+    text = "".join(text_parts)
+    if get_display_width(text) <= width:
+        return line
+
+    kept_length = _get_kept_length(text, width, get_display_width(placeholder))
+
+    # Emit kept text, with escape codes re-inserted at their positions.
+    line_parts = []
+    text_index = 0
+    for text_offset, escape_code in escape_codes:
+        if text_offset > kept_length:
+            break
+
+        line_parts.append(text[text_index:text_offset])
+        line_parts.append(escape_code)
+        text_index = text_offset
+    line_parts.append(text[text_index:kept_length])
+
+    line_parts.append(f"{Colors.CLEAR}{placeholder}")
+
+    return "".join(line_parts)
@@ -81,6 +81,8 @@ mkdir -p etc/apparmor.d/ && \
 # Prepare and compress the manual page.
 sed -e "s/\${DATE}/$(date +'%B %Y')/1" -e "s/\${VERSION}/${VERSION}/1" archey.1 | \
 	gzip -c --best - > "${DIST_OUTPUT}/archey.1.gz"
+# (Re-)pack logos modules into a single bundle file.
+python3 -c 'from archey.logos import pack_logos; pack_logos()'
 # Clean any previous Setuptools build output.
 python3 setup.py -q clean --all 2> /dev/null
 
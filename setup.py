@@ -22,11 +22,11 @@ setup(
     author_email='samuel+archey@forestier.app',
     license='GPLv3',
     packages=find_packages(exclude=['archey.test*']),
-    package_data={'archey': ['py.typed']},
+    package_data={'archey': ['py.typed', 'logos/logos.bundle']},
     python_requires='>=3.6',
     install_requires=[
         'distro~=1.3',
-        'netifaces~=0.10'
+        'netifaces~=0.10; platform_system != "Linux"'
     ],
     entry_points={
         'console_scripts': [